@@ -0,0 +1,326 @@
+"""
+Offline micro-benchmarks for the PR gate evaluator.
+
+    python -m benchmarks.evaluator_bench --output artifacts/bench/evaluator.json
+    python -m benchmarks.evaluator_bench --quick --compare artifacts/bench/evaluator.json
+
+Corpora are generated from a seed, so two runs on different commits time the
+same inputs. Each benchmark reports ns/op (min and median over repeats) and
+the peak traced allocation of one call.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from supervisor.pr_gate import evaluator
+from supervisor.pr_gate.body_scanner import PrTextScan
+from supervisor.pr_gate.compiled_policy import compile_policy
+from supervisor.pr_gate.evaluator import GateInputs, evaluate_pr, iter_evaluate_prs
+from supervisor.pr_gate.locker import LockIndex
+from supervisor.pr_gate.policy_loader import load_policy
+from supervisor.testing import generate_dataset
+
+
+DEFAULT_POLICY_PATH = "governance/policy/pr-governance.v0.2.yaml"
+SCHEMA_VERSION = 1
+SUBSYSTEMS = ["supervisor/", "executor/", "governance/policy/", "docs/", "tests/", "tools/", "scripts/"]
+REVIEWERS = ["alice", "bob", "carol", "dave", "erin", "ci-bot", "release-bot"]
+CHECKS = ["lint", "unit-tests", "smoke-test", "determinism-check"]
+
+# name: (full size, --quick size)
+CORPUS_SIZES = {
+    "open_prs": (1000, 100),
+    "files": (10_000, 1000),
+    "reviews": (500, 50),
+    "body_bytes": (100_000, 10_000),
+    "commits": (1000, 100),
+    "statuses": (2000, 200),
+}
+
+
+def _inputs_for(data, number):
+    pr = data.pulls[number]
+    return {
+        "commits": data.pull_commits[number],
+        "files": [f["filename"] for f in data.pull_files[number]],
+        "reviews": data.pull_reviews[number],
+        "statuses": data.statuses[pr["head"]["sha"]],
+    }
+
+
+def _large_body(rng, size):
+    lines = [
+        "### Summary",
+        "Synthetic benchmark body #1",
+        "### Scope",
+        "supervisor/ and executor/ changes",
+        "### Locks",
+        "LOCK:supervisor/",
+        "### Tests",
+        "python -m pytest -q",
+        "### Rollback",
+        "git revert the merge commit",
+        "### Risks",
+        "synthetic",
+    ]
+    length = sum(len(line) + 1 for line in lines)
+    while length < size:
+        kind = rng.random()
+        if kind < 0.05:
+            line = f"### Notes {rng.randrange(1000)}"
+        elif kind < 0.1:
+            line = f"See #{rng.randrange(1, 5000)} and LOCK:{rng.choice(SUBSYSTEMS)}"
+        else:
+            line = " ".join(f"word{rng.randrange(10_000)}" for _ in range(rng.randrange(4, 16)))
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines)
+
+
+def build_corpora(seed=0, quick=False):
+    """Returns the named synthetic corpora; the same seed yields the same data."""
+    size = {name: sizes[1] if quick else sizes[0] for name, sizes in CORPUS_SIZES.items()}
+    rng = random.Random(seed)
+    data = generate_dataset(seed=seed, pulls=size["open_prs"], issues=0)
+    open_prs = list(data.pulls.values())
+    base_pr = data.pulls[1]
+    base_inputs = _inputs_for(data, 1)
+
+    files = sorted(
+        {f"{rng.choice(SUBSYSTEMS)}pkg_{rng.randrange(200)}/file_{idx}.py" for idx in range(size["files"])}
+    )
+    reviews = [
+        {
+            "user": {"login": rng.choice(REVIEWERS), "type": "Bot" if rng.random() < 0.2 else "User"},
+            "state": rng.choice(["APPROVED", "APPROVED", "COMMENTED", "REQUEST_CHANGES"]),
+            "submitted_at": f"2026-01-{1 + idx % 28:02d}T{idx % 24:02d}:00:{idx % 60:02d}Z",
+        }
+        for idx in range(size["reviews"])
+    ]
+    commits = []
+    for idx in range(size["commits"]):
+        commit = {"sha": f"{idx:040x}"}
+        if rng.random() < 0.5:
+            commit["commit"] = {"verification": {"verified": rng.random() < 0.95}}
+        else:
+            commit.update(signature_verifiable=True, signature_verified=rng.random() < 0.95)
+        commits.append(commit)
+    statuses = [
+        {"context": rng.choice(CHECKS + [f"extra-{n}" for n in range(50)]), "state": rng.choice(["success", "failure", "pending"])}
+        for _ in range(size["statuses"])
+    ]
+    body = _large_body(rng, size["body_bytes"])
+
+    def pr_with(**inputs):
+        merged = dict(base_inputs)
+        merged.update(inputs)
+        return merged
+
+    return {
+        "open_prs": {"data": data, "open_prs": open_prs},
+        "typical_pr": {"pr": base_pr, "inputs": base_inputs, "open_prs": open_prs},
+        "large_files": {"pr": base_pr, "inputs": pr_with(files=files), "open_prs": open_prs},
+        "many_reviews": {"pr": base_pr, "inputs": pr_with(reviews=reviews), "open_prs": open_prs},
+        "large_body": {"pr": dict(base_pr, body=body), "inputs": base_inputs, "open_prs": open_prs},
+        "many_commits": {"pr": base_pr, "inputs": pr_with(commits=commits), "open_prs": open_prs},
+        "many_statuses": {"pr": base_pr, "inputs": pr_with(statuses=statuses), "open_prs": open_prs},
+    }
+
+
+def _stage_cases(compiled, name, corpus):
+    """One benchmark per gate stage, timing only that stage on precomputed inputs."""
+    lock_index = LockIndex(corpus["open_prs"])
+    inputs = corpus["inputs"]
+    source = GateInputs(corpus["pr"], inputs["commits"], inputs["files"], inputs["reviews"], inputs["statuses"], lock_index)
+    facts = {}
+    cases = []
+    for stage, inputs_fn, gates_fn in evaluator.GATE_STAGES:
+        stage_inputs = inputs_fn(compiled, source, facts)
+        facts.update(gates_fn(compiled, *stage_inputs)[1])
+        cases.append((f"gate.{stage}", name, lambda fn=gates_fn, args=stage_inputs: fn(compiled, *args)))
+    return cases
+
+
+def benchmark_cases(compiled, corpora):
+    """Returns [(benchmark, corpus, zero-argument callable)]."""
+    cases = []
+    for name in ("typical_pr", "large_files", "many_reviews", "large_body", "many_commits", "many_statuses"):
+        corpus = corpora[name]
+        inputs = corpus["inputs"]
+        lock_index = LockIndex(corpus["open_prs"])
+        cases.append(
+            (
+                "evaluate_pr",
+                name,
+                lambda pr=corpus["pr"], inputs=inputs, lock_index=lock_index: evaluate_pr(
+                    compiled, pr, lock_index=lock_index, **inputs
+                ),
+            )
+        )
+        cases.extend(_stage_cases(compiled, name, corpus))
+
+    body_pr = corpora["large_body"]["pr"]
+    body_text = f"{body_pr['title']}\n\n{body_pr['body']}"
+    cases.extend(
+        [
+            ("PrTextScan", "large_body", lambda: PrTextScan(body_pr["title"], body_pr["body"])),
+            ("_section_map", "large_body", lambda: evaluator._section_map(body_pr["body"])),
+            ("_extract_lock_tokens", "large_body", lambda: evaluator._extract_lock_tokens(body_text)),
+            (
+                "_latest_approved_reviews",
+                "many_reviews",
+                lambda: evaluator._latest_approved_reviews(corpora["many_reviews"]["inputs"]["reviews"]),
+            ),
+            (
+                "_status_by_context",
+                "many_statuses",
+                lambda: evaluator._status_by_context(corpora["many_statuses"]["inputs"]["statuses"]),
+            ),
+            (
+                "_check_commit_signing",
+                "many_commits",
+                lambda: evaluator._check_commit_signing(compiled, corpora["many_commits"]["inputs"]["commits"]),
+            ),
+        ]
+    )
+
+    data = corpora["open_prs"]["data"]
+    open_prs = corpora["open_prs"]["open_prs"]
+    entries = [(pr, _inputs_for(data, pr["number"])) for pr in open_prs]
+    cases.append(
+        (
+            "iter_evaluate_prs",
+            "open_prs",
+            lambda: list(iter_evaluate_prs(compiled, entries, open_prs=open_prs)),
+        )
+    )
+    return cases
+
+
+def _time_case(fn, min_time, repeats):
+    loops = 1
+    while True:
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter_ns() - started
+        if elapsed >= min_time * 1e9 or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time * 1e9 / elapsed) + 1))
+    samples = [elapsed / loops]
+    for _ in range(repeats - 1):
+        started = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter_ns() - started) / loops)
+    return loops, samples
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmarks(policy_path=DEFAULT_POLICY_PATH, seed=0, quick=False, min_time=0.2, repeats=5, only=None):
+    policy, policy_hash = load_policy(policy_path)
+    compiled = compile_policy(policy, policy_hash)
+    corpora = build_corpora(seed=seed, quick=quick)
+    results = []
+    for name, corpus, fn in benchmark_cases(compiled, corpora):
+        if only and not any(token in name for token in only):
+            continue
+        loops, samples = _time_case(fn, min_time, repeats)
+        results.append(
+            {
+                "benchmark": name,
+                "corpus": corpus,
+                "loops": loops,
+                "repeats": len(samples),
+                "ns_per_op": {"min": round(min(samples)), "median": round(statistics.median(samples))},
+                "peak_bytes": _peak_bytes(fn),
+            }
+        )
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "policy_hash": policy_hash,
+            "seed": seed,
+            "quick": quick,
+            "corpus_sizes": {name: sizes[1] if quick else sizes[0] for name, sizes in CORPUS_SIZES.items()},
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline):
+    """Returns [(benchmark, corpus, baseline ns, current ns, ratio)] for benchmarks in both runs."""
+    before = {(r["benchmark"], r["corpus"]): r["ns_per_op"]["min"] for r in baseline.get("results", [])}
+    rows = []
+    for row in current["results"]:
+        key = (row["benchmark"], row["corpus"])
+        if key in before and before[key]:
+            rows.append((*key, before[key], row["ns_per_op"]["min"], row["ns_per_op"]["min"] / before[key]))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark the PR gate evaluator on seeded corpora.")
+    parser.add_argument("--policy", default=DEFAULT_POLICY_PATH)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="use corpora a tenth of the full size")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing sample")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--only", action="append", help="run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="earlier JSON report to compare ns/op against")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        policy_path=args.policy,
+        seed=args.seed,
+        quick=args.quick,
+        min_time=args.min_time,
+        repeats=max(1, args.repeats),
+        only=args.only,
+    )
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        for name, corpus, before, after, ratio in compare(report, baseline):
+            print(f"{name:28} {corpus:14} {before:>12} -> {after:>12} ns/op  x{ratio:.2f}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
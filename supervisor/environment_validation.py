@@ -3,9 +3,10 @@ import json
 import subprocess
 import time
 import urllib.error
-import urllib.request
 from pathlib import Path
 
+from supervisor.pr_gate.http_client import request
+
 
 def _utc_iso8601() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
@@ -32,10 +33,11 @@ def _sha256_file(path: Path) -> str:
 
 
 def _api_json_request(method: str, url: str, headers: dict, timeout_seconds: int = 5):
-    req = urllib.request.Request(url, method=method, headers=headers)
-    with urllib.request.urlopen(req, timeout=timeout_seconds) as response:
-        raw = response.read().decode("utf-8")
-        return response.status, json.loads(raw) if raw else None
+    response = request(method, url, headers=headers, timeout=timeout_seconds)
+    if not 200 <= response.status < 300:
+        raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+    raw = response.body.decode("utf-8")
+    return response.status, json.loads(raw) if raw else None
 
 
 def validate_environment(
@@ -0,0 +1,328 @@
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import select
+import struct
+import threading
+import time
+
+from supervisor.pr_gate.logger import log_event
+
+
+DEFAULT_POLL_INTERVAL = 1.0
+# A file modified this close to being read may change again without its mtime
+# moving, so it is re-read on the next check.
+RACY_WINDOW_NS = 2_000_000_000
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _stat_key(st):
+    # ctime is included because, unlike mtime, it cannot be set back by hand.
+    return (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+
+
+def _decode_text(data):
+    # Same text open(path, encoding="utf-8").read() returns (universal newlines).
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class FileSnapshot:
+    """Contents of a watched file at one version; `error` is set instead when it cannot be read."""
+
+    __slots__ = ("path", "text", "sha256", "version", "error")
+
+    def __init__(self, path, text=None, sha256=None, version=0, error=None):
+        self.path = path
+        self.text = text
+        self.sha256 = sha256
+        self.version = version
+        self.error = error
+
+
+class _Inotify:
+    """Minimal ctypes binding: one watch per parent directory, so renames over a file are seen."""
+
+    def __init__(self):
+        name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(name, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+
+    def add_watch(self, directory):
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        return wd
+
+    def read_events(self):
+        """Yields (wd, mask, name) for every queued event without blocking."""
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+                yield wd, mask, os.fsdecode(name)
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    Shared view of a few small files (governance contract, environment, PR
+    policy). Each file is read and SHA-256 hashed once per real change:
+    inotify marks it dirty where available, and a stat() comparison on every
+    access backs it up, since inotify can miss changes (queue overflow,
+    network and overlay filesystems). Readers always see the latest
+    contents, because pending change events are drained before every
+    snapshot; start() additionally pushes changes to subscribers from a
+    background thread.
+    """
+
+    def __init__(self, use_inotify=True, poll_interval=DEFAULT_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self._lock = threading.RLock()
+        self._files = {}
+        self._stats = {}
+        self._dirty = set()
+        self._parsed = {}
+        self._dir_watches = {}
+        self._subscribers = []
+        self._thread = None
+        self._stop = threading.Event()
+        self._inotify = None
+        self.reads = 0
+        self.events = 0
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError):
+                self._inotify = None
+
+    @property
+    def backend(self):
+        return "inotify" if self._inotify is not None else "poll"
+
+    def subscribe(self, callback, path=None):
+        """callback(old_snapshot, new_snapshot) runs whenever a watched file's (or just `path`'s) contents change."""
+        with self._lock:
+            self._subscribers.append((os.path.abspath(path) if path is not None else None, callback))
+
+    def _watch_dir(self, directory):
+        if self._inotify is None or directory in self._dir_watches.values():
+            return
+        try:
+            wd = self._inotify.add_watch(directory)
+        except OSError:
+            return
+        self._dir_watches[wd] = directory
+
+    def _drain_events(self):
+        if self._inotify is None:
+            return
+        for wd, mask, name in self._inotify.read_events():
+            self.events += 1
+            directory = self._dir_watches.get(wd)
+            if mask & IN_Q_OVERFLOW:
+                self._dirty.update(self._files)
+                continue
+            if directory is None:
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                # The directory itself went away; re-watch on the next read.
+                self._dir_watches.pop(wd, None)
+                self._dirty.update(path for path in self._files if os.path.dirname(path) == directory)
+                continue
+            path = os.path.join(directory, name)
+            if path in self._files:
+                self._dirty.add(path)
+
+    def _stat_changed(self, path):
+        try:
+            st = os.stat(path)
+            key = _stat_key(st)
+        except OSError:
+            key = None
+        previous = self._stats.get(path)
+        return previous is None or previous[0] != key or previous[1]
+
+    def _read(self, path):
+        """Re-reads one file; returns (old, new) when its contents changed, else None."""
+        directory = os.path.dirname(path)
+        self._watch_dir(directory)
+        if self._inotify is not None and directory not in self._dir_watches.values():
+            # No watch (e.g. the directory is missing): fall back to stat for this file.
+            self._dirty.add(path)
+        else:
+            self._dirty.discard(path)
+
+        old = self._files.get(path)
+        read_started_ns = time.time_ns()
+        try:
+            st = os.stat(path)
+            with open(path, "rb") as f:
+                data = f.read()
+            text = _decode_text(data)
+        except (OSError, UnicodeDecodeError) as exc:
+            self._stats[path] = (None, False)
+            new = FileSnapshot(path, version=(old.version + 1 if old else 1), error=exc)
+            self._files[path] = new
+            changed = old is None or old.error is None
+            return (old, new) if changed else None
+        self.reads += 1
+        self._stats[path] = (
+            _stat_key(st),
+            st.st_mtime_ns >= read_started_ns - RACY_WINDOW_NS,
+        )
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if old is not None and old.error is None and old.sha256 == digest:
+            return None
+        new = FileSnapshot(path, text=text, sha256=digest, version=(old.version + 1 if old else 1))
+        self._files[path] = new
+        self._parsed.pop(path, None)
+        return old, new
+
+    def _refresh(self, paths, force=False):
+        changes = []
+        with self._lock:
+            self._drain_events()
+            for path in paths:
+                if (
+                    force
+                    or path not in self._files
+                    or path in self._dirty
+                    or self._stat_changed(path)
+                ):
+                    change = self._read(path)
+                    if change is not None:
+                        changes.append(change)
+            subscribers = list(self._subscribers)
+        for old, new in changes:
+            if old is None:
+                continue
+            log_event("file_watcher", f"changed path={new.path} version={new.version} sha256={new.sha256}")
+            for path, callback in subscribers:
+                if path is None or path == new.path:
+                    callback(old, new)
+        return changes
+
+    def snapshot(self, path, reread=False):
+        """Current FileSnapshot of path (watching it from now on); `reread` forces a fresh read and hash."""
+        path = os.path.abspath(path)
+        self._refresh([path], force=reread)
+        with self._lock:
+            return self._files[path]
+
+    def read_text(self, path):
+        snap = self.snapshot(path)
+        if snap.error is not None:
+            raise snap.error
+        return snap.text
+
+    def digest(self, path):
+        snap = self.snapshot(path)
+        if snap.error is not None:
+            raise snap.error
+        return snap.sha256
+
+    def load_json(self, path):
+        """json.loads of the file, parsed once per version. The result is shared; treat it as read-only."""
+        snap = self.snapshot(path)
+        if snap.error is not None:
+            raise snap.error
+        with self._lock:
+            parsed = self._parsed.get(snap.path)
+            if parsed is not None and parsed[0] == snap.version:
+                return parsed[1]
+        value = json.loads(snap.text)
+        with self._lock:
+            self._parsed[snap.path] = (snap.version, value)
+        return value
+
+    def refresh(self):
+        """Checks every watched file now and notifies subscribers of changes."""
+        with self._lock:
+            paths = list(self._files)
+        return self._refresh(paths)
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self._inotify is not None:
+                try:
+                    select.select([self._inotify.fd], [], [], self.poll_interval)
+                except (OSError, ValueError):
+                    return
+            else:
+                self._stop.wait(self.poll_interval)
+            if not self._stop.is_set():
+                self.refresh()
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+        with self._lock:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+
+    def stats(self):
+        with self._lock:
+            return {"backend": self.backend, "files": len(self._files), "reads": self.reads, "events": self.events}
+
+
+_DEFAULT_WATCHER = None
+_DEFAULT_WATCHER_LOCK = threading.Lock()
+
+
+def get_file_watcher():
+    """
+    Process-wide FileWatcher, or None when PR_GATE_FILE_WATCHER=0 (callers
+    then read files directly). PR_GATE_FILE_WATCHER=poll skips inotify.
+    """
+    global _DEFAULT_WATCHER
+    mode = os.environ.get("PR_GATE_FILE_WATCHER", "").strip().lower()
+    if mode in ("0", "off", "false", "no"):
+        return None
+    with _DEFAULT_WATCHER_LOCK:
+        if _DEFAULT_WATCHER is None:
+            _DEFAULT_WATCHER = FileWatcher(use_inotify=mode != "poll")
+        return _DEFAULT_WATCHER
@@ -1,9 +1,10 @@
 import hashlib
 import json
-import os
 import re
 import time
 
+from supervisor.log_store import append_record
+
 
 class GovernanceViolation(Exception):
     """Raised when a governance enforcement check fails."""
@@ -18,9 +19,7 @@ def _utc_timestamp():
 
 
 def _append_jsonl(path, payload):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(payload, sort_keys=True) + "\n")
+    append_record(path, payload, sync=True)
 
 
 def _extract_allowed_files(instruction_text):
@@ -37,18 +36,28 @@ class GovernanceEnforcer:
         governance_path="docs/governance.md",
         environment_path="agents/state/environment.json",
         violation_log_path="logs/governance_violations.log",
+        watcher=None,
     ):
         self.governance_path = governance_path
+        self.watcher = watcher
         self.environment_path = environment_path
         self.violation_log_path = violation_log_path
         self._governance_hash = None
         self._governance_text = None
         self._environment = None
+        self._pushed_mutation = None
         self.last_report = {
             "governance_compliant": True,
             "violations": [],
             "enforcement_actions": [],
         }
+        if watcher is not None:
+            watcher.subscribe(self._on_governance_change, path=governance_path)
+
+    def _on_governance_change(self, old, new):
+        # Pushed by the watcher; latched so an edit reverted before the next check still fails closed.
+        if self._governance_hash is not None and new.sha256 != self._governance_hash:
+            self._pushed_mutation = new
 
     def _record_violation(self, rule, message, context=None):
         payload = {
@@ -78,10 +87,14 @@ class GovernanceEnforcer:
         """
         self._reset_report()
         try:
-            with open(self.governance_path, "r", encoding="utf-8") as f:
-                self._governance_text = f.read()
-            with open(self.environment_path, "r", encoding="utf-8") as f:
-                self._environment = json.load(f)
+            if self.watcher is not None:
+                self._governance_text = self.watcher.read_text(self.governance_path)
+                self._environment = self.watcher.load_json(self.environment_path)
+            else:
+                with open(self.governance_path, "r", encoding="utf-8") as f:
+                    self._governance_text = f.read()
+                with open(self.environment_path, "r", encoding="utf-8") as f:
+                    self._environment = json.load(f)
         except Exception as e:
             self._record_violation(
                 rule="context_loading",
@@ -90,6 +103,7 @@ class GovernanceEnforcer:
             raise GovernanceViolation("Context loading failed")
 
         self._governance_hash = _sha256_text(self._governance_text)
+        self._pushed_mutation = None
         return {
             "governance_hash": self._governance_hash,
             "environment_loaded": True,
@@ -99,6 +113,8 @@ class GovernanceEnforcer:
         """
         Immutability gate:
         Governance Contract must remain immutable during runtime.
+        With a file watcher the digest is only recomputed after the file changes,
+        and any change the watcher pushed since load_context() counts too.
         """
         if self._governance_hash is None:
             self._record_violation(
@@ -108,8 +124,11 @@ class GovernanceEnforcer:
             raise GovernanceViolation("Governance context missing")
 
         try:
-            with open(self.governance_path, "r", encoding="utf-8") as f:
-                current_hash = _sha256_text(f.read())
+            if self.watcher is not None:
+                current_hash = self.watcher.digest(self.governance_path)
+            else:
+                with open(self.governance_path, "r", encoding="utf-8") as f:
+                    current_hash = _sha256_text(f.read())
         except Exception as e:
             self._record_violation(
                 rule="immutability",
@@ -117,7 +136,7 @@ class GovernanceEnforcer:
             )
             raise GovernanceViolation("Cannot verify governance immutability")
 
-        if current_hash != self._governance_hash:
+        if current_hash != self._governance_hash or self._pushed_mutation is not None:
             self._record_violation(
                 rule="immutability",
                 message="Governance Contract changed after startup without amendment flow",
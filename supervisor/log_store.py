@@ -0,0 +1,382 @@
+import atexit
+import calendar
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_AGE_SECONDS = 24 * 3600
+INDEX_SCHEMA = 1
+TIME_FIELDS = ("ts", "timestamp")
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+MAX_OPEN_LOGS = 16
+
+
+def utc_timestamp():
+    return time.strftime(TIME_FORMAT, time.gmtime())
+
+
+def _record_time(record):
+    for field in TIME_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _epoch(stamp):
+    try:
+        return calendar.timegm(time.strptime(stamp, TIME_FORMAT))
+    except (TypeError, ValueError):
+        return None
+
+
+def _overlaps(entry, start, end):
+    if entry.get("first_ts") is None:
+        return True
+    if start is not None and entry["last_ts"] < start:
+        return False
+    if end is not None and entry["first_ts"] > end:
+        return False
+    return True
+
+
+def _open_segment(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _scan(path):
+    """(records, first_ts, last_ts) of a segment; timestamps are min/max, since writers may interleave."""
+    records, first, last = 0, None, None
+    with _open_segment(path) as f:
+        for line in f:
+            try:
+                stamp = _record_time(json.loads(line))
+            except ValueError:
+                continue
+            records += 1
+            if stamp is not None:
+                first = stamp if first is None or stamp < first else first
+                last = stamp if last is None or stamp > last else last
+    return records, first, last
+
+
+class JsonlLog:
+    """
+    Append-only JSONL log at `path` (the active segment). It rotates to
+    "<path>.<seq>" once the active segment reaches `max_bytes` or its oldest
+    record is `max_age_seconds` old, and gzips rotated segments on a
+    background thread. "<path>.index.json" records each segment's first and
+    last timestamp, so read(start, end) opens only the segments that overlap
+    the window. Records without a "ts"/"timestamp" field get a "ts". One
+    process should own a log: rotation is not coordinated across processes.
+    """
+
+    def __init__(
+        self,
+        path,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_age_seconds=DEFAULT_MAX_AGE_SECONDS,
+        compress=True,
+        keep_segments=None,
+        clock=None,
+    ):
+        self.path = os.path.abspath(path)
+        self.directory = os.path.dirname(self.path)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.compress = compress
+        self.keep_segments = keep_segments
+        self._clock = clock or time.time
+        self._lock = threading.RLock()
+        self._handle = None
+        self._active = None
+        self._segments = None
+        self._compressors = []
+        self._segment_re = re.compile(re.escape(os.path.basename(self.path)) + r"\.(\d{6})(\.gz)?$")
+
+    @property
+    def index_path(self):
+        return f"{self.path}.index.json"
+
+    def _segment_path(self, entry):
+        plain = os.path.join(self.directory, entry["file"])
+        return plain + ".gz" if entry.get("compressed") else plain
+
+    def _load_index(self):
+        if self._segments is not None:
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                segments = json.load(f).get("segments", [])
+        except (OSError, ValueError):
+            segments = []
+        on_disk = {}
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                match = self._segment_re.match(name)
+                if match:
+                    on_disk.setdefault(name[: len(name) - len(match.group(2) or "")], set()).add(bool(match.group(2)))
+        known = {}
+        for entry in segments:
+            forms = on_disk.get(entry.get("file"))
+            if forms:
+                entry["compressed"] = True in forms
+                known[entry["file"]] = entry
+        for name, forms in on_disk.items():
+            if name not in known:
+                # Rotated but never indexed (e.g. a crash mid-rotation).
+                entry = {"file": name, "compressed": True in forms}
+                entry["records"], entry["first_ts"], entry["last_ts"] = _scan(self._segment_path(entry))
+                known[name] = entry
+        self._segments = sorted(known.values(), key=lambda entry: entry["file"])
+        if self._segments != segments:
+            self._write_index()
+        for entry in self._segments:
+            if self.compress and not entry["compressed"]:
+                self._compress_later(entry)
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"schema": INDEX_SCHEMA, "segments": self._segments}, f, sort_keys=True, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _open_active(self):
+        if self._handle is not None:
+            return
+        self._load_index()
+        os.makedirs(self.directory, exist_ok=True)
+        if self._active is None:
+            if os.path.exists(self.path):
+                records, first, last = _scan(self.path)
+            else:
+                records, first, last = 0, None, None
+            self._active = {"records": records, "first_ts": first, "last_ts": last}
+        self._handle = open(self.path, "a", encoding="utf-8")
+
+    def _rotation_due(self):
+        if not self._active["records"]:
+            return False
+        if self.max_bytes is not None and self._handle.tell() >= self.max_bytes:
+            return True
+        first = _epoch(self._active["first_ts"])
+        return (
+            self.max_age_seconds is not None
+            and first is not None
+            and self._clock() - first >= self.max_age_seconds
+        )
+
+    def _rotate(self):
+        self._handle.close()
+        self._handle = None
+        seq = int(self._segments[-1]["file"].rsplit(".", 1)[1]) + 1 if self._segments else 1
+        entry = dict(self._active, file=f"{os.path.basename(self.path)}.{seq:06d}", compressed=False)
+        os.replace(self.path, os.path.join(self.directory, entry["file"]))
+        self._segments.append(entry)
+        self._active = {"records": 0, "first_ts": None, "last_ts": None}
+        if self.keep_segments:
+            while len(self._segments) > self.keep_segments:
+                dropped = self._segments.pop(0)
+                for path in (self._segment_path(dropped), os.path.join(self.directory, dropped["file"])):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        self._write_index()
+        if self.compress:
+            self._compress_later(entry)
+
+    def _compress_later(self, entry):
+        thread = threading.Thread(target=self._compress, args=(entry,), name="log-segment-gzip", daemon=True)
+        self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+        thread.start()
+
+    def _compress(self, entry):
+        plain = os.path.join(self.directory, entry["file"])
+        tmp_path = f"{plain}.gz.tmp"
+        try:
+            with open(plain, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            with self._lock:
+                # Retention may have dropped the segment while it was being compressed.
+                if any(segment is entry for segment in self._segments):
+                    os.replace(tmp_path, plain + ".gz")
+                    entry["compressed"] = True
+                    self._write_index()
+                    os.remove(plain)
+        except OSError:
+            pass
+        finally:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def append(self, record):
+        """Writes one record (buffered; see flush) and returns the bytes written."""
+        if _record_time(record) is None:
+            record = dict(record, ts=utc_timestamp())
+        line = json.dumps(record, sort_keys=True) + "\n"
+        stamp = _record_time(record)
+        with self._lock:
+            self._open_active()
+            if self._rotation_due():
+                self._rotate()
+                self._open_active()
+            self._handle.write(line)
+            active = self._active
+            active["records"] += 1
+            active["first_ts"] = stamp if active["first_ts"] is None or stamp < active["first_ts"] else active["first_ts"]
+            active["last_ts"] = stamp if active["last_ts"] is None or stamp > active["last_ts"] else active["last_ts"]
+        return len(line)
+
+    def flush(self, sync=False):
+        """Flushes the active segment; a segment renamed or removed by someone else is reopened next time."""
+        with self._lock:
+            if self._handle is None:
+                return
+            self._handle.flush()
+            if sync:
+                os.fsync(self._handle.fileno())
+            try:
+                replaced = os.stat(self.path).st_ino != os.fstat(self._handle.fileno()).st_ino
+            except FileNotFoundError:
+                replaced = True
+            if replaced:
+                self._handle.close()
+                self._handle = None
+                self._active = None
+
+    def close(self):
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def wait_for_compression(self, timeout=None):
+        for thread in list(self._compressors):
+            thread.join(timeout)
+
+    def segments(self):
+        """Index entries of the rotated segments, oldest first, plus the active segment last."""
+        with self._lock:
+            self._load_index()
+            if self._handle is not None:
+                self._handle.flush()
+            active = self._active
+            if active is None:
+                active = {"records": None, "first_ts": None, "last_ts": None}
+            entries = [dict(entry) for entry in self._segments]
+            entries.append(dict(active, file=os.path.basename(self.path), compressed=False, active=True))
+            return entries
+
+    def read(self, start=None, end=None):
+        """Yields records with start <= timestamp <= end (UTC "YYYY-MM-DDTHH:MM:SSZ" strings, inclusive)."""
+        for entry in self.segments():
+            if not _overlaps(entry, start, end):
+                continue
+            path = self.path if entry.get("active") else self._segment_path(entry)
+            if not entry.get("active") and not os.path.exists(path):
+                # Compressed after the listing was taken.
+                path = os.path.join(self.directory, entry["file"]) + ".gz"
+            try:
+                f = _open_segment(path)
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    stamp = _record_time(record)
+                    if start is not None and (stamp is None or stamp < start):
+                        continue
+                    if end is not None and (stamp is None or stamp > end):
+                        continue
+                    yield record
+
+
+_LOGS = OrderedDict()
+_LOGS_LOCK = threading.Lock()
+
+
+def _number_env(name, default, cast=int):
+    raw = os.environ.get(name, "")
+    try:
+        return cast(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def get_log(path):
+    """
+    Process-wide JsonlLog for path, configured by PR_GATE_LOG_MAX_BYTES,
+    PR_GATE_LOG_MAX_AGE_SECONDS, PR_GATE_LOG_COMPRESS=0 and
+    PR_GATE_LOG_KEEP_SEGMENTS (0 keeps every segment).
+    """
+    key = os.path.abspath(path)
+    with _LOGS_LOCK:
+        log = _LOGS.get(key)
+        if log is None:
+            log = JsonlLog(
+                key,
+                max_bytes=_number_env("PR_GATE_LOG_MAX_BYTES", DEFAULT_MAX_BYTES) or None,
+                max_age_seconds=_number_env("PR_GATE_LOG_MAX_AGE_SECONDS", DEFAULT_MAX_AGE_SECONDS, float) or None,
+                compress=os.environ.get("PR_GATE_LOG_COMPRESS", "1").strip() != "0",
+                keep_segments=_number_env("PR_GATE_LOG_KEEP_SEGMENTS", 0) or None,
+            )
+            _LOGS[key] = log
+        _LOGS.move_to_end(key)
+        while len(_LOGS) > MAX_OPEN_LOGS:
+            _, evicted = _LOGS.popitem(last=False)
+            evicted.flush()
+            evicted.close()
+        return log
+
+
+def append_record(path, record, sync=False):
+    """Appends one record to the log at path and flushes it (fsync too with sync=True)."""
+    log = get_log(path)
+    log.append(record)
+    log.flush(sync=sync)
+
+
+def flush_logs(sync=False):
+    """Flushes every open log (see JsonlLog.flush)."""
+    with _LOGS_LOCK:
+        logs = list(_LOGS.values())
+    for log in logs:
+        log.flush(sync=sync)
+
+
+def close_logs(timeout=5.0):
+    """Flushes and closes every open log and waits for pending segment compression."""
+    with _LOGS_LOCK:
+        logs = list(_LOGS.values())
+    for log in logs:
+        log.flush()
+        log.close()
+        log.wait_for_compression(timeout)
+
+
+def _reset_after_fork():
+    # Handles and locks are not shared with forked children; they open their own.
+    global _LOGS, _LOGS_LOCK
+    _LOGS = OrderedDict()
+    _LOGS_LOCK = threading.Lock()
+
+
+atexit.register(close_logs)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,24 +1,56 @@
+from supervisor.pr_gate.compiled_policy import (
+    CompiledPolicy,
+    compile_policy,
+)
+from supervisor.pr_gate.content_cache import (
+    PrContentCache,
+    content_cache_from_env,
+    pr_content_key,
+)
 from supervisor.pr_gate.evaluator import (
     evaluate_pr,
+    evaluate_prs,
+    iter_evaluate_prs,
+)
+from supervisor.pr_gate.gitea_async import (
+    AsyncGiteaClient,
+    run_with_deadline,
 )
 from supervisor.pr_gate.gitea_client import (
     GiteaClientError,
+    enrich_pull_request_commits,
     get_commit_statuses,
     get_open_pull_requests,
+    get_pull_request_commit_list,
     get_pull_request_commits,
     get_pull_request_files,
     get_pull_request_reviews,
+    iter_commit_statuses,
+    iter_open_pull_requests,
+    iter_paginated,
+    iter_pull_request_files,
+    iter_pull_request_reviews,
+    prefetch_pull_request_heads,
+)
+from supervisor.pr_gate.incremental import (
+    IncrementalEvaluator,
+    incremental_evaluator_from_env,
 )
 from supervisor.pr_gate.locker import (
     EvaluationCache,
+    LockIndex,
+    evaluation_cache_from_env,
 )
 from supervisor.pr_gate.policy_loader import (
     PolicyLoadError,
+    PolicyStore,
+    load_compiled_policy,
     load_policy,
 )
 from supervisor.pr_gate.report import (
     gate_report,
     write_gate_artifact,
+    write_lock_index_artifact,
 )
 from supervisor.pr_gate.status_publisher import (
     StatusPublishError,
@@ -26,18 +58,42 @@ from supervisor.pr_gate.status_publisher import (
 )
 
 __all__ = [
+    "AsyncGiteaClient",
+    "CompiledPolicy",
     "EvaluationCache",
     "GiteaClientError",
+    "IncrementalEvaluator",
+    "LockIndex",
     "PolicyLoadError",
+    "PolicyStore",
+    "PrContentCache",
     "StatusPublishError",
+    "compile_policy",
+    "content_cache_from_env",
+    "enrich_pull_request_commits",
     "evaluate_pr",
+    "evaluate_prs",
+    "evaluation_cache_from_env",
     "gate_report",
     "get_commit_statuses",
     "get_open_pull_requests",
+    "get_pull_request_commit_list",
     "get_pull_request_commits",
     "get_pull_request_files",
     "get_pull_request_reviews",
+    "incremental_evaluator_from_env",
+    "iter_commit_statuses",
+    "iter_evaluate_prs",
+    "iter_open_pull_requests",
+    "iter_paginated",
+    "iter_pull_request_files",
+    "iter_pull_request_reviews",
+    "load_compiled_policy",
     "load_policy",
+    "pr_content_key",
+    "prefetch_pull_request_heads",
     "publish_governance_status",
+    "run_with_deadline",
     "write_gate_artifact",
+    "write_lock_index_artifact",
 ]
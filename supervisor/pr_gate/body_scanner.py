@@ -0,0 +1,80 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+
+SECTION_HEADING_RE = re.compile(r"^###\s+(.+?)\s*$")
+LOCK_TOKEN_RE = re.compile(r"\bLOCK:[A-Za-z0-9_./-]+\b")
+MAX_SCANS = 4096
+
+
+class PrTextScan:
+    """
+    What the gates read from a PR's title and body, from one pass over the
+    lines: the "###" section map of the body and the LOCK: tokens of
+    "title\\n\\nbody". Issue-link matches are policy regexes over the whole
+    text; they run at most once per pattern set and are kept here.
+    """
+
+    __slots__ = ("sections", "lock_tokens", "_issue_refs")
+
+    def __init__(self, title, body):
+        sections = {}
+        lock_tokens = []
+        for line in title.splitlines():
+            if "LOCK:" in line:
+                lock_tokens.extend(LOCK_TOKEN_RE.findall(line))
+        current = None
+        for line in body.splitlines():
+            if "LOCK:" in line:
+                lock_tokens.extend(LOCK_TOKEN_RE.findall(line))
+            heading = SECTION_HEADING_RE.match(line) if line.startswith("###") else None
+            if heading:
+                current = heading.group(1)
+                sections.setdefault(current, [])
+            elif current is not None:
+                sections[current].append(line)
+        self.sections = {key: "\n".join(val).strip() for key, val in sections.items()}
+        self.lock_tokens = tuple(lock_tokens)
+        self._issue_refs = {}
+
+    def issue_ref_present(self, patterns, title, body):
+        """True if any compiled pattern matches "title\n\nbody" (the text this scan was built from)."""
+        key = tuple(pattern.pattern for pattern in patterns)
+        found = self._issue_refs.get(key)
+        if found is None:
+            text = f"{title}\n\n{body}"
+            found = any(pattern.search(text) for pattern in patterns)
+            self._issue_refs[key] = found
+        return found
+
+
+_SCANS = OrderedDict()
+_SCANS_LOCK = threading.Lock()
+
+
+def _scan_key(title, body):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(title.encode("utf-8", "surrogatepass"))
+    digest.update(b"\0")
+    digest.update(body.encode("utf-8", "surrogatepass"))
+    return (len(title), digest.digest())
+
+
+def scan_pr_text(title, body):
+    """Returns the PrTextScan for (title, body), memoized by a hash of the text."""
+    title = title or ""
+    body = body or ""
+    key = _scan_key(title, body)
+    with _SCANS_LOCK:
+        scan = _SCANS.get(key)
+        if scan is not None:
+            _SCANS.move_to_end(key)
+            return scan
+    scan = PrTextScan(title, body)
+    with _SCANS_LOCK:
+        _SCANS[key] = scan
+        while len(_SCANS) > MAX_SCANS:
+            _SCANS.popitem(last=False)
+    return scan
@@ -0,0 +1,104 @@
+import re
+import threading
+
+from supervisor.pr_gate.path_classifier import PathPrefixClassifier
+
+
+_COMPILED_BY_HASH = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+class ApprovalRequirements:
+    __slots__ = ("min_approvals", "require_human_approval", "require_distinct_reviewer")
+
+    def __init__(self, cfg):
+        self.min_approvals = int(cfg.get("min_approvals", 0) or 0)
+        self.require_human_approval = bool(cfg.get("require_human_approval", False))
+        self.require_distinct_reviewer = bool(cfg.get("require_distinct_reviewer", False))
+
+
+_NO_APPROVAL_REQUIREMENTS = ApprovalRequirements({})
+
+
+class CompiledPolicy:
+    """
+    Read-only, pre-digested view of a policy mapping: regexes compiled, sets
+    frozen and per-base-branch approval requirements resolved once. The
+    evaluator reads only these attributes, so results match the dict form.
+    """
+
+    def __init__(self, policy, policy_hash=None):
+        self.policy = policy
+        self.policy_hash = policy_hash
+
+        branch_rules = policy.get("branch_rules") or {}
+        patterns = branch_rules.get("patterns") or {}
+        self.branch_patterns = tuple(
+            (name, re.compile((spec or {}).get("regex")))
+            for name, spec in patterns.items()
+            if (spec or {}).get("regex")
+        )
+        self.feature_to_develop_only = bool(branch_rules.get("feature_to_develop_only", False))
+
+        issue_cfg = policy.get("issue_link") or {}
+        self.issue_link_required = bool(issue_cfg.get("required", False))
+        self.issue_link_patterns = (
+            tuple(re.compile(pattern) for pattern in issue_cfg.get("patterns", []))
+            if self.issue_link_required
+            else ()
+        )
+
+        template_cfg = policy.get("pr_template") or {}
+        self.required_sections = tuple(template_cfg.get("required_sections", []))
+        self.placeholders = tuple(str(x).lower() for x in template_cfg.get("reject_placeholders", []))
+        self.min_section_length = int(template_cfg.get("min_section_length", 0) or 0)
+
+        self.high_risk_paths = tuple(policy.get("high_risk_paths", []))
+
+        lock_cfg = policy.get("locks") or {}
+        self.lock_required_on_high_risk = bool(lock_cfg.get("required_on_high_risk", False))
+        self.allowed_locks = frozenset(lock_cfg.get("allowed", []))
+        self.lock_exclusive = bool(lock_cfg.get("exclusive", False))
+        self.missing_lock_hint = next(iter(sorted(self.allowed_locks)), "LOCK:<required>")
+
+        self.required_checks = tuple(policy.get("ci", {}).get("required_checks", []))
+        sys_evo = policy.get("system_evolution", {})
+        self.system_evolution_paths = tuple(sys_evo.get("detect_paths", []))
+        sys_checks = sys_evo.get("ci", {}).get("required_checks")
+        self.system_evolution_checks = None if sys_checks is None else tuple(sys_checks)
+        sys_approvals = (policy.get("system_evolution") or {}).get("approvals", {})
+        self.system_evolution_min_approvals = int(sys_approvals.get("min_approvals", 0) or 0)
+        self.system_evolution_require_human = bool(sys_approvals.get("require_human_approval", False))
+
+        self.path_classifier = PathPrefixClassifier(
+            {"high_risk": self.high_risk_paths, "system_evolution": self.system_evolution_paths}
+        )
+
+        approvals_cfg = policy.get("approvals") or {}
+        self.disallow_self_approval = bool(approvals_cfg.get("disallow_self_approval", False))
+        self.approvals_by_base = {
+            base: ApprovalRequirements(cfg)
+            for base, cfg in (approvals_cfg.items() if isinstance(approvals_cfg, dict) else ())
+            if isinstance(cfg, dict)
+        }
+
+        signing = policy.get("commit_signing") or {}
+        self.commit_signing_required = bool(signing.get("required", False))
+
+    def approvals_for(self, base_branch):
+        return self.approvals_by_base.get(base_branch, _NO_APPROVAL_REQUIREMENTS)
+
+
+def compile_policy(policy, policy_hash=None):
+    """Returns the CompiledPolicy for policy, reusing the one built for policy_hash."""
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    if policy_hash is None:
+        return CompiledPolicy(policy)
+    with _COMPILED_LOCK:
+        compiled = _COMPILED_BY_HASH.get(policy_hash)
+        if compiled is None:
+            compiled = CompiledPolicy(policy, policy_hash)
+            _COMPILED_BY_HASH.clear()
+            _COMPILED_BY_HASH[policy_hash] = compiled
+        return compiled
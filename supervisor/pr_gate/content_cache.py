@@ -0,0 +1,158 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+DEFAULT_CONTENT_CACHE_DIR = "artifacts/cache/pr-content"
+DEFAULT_MEMORY_ENTRIES = 512
+CONTENT_KINDS = ("files", "commits")
+
+
+def pr_content_key(owner, repo, pr):
+    """
+    (repo, head sha, merge base) for an open PR. The head fixes the commits,
+    the merge base fixes what they are diffed against; a PR without a
+    merge_base field is keyed on its head alone.
+    """
+    head_sha = ((pr.get("head") or {}).get("sha") or "").strip()
+    return (f"{owner}/{repo}", head_sha, (pr.get("merge_base") or "").strip())
+
+
+def _digest(key):
+    return hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+
+
+class PrContentCache:
+    """
+    Immutable-by-SHA store of a PR's non-empty file list and raw commit list. A bounded
+    LRU dict in memory sits in front of gzipped JSON files under `directory`
+    (written once per key and kind, so they survive restarts). retain() evicts
+    every key that is no longer an open PR's current head from both tiers.
+    """
+
+    def __init__(self, directory=DEFAULT_CONTENT_CACHE_DIR, memory_entries=DEFAULT_MEMORY_ENTRIES):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key, kind):
+        return os.path.join(self.directory, f"{_digest(key)}.{kind}.json.gz")
+
+    def _remember(self, key, kind, value):
+        self._memory[(key, kind)] = value
+        self._memory.move_to_end((key, kind))
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key, kind):
+        if not self.directory:
+            return None
+        try:
+            with gzip.open(self._path(key, kind), "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("key") != list(key) or payload.get("kind") != kind:
+            return None
+        return payload.get("value") or None
+
+    def _write_disk(self, key, kind, value):
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key, kind)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump({"key": list(key), "kind": kind, "value": value}, f, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, key, kind):
+        with self._lock:
+            value = self._memory.get((key, kind))
+            if value is not None:
+                self._memory.move_to_end((key, kind))
+                self.memory_hits += 1
+                return list(value)
+        value = self._read_disk(key, kind)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, kind, value)
+        return list(value)
+
+    def put(self, key, kind, value):
+        value = list(value)
+        if not value:
+            return
+        with self._lock:
+            self._remember(key, kind, value)
+        self._write_disk(key, kind, value)
+
+    def get_or_fetch(self, key, kind, fetch):
+        """
+        Cached value for (key, kind), or fetch() stored under it. Keys without
+        a head and empty results (Gitea can briefly list no commits or files
+        right after a push) are never cached, so they are fetched again.
+        """
+        if not key[1]:
+            return fetch()
+        value = self.get(key, kind)
+        if value is None:
+            value = fetch()
+            self.put(key, kind, value)
+        return value
+
+    def retain(self, keys):
+        """Drops every entry whose key is not in `keys` (the open PRs' current content keys)."""
+        keep = set(keys)
+        with self._lock:
+            for entry in [entry for entry in self._memory if entry[0] not in keep]:
+                del self._memory[entry]
+        dropped = 0
+        if self.directory and os.path.isdir(self.directory):
+            wanted = {_digest(key) for key in keep}
+            for name in os.listdir(self.directory):
+                if name.split(".", 1)[0] not in wanted:
+                    try:
+                        os.remove(os.path.join(self.directory, name))
+                        dropped += 1
+                    except OSError:
+                        pass
+        return dropped
+
+    def stats(self):
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+
+def content_cache_from_env():
+    """PR_GATE_CONTENT_CACHE=0 disables the cache; an empty PR_GATE_CONTENT_CACHE_DIR keeps it in memory."""
+    if os.environ.get("PR_GATE_CONTENT_CACHE", "1").strip() == "0":
+        return None
+    directory = os.environ.get("PR_GATE_CONTENT_CACHE_DIR", DEFAULT_CONTENT_CACHE_DIR).strip()
+    raw = os.environ.get("PR_GATE_CONTENT_CACHE_ENTRIES", "")
+    try:
+        entries = int(raw) if raw else DEFAULT_MEMORY_ENTRIES
+    except ValueError:
+        entries = DEFAULT_MEMORY_ENTRIES
+    return PrContentCache(directory=directory or None, memory_entries=max(1, entries))
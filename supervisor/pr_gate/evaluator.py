@@ -1,4 +1,15 @@
-import re
+import copy
+import hashlib
+import inspect
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from supervisor.pr_gate.body_scanner import PrTextScan, scan_pr_text
+from supervisor.pr_gate.compiled_policy import compile_policy
+from supervisor.pr_gate.locker import LockIndex, extract_lock_tokens
+from supervisor.pr_gate.path_classifier import observed_path_classes
+from supervisor.pr_gate.timing import input_sizes
 
 
 def _latest_approved_reviews(reviews):
@@ -23,16 +34,11 @@ def _latest_approved_reviews(reviews):
     return approved
 
 
-def _required_status_checks(policy, files):
-    required = list(policy.get("ci", {}).get("required_checks", []))
-    sys_evo = policy.get("system_evolution", {})
-    detect_paths = tuple(sys_evo.get("detect_paths", []))
-    is_system_evolution = any(
-        any(path.startswith(prefix) for prefix in detect_paths)
-        for path in files
-    )
-    if is_system_evolution:
-        required = list(sys_evo.get("ci", {}).get("required_checks", required))
+def _required_status_checks(compiled, path_hits):
+    required = list(compiled.required_checks)
+    is_system_evolution = bool(path_hits["system_evolution"])
+    if is_system_evolution and compiled.system_evolution_checks is not None:
+        required = list(compiled.system_evolution_checks)
     return required, is_system_evolution
 
 
@@ -47,49 +53,15 @@ def _status_by_context(statuses):
 
 
 def _extract_lock_tokens(text):
-    return re.findall(r"\bLOCK:[A-Za-z0-9_./-]+\b", text or "")
+    return extract_lock_tokens(text)
 
 
 def _section_map(markdown_text):
-    sections = {}
-    current = None
-    lines = (markdown_text or "").splitlines()
-    for line in lines:
-        heading = re.match(r"^###\s+(.+?)\s*$", line)
-        if heading:
-            current = heading.group(1)
-            sections.setdefault(current, [])
-            continue
-        if current is not None:
-            sections[current].append(line)
-    return {key: "\n".join(val).strip() for key, val in sections.items()}
-
-
-def _issue_ref_present(policy, text):
-    issue_cfg = policy.get("issue_link") or {}
-    if not issue_cfg.get("required", False):
-        return True
-    patterns = issue_cfg.get("patterns", [])
-    for pattern in patterns:
-        if re.search(pattern, text or ""):
-            return True
-    return False
-
-
-def _branch_patterns(policy):
-    patterns = ((policy.get("branch_rules") or {}).get("patterns") or {})
-    compiled = {}
-    for name, spec in patterns.items():
-        regex = (spec or {}).get("regex")
-        if regex:
-            compiled[name] = re.compile(regex)
-    return compiled
-
-
-def _check_commit_signing(policy, commits):
-    signing = policy.get("commit_signing") or {}
-    required = bool(signing.get("required", False))
-    if not required:
+    return PrTextScan("", markdown_text or "").sections
+
+
+def _check_commit_signing(compiled, commits):
+    if not compiled.commit_signing_required:
         return [], []
 
     unverifiable = []
@@ -118,65 +90,82 @@ def _check_commit_signing(policy, commits):
     return unverifiable, unsigned
 
 
-def evaluate_pr(policy, pr_data, commits, files, reviews, statuses):
-    gate_events = []
-    failed_gates = []
+class GateInputs:
+    """Raw inputs of one PR evaluation; the lock index is built only if needed."""
 
-    def record(gate, passed, reason):
-        gate_events.append(
-            {
-                "gate": gate,
-                "result": "PASS" if passed else "FAIL",
-                "reason": str(reason),
-            }
-        )
-        if not passed:
-            failed_gates.append(gate)
-
-    base_branch = ((pr_data.get("base") or {}).get("ref") or "").strip()
-    head_branch = ((pr_data.get("head") or {}).get("ref") or "").strip()
-    pr_title = pr_data.get("title") or ""
-    pr_body = pr_data.get("body") or ""
-    pr_text = f"{pr_title}\n\n{pr_body}"
-    pr_number = pr_data.get("number")
-    pr_author = ((pr_data.get("user") or {}).get("login") or "").strip()
-    open_prs = pr_data.get("_open_prs") or []
-
-    approvals_cfg = policy.get("approvals") or {}
-    required_cfg = approvals_cfg.get(base_branch) if isinstance(approvals_cfg, dict) else None
-    if not isinstance(required_cfg, dict):
-        required_cfg = {}
-
-    branch_patterns = _branch_patterns(policy)
+    def __init__(self, pr_data, commits, files, reviews, statuses, lock_index=None):
+        self.pr_data = pr_data
+        self.commits = commits
+        self.files = files
+        self.reviews = reviews
+        self.statuses = statuses
+        self.lock_index = lock_index
+
+    def lock_conflicts(self, token):
+        if self.lock_index is None:
+            self.lock_index = LockIndex(self.pr_data.get("_open_prs") or [])
+        return self.lock_index.conflicts(token, self.pr_data.get("number"))
+
+
+# Each stage pulls its inputs (raw PR data plus facts published by earlier
+# stages) and turns them into gate events and new facts. A stage's output is a
+# pure function of the compiled policy and those inputs, which is what lets
+# the incremental evaluator reuse it while its input fingerprint is unchanged.
+
+
+def _branch_inputs(compiled, source, facts):
+    pr_data = source.pr_data
+    return (
+        ((pr_data.get("base") or {}).get("ref") or "").strip(),
+        ((pr_data.get("head") or {}).get("ref") or "").strip(),
+    )
+
+
+def _branch_gates(compiled, base_branch, head_branch):
     feature_match = False
     any_match = False
-    for name, pattern in branch_patterns.items():
+    for name, pattern in compiled.branch_patterns:
         if pattern.match(head_branch):
             any_match = True
             if name == "feature":
                 feature_match = True
-    record("branch_name_regex", any_match, f"head_branch={head_branch}")
 
-    feature_to_develop = (policy.get("branch_rules") or {}).get("feature_to_develop_only", False)
+    feature_to_develop = compiled.feature_to_develop_only
     feature_to_develop_ok = (not feature_to_develop) or (not feature_match) or (base_branch == "develop")
-    record("feature_to_develop_only", feature_to_develop_ok, f"base_branch={base_branch}")
+    events = [
+        ("branch_name_regex", any_match, f"head_branch={head_branch}"),
+        ("feature_to_develop_only", feature_to_develop_ok, f"base_branch={base_branch}"),
+    ]
+    return events, {"base_branch": base_branch, "head_branch": head_branch}
+
+
+def _text_inputs(compiled, source, facts):
+    pr_data = source.pr_data
+    return (pr_data.get("title") or "", pr_data.get("body") or "")
+
 
-    issue_ref_ok = _issue_ref_present(policy, pr_text)
-    record(
-        "issue_reference_required",
-        issue_ref_ok,
-        "issue_ref_present" if issue_ref_ok else "missing_issue_ref",
+def _text_gates(compiled, pr_title, pr_body):
+    scan = scan_pr_text(pr_title, pr_body)
+    events = []
+
+    issue_ref_ok = (not compiled.issue_link_required) or scan.issue_ref_present(
+        compiled.issue_link_patterns, pr_title, pr_body
+    )
+    events.append(
+        (
+            "issue_reference_required",
+            issue_ref_ok,
+            "issue_ref_present" if issue_ref_ok else "missing_issue_ref",
+        )
     )
 
-    template_cfg = policy.get("pr_template") or {}
-    required_sections = template_cfg.get("required_sections", [])
-    placeholders = [str(x).lower() for x in template_cfg.get("reject_placeholders", [])]
-    min_len = int(template_cfg.get("min_section_length", 0) or 0)
-    section_content = _section_map(pr_body)
+    placeholders = compiled.placeholders
+    min_len = compiled.min_section_length
+    section_content = scan.sections
     missing_sections = []
     placeholder_sections = []
     short_sections = []
-    for section in required_sections:
+    for section in compiled.required_sections:
         content = section_content.get(section)
         if content is None:
             missing_sections.append(section)
@@ -188,133 +177,180 @@ def evaluate_pr(policy, pr_data, commits, files, reviews, statuses):
             short_sections.append(section)
 
     sections_ok = not missing_sections and not short_sections
-    record(
-        "pr_template_sections",
-        sections_ok,
+    events.append(
         (
-            f"missing={','.join(missing_sections)} short={','.join(short_sections)}"
-            if not sections_ok
-            else "ok"
-        ),
+            "pr_template_sections",
+            sections_ok,
+            (
+                f"missing={','.join(missing_sections)} short={','.join(short_sections)}"
+                if not sections_ok
+                else "ok"
+            ),
+        )
     )
 
     placeholders_ok = not placeholder_sections
-    record(
-        "pr_template_placeholders",
-        placeholders_ok,
+    events.append(
         (
-            f"sections={','.join(placeholder_sections)}"
-            if not placeholders_ok
-            else "ok"
-        ),
+            "pr_template_placeholders",
+            placeholders_ok,
+            (
+                f"sections={','.join(placeholder_sections)}"
+                if not placeholders_ok
+                else "ok"
+            ),
+        )
     )
 
-    high_risk_paths = tuple(policy.get("high_risk_paths", []))
-    touched_high_risk = []
-    for path in files:
-        for prefix in high_risk_paths:
-            if path.startswith(prefix):
-                touched_high_risk.append(prefix)
-                break
+    allowed_locks = compiled.allowed_locks
+    lock_tokens = scan.lock_tokens
+    selected_locks = sorted([tok for tok in lock_tokens if tok in allowed_locks])
+    return events, {
+        "missing_sections": missing_sections,
+        "placeholder_sections": placeholder_sections,
+        "short_sections": short_sections,
+        "selected_locks": selected_locks,
+        "lock_token": selected_locks[0] if selected_locks else None,
+    }
+
+
+def _path_inputs(compiled, source, facts):
+    return (source.files,)
+
+
+def _path_gates(compiled, files):
+    path_hits = compiled.path_classifier.classify_all(files)
+    touched_high_risk = [prefix for _, prefix in path_hits["high_risk"]]
     touches_high_risk = bool(touched_high_risk)
-    record(
-        "high_risk_path_detection",
-        True,
+    events = [
         (
-            f"touched={','.join(sorted(set(touched_high_risk)))}"
-            if touches_high_risk
-            else "none"
-        ),
-    )
+            "high_risk_path_detection",
+            True,
+            (
+                f"touched={','.join(sorted(set(touched_high_risk)))}"
+                if touches_high_risk
+                else "none"
+            ),
+        )
+    ]
+    required_checks, is_system_evolution = _required_status_checks(compiled, path_hits)
+    return events, {
+        "touches_high_risk": touches_high_risk,
+        "required_checks": required_checks,
+        "is_system_evolution": is_system_evolution,
+        "files_count": len(files),
+        "path_classes": observed_path_classes(path_hits),
+    }
 
-    lock_cfg = policy.get("locks") or {}
-    lock_required = touches_high_risk and bool(lock_cfg.get("required_on_high_risk", False))
-    allowed_locks = set(lock_cfg.get("allowed", []))
-    lock_tokens = _extract_lock_tokens(pr_text)
-    selected_locks = sorted([tok for tok in lock_tokens if tok in allowed_locks])
-    lock_token = selected_locks[0] if selected_locks else None
+
+def _lock_inputs(compiled, source, facts):
+    lock_token = facts["lock_token"]
+    lock_conflict_prs = []
+    if lock_token and compiled.lock_exclusive:
+        lock_conflict_prs = source.lock_conflicts(lock_token)
+    return (facts["touches_high_risk"], facts["selected_locks"], lock_token, lock_conflict_prs)
+
+
+def _lock_gates(compiled, touches_high_risk, selected_locks, lock_token, lock_conflict_prs):
+    lock_required = touches_high_risk and compiled.lock_required_on_high_risk
     lock_required_ok = (not lock_required) or bool(lock_token)
-    record(
-        "lock_required",
-        lock_required_ok,
+    events = [
         (
-            f"missing {next(iter(sorted(allowed_locks)), 'LOCK:<required>')}"
-            if not lock_required_ok
-            else "ok"
-        ),
-    )
+            "lock_required",
+            lock_required_ok,
+            (
+                f"missing {compiled.missing_lock_hint}"
+                if not lock_required_ok
+                else "ok"
+            ),
+        )
+    ]
 
-    lock_conflict_prs = []
-    if lock_token and bool(lock_cfg.get("exclusive", False)):
-        for other in open_prs:
-            other_num = other.get("number")
-            if other_num == pr_number:
-                continue
-            other_text = f"{other.get('title') or ''}\n\n{other.get('body') or ''}"
-            if lock_token in _extract_lock_tokens(other_text):
-                lock_conflict_prs.append(other_num)
     lock_exclusive_ok = len(selected_locks) <= 1 and not lock_conflict_prs
     lock_reason = "ok"
     if len(selected_locks) > 1:
         lock_reason = f"multiple_tokens={','.join(selected_locks)}"
     elif lock_conflict_prs:
         lock_reason = f"conflicts={','.join(str(x) for x in sorted(lock_conflict_prs))}"
-    record("lock_exclusive", lock_exclusive_ok, lock_reason)
+    events.append(("lock_exclusive", lock_exclusive_ok, lock_reason))
+    return events, {"lock_required": lock_required, "lock_conflict_prs": sorted(lock_conflict_prs)}
 
-    required_checks, is_system_evolution = _required_status_checks(policy, files)
+
+def _check_inputs(compiled, source, facts):
+    return (facts["required_checks"], source.statuses)
+
+
+def _check_gates(compiled, required_checks, statuses):
     status_state_by_context = _status_by_context(statuses)
     checks = []
     for ctx in required_checks:
         state = status_state_by_context.get(ctx, "missing")
         checks.append({"context": ctx, "state": state, "ok": state == "success"})
     checks_ok = all(c["ok"] for c in checks)
-    record(
-        "required_status_checks",
-        checks_ok,
+    events = [
         (
-            "missing_or_failed_checks"
-            if not checks_ok
-            else "all_required_checks_success"
-        ),
-    )
+            "required_status_checks",
+            checks_ok,
+            (
+                "missing_or_failed_checks"
+                if not checks_ok
+                else "all_required_checks_success"
+            ),
+        )
+    ]
+    return events, {"checks": checks, "checks_ok": checks_ok}
+
 
+def _approval_inputs(compiled, source, facts):
+    pr_author = ((source.pr_data.get("user") or {}).get("login") or "").strip()
+    return (source.reviews, pr_author, facts["base_branch"], facts["is_system_evolution"])
+
+
+def _approval_gates(compiled, reviews, pr_author, base_branch, is_system_evolution):
+    events = []
+    required_cfg = compiled.approvals_for(base_branch)
     approved = _latest_approved_reviews(reviews)
     approved_users = sorted({entry["login"] for entry in approved})
     author_approved = pr_author in approved_users if pr_author else False
-    disallow_self = bool(approvals_cfg.get("disallow_self_approval", False))
+    disallow_self = compiled.disallow_self_approval
     self_approval_ok = (not disallow_self) or (not author_approved)
-    record(
-        "self_approval_forbidden",
-        self_approval_ok,
-        f"author={pr_author} author_approved={author_approved}",
+    events.append(
+        (
+            "self_approval_forbidden",
+            self_approval_ok,
+            f"author={pr_author} author_approved={author_approved}",
+        )
     )
 
     effective_approvers = sorted([u for u in approved_users if u != pr_author])
-    min_approvals = int(required_cfg.get("min_approvals", 0) or 0)
-    require_human = bool(required_cfg.get("require_human_approval", False))
-    require_distinct = bool(required_cfg.get("require_distinct_reviewer", False))
+    min_approvals = required_cfg.min_approvals
+    require_human = required_cfg.require_human_approval
+    require_distinct = required_cfg.require_distinct_reviewer
 
     if is_system_evolution:
-        sys_approvals = (policy.get("system_evolution") or {}).get("approvals", {})
-        min_approvals = max(min_approvals, int(sys_approvals.get("min_approvals", 0) or 0))
-        require_human = require_human or bool(sys_approvals.get("require_human_approval", False))
+        min_approvals = max(min_approvals, compiled.system_evolution_min_approvals)
+        require_human = require_human or compiled.system_evolution_require_human
 
     min_approvals_met = len(effective_approvers) >= min_approvals
-    record(
-        "min_approvals_met",
-        min_approvals_met,
-        f"have={len(effective_approvers)} need={min_approvals}",
+    events.append(
+        (
+            "min_approvals_met",
+            min_approvals_met,
+            f"have={len(effective_approvers)} need={min_approvals}",
+        )
     )
 
     distinct_gate_ok = (not require_distinct) or bool(effective_approvers)
-    record(
-        "distinct_reviewer_required",
-        distinct_gate_ok,
+    events.append(
         (
-            f"approvers={','.join(effective_approvers)}"
-            if not distinct_gate_ok
-            else "ok"
-        ),
+            "distinct_reviewer_required",
+            distinct_gate_ok,
+            (
+                f"approvers={','.join(effective_approvers)}"
+                if not distinct_gate_ok
+                else "ok"
+            ),
+        )
     )
 
     if require_human:
@@ -328,73 +364,276 @@ def evaluate_pr(policy, pr_data, commits, files, reviews, statuses):
     else:
         human_found = True
     human_ok = human_found
-    record("human_approval_required", human_ok, f"required={require_human}")
+    events.append(("human_approval_required", human_ok, f"required={require_human}"))
+    return events, {
+        "author": pr_author,
+        "author_approved": author_approved,
+        "effective_approvers": effective_approvers,
+        "min_approvals": min_approvals,
+        "require_human": require_human,
+        "require_distinct": require_distinct,
+        "disallow_self": disallow_self,
+        "min_approvals_met": min_approvals_met,
+        "human_ok": human_ok,
+    }
 
-    if not is_system_evolution:
-        record("system_evolution_escalation", True, "inactive")
-    else:
-        system_evolution_ok = min_approvals_met and human_ok and checks_ok
-        record(
-            "system_evolution_escalation",
-            system_evolution_ok,
-            (
-                "requirements_met"
-                if system_evolution_ok
-                else (
-                    f"min_approvals_met={min_approvals_met} "
-                    f"human_approval_required={human_ok} "
-                    f"required_status_checks={checks_ok}"
-                )
-            ),
-        )
 
-    unverifiable_commits, unsigned_commits = _check_commit_signing(policy, commits)
-    signing_ok = not unverifiable_commits and not unsigned_commits
-    record(
-        "commit_signing_required",
-        signing_ok,
+def _escalation_inputs(compiled, source, facts):
+    return (
+        facts["is_system_evolution"],
+        facts["min_approvals_met"],
+        facts["human_ok"],
+        facts["checks_ok"],
+    )
+
+
+def _escalation_gates(compiled, is_system_evolution, min_approvals_met, human_ok, checks_ok):
+    if not is_system_evolution:
+        return [("system_evolution_escalation", True, "inactive")], {}
+    system_evolution_ok = min_approvals_met and human_ok and checks_ok
+    event = (
+        "system_evolution_escalation",
+        system_evolution_ok,
         (
-            f"unverifiable={len(unverifiable_commits)} unsigned={len(unsigned_commits)}"
-            if not signing_ok
-            else "all_commits_signed"
+            "requirements_met"
+            if system_evolution_ok
+            else (
+                f"min_approvals_met={min_approvals_met} "
+                f"human_approval_required={human_ok} "
+                f"required_status_checks={checks_ok}"
+            )
         ),
     )
+    return [event], {}
 
-    failed_gates = sorted(set(failed_gates))
-    passed = not failed_gates
 
+def _signing_inputs(compiled, source, facts):
+    return (source.commits,)
+
+
+def _signing_gates(compiled, commits):
+    unverifiable_commits, unsigned_commits = _check_commit_signing(compiled, commits)
+    signing_ok = not unverifiable_commits and not unsigned_commits
+    events = [
+        (
+            "commit_signing_required",
+            signing_ok,
+            (
+                f"unverifiable={len(unverifiable_commits)} unsigned={len(unsigned_commits)}"
+                if not signing_ok
+                else "all_commits_signed"
+            ),
+        )
+    ]
+    return events, {"unverifiable_commits": unverifiable_commits, "unsigned_commits": unsigned_commits}
+
+
+# (stage, inputs, gates) in gate-event order.
+GATE_STAGES = (
+    ("branch", _branch_inputs, _branch_gates),
+    ("text", _text_inputs, _text_gates),
+    ("paths", _path_inputs, _path_gates),
+    ("locks", _lock_inputs, _lock_gates),
+    ("checks", _check_inputs, _check_gates),
+    ("approvals", _approval_inputs, _approval_gates),
+    ("escalation", _escalation_inputs, _escalation_gates),
+    ("signing", _signing_inputs, _signing_gates),
+)
+
+
+# Parameter names of each stage's gates function, used to label input sizes.
+_STAGE_INPUT_NAMES = {
+    stage: tuple(inspect.signature(gates_fn).parameters)[1:] for stage, _, gates_fn in GATE_STAGES
+}
+
+
+def _attach_timing(result, stage_timings):
+    events = iter(result["gate_events"])
+    stages = {}
+    total = 0
+    for stage, duration, inputs, event_count, reused in stage_timings:
+        sizes = input_sizes(_STAGE_INPUT_NAMES.get(stage, ()), inputs)
+        stages[stage] = {"duration_ns": duration, "input_sizes": sizes, "reused": reused}
+        total += duration
+        for _ in range(event_count):
+            event = next(events)
+            event.update(stage=stage, duration_ns=duration, input_sizes=sizes, reused=reused)
+    result["timing"] = {"total_ns": total, "stages": stages}
+
+
+def _build_result(events, facts):
+    gate_events = [
+        {"gate": gate, "result": "PASS" if passed else "FAIL", "reason": str(reason)}
+        for gate, passed, reason in events
+    ]
+    failed_gates = sorted({event["gate"] for event in gate_events if event["result"] == "FAIL"})
     return {
-        "passed": passed,
-        "base_branch": base_branch,
-        "head_branch": head_branch,
-        "system_evolution": is_system_evolution,
+        "passed": not failed_gates,
+        "base_branch": facts["base_branch"],
+        "head_branch": facts["head_branch"],
+        "system_evolution": facts["is_system_evolution"],
         "failed_gates": failed_gates,
         "failed_reasons": [
             event["reason"] for event in gate_events if event["result"] == "FAIL"
         ],
         "gate_events": gate_events,
         "policy_requirements": {
-            "min_approvals": min_approvals,
-            "require_human_approval": require_human,
-            "require_distinct_reviewer": require_distinct,
-            "required_checks": required_checks,
-            "lock_required": lock_required,
-            "disallow_self_approval": disallow_self,
+            "min_approvals": facts["min_approvals"],
+            "require_human_approval": facts["require_human"],
+            "require_distinct_reviewer": facts["require_distinct"],
+            "required_checks": facts["required_checks"],
+            "lock_required": facts["lock_required"],
+            "disallow_self_approval": facts["disallow_self"],
         },
         "observed": {
-            "approvals": len(effective_approvers),
-            "approvers": effective_approvers,
-            "author": pr_author,
-            "author_approved": author_approved,
-            "checks": checks,
-            "touches_high_risk": touches_high_risk,
-            "lock_token": lock_token,
-            "lock_conflict_prs": sorted(lock_conflict_prs),
-            "missing_sections": missing_sections,
-            "placeholder_sections": placeholder_sections,
-            "short_sections": short_sections,
-            "unverifiable_commits": unverifiable_commits,
-            "unsigned_commits": unsigned_commits,
-            "files_count": len(files),
+            "approvals": len(facts["effective_approvers"]),
+            "approvers": facts["effective_approvers"],
+            "author": facts["author"],
+            "author_approved": facts["author_approved"],
+            "checks": facts["checks"],
+            "touches_high_risk": facts["touches_high_risk"],
+            "lock_token": facts["lock_token"],
+            "lock_conflict_prs": facts["lock_conflict_prs"],
+            "missing_sections": facts["missing_sections"],
+            "placeholder_sections": facts["placeholder_sections"],
+            "short_sections": facts["short_sections"],
+            "unverifiable_commits": facts["unverifiable_commits"],
+            "unsigned_commits": facts["unsigned_commits"],
+            "files_count": facts["files_count"],
+            "path_classes": facts["path_classes"],
         },
     }
+
+
+def gate_input_fingerprint(inputs):
+    payload = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def run_gate_stages(compiled, source, previous=None, timed=False):
+    """
+    Runs GATE_STAGES over `source` and returns (result, records, reused).
+    With `previous` ({stage: (fingerprint, events, facts)} from an earlier
+    run), stages whose input fingerprint is unchanged are not re-run; their
+    recorded output is merged instead. Without it nothing is fingerprinted.
+    With `timed`, each gate event and result["timing"] carry the stage's
+    monotonic duration and input sizes; otherwise no clock is read.
+    """
+    events = []
+    facts = {}
+    records = {} if previous is not None else None
+    reused = []
+    stage_timings = [] if timed else None
+    for stage, inputs_fn, gates_fn in GATE_STAGES:
+        if timed:
+            started = time.perf_counter_ns()
+        inputs = inputs_fn(compiled, source, facts)
+        if previous is None:
+            stage_events, stage_facts = gates_fn(compiled, *inputs)
+        else:
+            fingerprint = gate_input_fingerprint(inputs)
+            record = previous.get(stage)
+            if record is not None and record[0] == fingerprint:
+                stage_events, stage_facts = record[1], copy.deepcopy(record[2])
+                reused.append(stage)
+            else:
+                stage_events, stage_facts = gates_fn(compiled, *inputs)
+            records[stage] = (fingerprint, stage_events, copy.deepcopy(stage_facts))
+        if timed:
+            duration = time.perf_counter_ns() - started
+            stage_timings.append((stage, duration, inputs, len(stage_events), stage in reused))
+        events.extend(stage_events)
+        facts.update(stage_facts)
+    result = _build_result(events, facts)
+    if timed:
+        _attach_timing(result, stage_timings)
+    return result, records, reused
+
+
+def evaluate_pr(policy, pr_data, commits, files, reviews, statuses, lock_index=None, timed=False):
+    """
+    Runs every gate for one PR. `policy` is either the loaded policy mapping
+    or a CompiledPolicy; both produce identical results. Lock conflicts are
+    looked up in `lock_index`, or in one built from pr_data["_open_prs"].
+    `timed` adds per-gate durations and input sizes (see run_gate_stages).
+    """
+    compiled = compile_policy(policy)
+    source = GateInputs(pr_data, commits, files, reviews, statuses, lock_index=lock_index)
+    result, _, _ = run_gate_stages(compiled, source, timed=timed)
+    return result
+
+
+PROCESS_POOL_MIN_BATCH = 64
+_WORKER_CONTEXT = None
+
+
+def _pr_number_key(pr):
+    number = pr.get("number")
+    return (number is None, number if isinstance(number, int) else 0, str(number))
+
+
+def _evaluate_with_context(compiled, lock_index, pr, inputs, incremental=None, timed=False):
+    evaluate = incremental.evaluate if incremental is not None else evaluate_pr
+    return evaluate(
+        compiled,
+        pr,
+        inputs["commits"],
+        inputs["files"],
+        inputs["reviews"],
+        inputs["statuses"],
+        lock_index=lock_index,
+        timed=timed,
+    )
+
+
+def _init_worker(compiled, lock_index):
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (compiled, lock_index)
+
+
+def _evaluate_in_worker(entry):
+    pr, inputs = entry
+    return _evaluate_with_context(*_WORKER_CONTEXT, pr, inputs)
+
+
+def iter_evaluate_prs(policy, entries, open_prs=(), lock_index=None, incremental=None, timed=False):
+    """
+    Streaming form of evaluate_prs: evaluates (pr, inputs) pairs as they are
+    pulled from `entries` and yields (pr, result). The compiled policy and the
+    lock index are built once and shared by every PR. With an
+    IncrementalEvaluator, only gates whose inputs changed are re-run.
+    """
+    compiled = compile_policy(policy)
+    if lock_index is None:
+        lock_index = LockIndex(open_prs)
+    for pr, inputs in entries:
+        yield pr, _evaluate_with_context(compiled, lock_index, pr, inputs, incremental, timed)
+
+
+def evaluate_prs(policy, prs, inputs_by_pr, lock_index=None, processes=None):
+    """
+    Evaluates a cycle's PRs in one call and returns [(pr_number, result)] in
+    PR-number order. inputs_by_pr maps each number to its commits, files,
+    reviews and statuses. With `processes`, batches of PROCESS_POOL_MIN_BATCH
+    or more are spread over a process pool; results are identical.
+    """
+    ordered = sorted(prs, key=_pr_number_key)
+    entries = [(pr, inputs_by_pr[pr.get("number")]) for pr in ordered]
+    compiled = compile_policy(policy)
+    if lock_index is None:
+        lock_index = LockIndex(prs)
+
+    if processes and processes > 1 and len(entries) >= PROCESS_POOL_MIN_BATCH:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(compiled, lock_index),
+        ) as pool:
+            chunksize = max(1, len(entries) // (processes * 4))
+            results = list(pool.map(_evaluate_in_worker, entries, chunksize=chunksize))
+        return [(pr.get("number"), result) for pr, result in zip(ordered, results)]
+
+    return [
+        (pr.get("number"), result)
+        for pr, result in iter_evaluate_prs(compiled, entries, lock_index=lock_index)
+    ]
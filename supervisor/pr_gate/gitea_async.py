@@ -0,0 +1,439 @@
+import asyncio
+import json
+import ssl
+import time
+import urllib.error
+import urllib.parse
+from email.parser import BytesParser
+from http.client import HTTPMessage
+
+from supervisor.pr_gate import issue_ops
+from supervisor.pr_gate.gitea_client import (
+    DEFAULT_PAGE_LIMIT,
+    GiteaClientError,
+    _enrich_commits,
+    _next_page_url,
+    _normalize_api_base,
+    _require_list_response,
+    _with_page,
+)
+from supervisor.pr_gate.http_client import (
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    DEFAULT_MAX_IDLE_PER_HOST,
+    DEFAULT_TIMEOUT_SECONDS,
+    MAX_REDIRECTS,
+    REDIRECT_CODES,
+    HttpResponse,
+    _decode_json,
+    get_response_cache,
+    get_retry_policy,
+)
+from supervisor.pr_gate.logger import log_event
+from supervisor.pr_gate.retry_policy import IDEMPOTENT_METHODS
+from supervisor.pr_gate.status_publisher import VALID_STATES, StatusPublishError
+
+
+DEFAULT_ASYNC_CONCURRENCY = 8
+
+
+class _StaleConnection(Exception):
+    pass
+
+
+class AsyncConnectionPool:
+    """Non-blocking keep-alive HTTP/1.1 connections built on asyncio streams."""
+
+    def __init__(
+        self,
+        max_idle_per_host=DEFAULT_MAX_IDLE_PER_HOST,
+        idle_timeout_seconds=DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ):
+        self.max_idle_per_host = max(0, int(max_idle_per_host))
+        self.idle_timeout_seconds = float(idle_timeout_seconds)
+        self._idle = {}
+        self._ssl_context = None
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    async def _checkout(self, key):
+        now = time.monotonic()
+        idle = self._idle.get(key) or []
+        while idle:
+            reader, writer, last_used = idle.pop()
+            if now - last_used > self.idle_timeout_seconds or reader.at_eof():
+                writer.close()
+                continue
+            self.connections_reused += 1
+            return reader, writer, True
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        self.connections_opened += 1
+        return reader, writer, False
+
+    def _checkin(self, key, reader, writer):
+        idle = self._idle.setdefault(key, [])
+        if len(idle) >= self.max_idle_per_host:
+            writer.close()
+            return
+        idle.append((reader, writer, time.monotonic()))
+
+    async def close(self):
+        idle, self._idle = self._idle, {}
+        for entries in idle.values():
+            for _, writer, _ in entries:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    pass
+
+    @staticmethod
+    async def _read_body(reader, method, status, headers):
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return b"", False
+        if "chunked" in (headers.get("Transfer-Encoding") or "").lower():
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks), False
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+        length = headers.get("Content-Length")
+        if length is not None:
+            return await reader.readexactly(int(length)), False
+        return await reader.read(), True
+
+    async def _exchange(self, reader, writer, method, target, host_header, body, headers):
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host_header}"]
+        send_headers = {"Connection": "keep-alive"}
+        send_headers.update(headers or {})
+        if body is not None:
+            send_headers["Content-Length"] = str(len(body))
+        lines.extend(f"{name}: {value}" for name, value in send_headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise _StaleConnection("connection closed without a response")
+        version, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+        header_lines = []
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            header_lines.append(line)
+        response_headers = BytesParser(_class=HTTPMessage).parsebytes(b"".join(header_lines))
+        status = int(status)
+        payload, closed = await self._read_body(reader, method, status, response_headers)
+        connection = (response_headers.get("Connection") or "").lower()
+        will_close = closed or connection == "close" or (
+            version == "HTTP/1.0" and connection != "keep-alive"
+        )
+        return status, reason, response_headers, payload, will_close
+
+    async def _send_once(self, method, url, body, headers):
+        parts = urllib.parse.urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        if scheme not in ("http", "https"):
+            raise GiteaClientError(f"unsupported scheme: {scheme}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        attempts = 0
+        while True:
+            attempts += 1
+            reader, writer, reused = await self._checkout(key)
+            try:
+                status, reason, response_headers, payload, will_close = await self._exchange(
+                    reader, writer, method, target, parts.netloc, body, headers
+                )
+            except (_StaleConnection, ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError) as exc:
+                writer.close()
+                # A pooled connection may have been closed by the server while idle.
+                # Only idempotent requests are re-sent: the server may already
+                # have applied a POST/PATCH before dropping the connection.
+                if reused and attempts == 1 and method in IDEMPOTENT_METHODS:
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            except (OSError, ValueError) as exc:
+                # ValueError: a malformed status line, length or chunk size.
+                writer.close()
+                if isinstance(exc, TimeoutError):
+                    raise
+                raise urllib.error.URLError(exc) from exc
+            except BaseException:
+                # Includes cancellation: a half-read connection must never be reused.
+                writer.close()
+                raise
+            if will_close:
+                writer.close()
+            else:
+                self._checkin(key, reader, writer)
+            return HttpResponse(status, reason, response_headers, payload, url)
+
+    async def request(self, method, url, body=None, headers=None, timeout=DEFAULT_TIMEOUT_SECONDS):
+        method = method.upper()
+        current_url = url
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await asyncio.wait_for(
+                self._send_once(method, current_url, body, headers), timeout
+            )
+            location = response.headers.get("Location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response
+            if method in ("GET", "HEAD"):
+                pass
+            elif method == "POST" and response.status in (301, 302, 303):
+                method = "GET"
+                body = None
+                headers = {
+                    k: v for k, v in (headers or {}).items() if k.lower() not in ("content-type", "content-length")
+                }
+            else:
+                return response
+            current_url = urllib.parse.urljoin(current_url, location)
+        return response
+
+
+class AsyncGiteaClient:
+    """
+    asyncio counterpart of gitea_client/status_publisher; the issue/label
+    helpers run the same issue_ops operations as the supervisor's. A
+    semaphore bounds in-flight requests; run callers under
+    run_with_deadline() to cancel everything left when a cycle overruns.
+    """
+
+    def __init__(
+        self,
+        api_base,
+        headers=None,
+        concurrency=DEFAULT_ASYNC_CONCURRENCY,
+        pool=None,
+        cache=None,
+        timeout=DEFAULT_TIMEOUT_SECONDS,
+        retry_policy=None,
+    ):
+        self.api_base = _normalize_api_base(api_base)
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.pool = pool or AsyncConnectionPool()
+        self.cache = get_response_cache() if cache is None else cache
+        self.retry_policy = retry_policy or get_retry_policy()
+        self._semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def close(self):
+        await self.pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _url(self, path):
+        return f"{self.api_base}/{path.lstrip('/')}"
+
+    async def json_request(self, method, url, payload=None):
+        req_headers = {"Accept": "application/json"}
+        req_headers.update(self.headers)
+        data = None
+        if payload is not None:
+            req_headers["Content-Type"] = "application/json"
+            data = json.dumps(payload).encode("utf-8")
+
+        method = method.upper()
+        cache_key = self.cache.key(url, req_headers) if method == "GET" else None
+        validators = self.cache.validators(cache_key) if cache_key is not None else {}
+
+        def send(send_headers):
+            return lambda: self.pool.request(method, url, body=data, headers=send_headers, timeout=self.timeout)
+
+        async with self._semaphore:
+            response = await self.retry_policy.call_async(method, url, send({**req_headers, **validators}))
+            if response.status == 304 and validators:
+                entry = self.cache.not_modified(cache_key)
+                if entry is not None:
+                    return 200, entry.parsed, entry.raw, entry.headers
+                response = await self.retry_policy.call_async(method, url, send(req_headers))
+
+        raw = response.body.decode()
+        if not 200 <= response.status < 300:
+            return response.status, _decode_json(raw), raw, response.headers
+        parsed = json.loads(raw) if raw else None
+        if cache_key is not None and response.status == 200:
+            self.cache.store(cache_key, response.headers, parsed, raw)
+        return response.status, parsed, raw, response.headers
+
+    async def iter_paginated(self, url, endpoint_label, limit=DEFAULT_PAGE_LIMIT):
+        page = 1
+        seen = 0
+        next_url = _with_page(url, page, limit)
+        while next_url:
+            status, data, raw, response_headers = await self.json_request("GET", next_url)
+            items = _require_list_response(status, data, endpoint_label, raw)
+            seen += len(items)
+            for item in items:
+                yield item
+            next_url, page = _next_page_url(url, next_url, page, limit, items, seen, response_headers)
+
+    async def collect_paginated(self, url, endpoint_label, limit=DEFAULT_PAGE_LIMIT):
+        return [item async for item in self.iter_paginated(url, endpoint_label, limit=limit)]
+
+    # PR gate reads
+
+    async def get_open_pull_requests(self, owner, repo, target_branches=None):
+        if target_branches is None:
+            target_branches = {"main", "develop"}
+        url = self._url(f"repos/{owner}/{repo}/pulls?state=open")
+        selected = []
+        async for pr in self.iter_paginated(url, "pulls"):
+            base_ref = ((pr.get("base") or {}).get("ref") or "").strip()
+            if base_ref in target_branches:
+                selected.append(pr)
+        return sorted(selected, key=lambda pr: pr.get("number", 0))
+
+    async def get_pull_request_files(self, owner, repo, pr_number):
+        url = self._url(f"repos/{owner}/{repo}/pulls/{pr_number}/files")
+        entries = await self.collect_paginated(url, f"pulls/{pr_number}/files")
+        return sorted(
+            [
+                (item.get("filename") or "").strip()
+                for item in entries
+                if (item.get("filename") or "").strip()
+            ]
+        )
+
+    async def get_pull_request_reviews(self, owner, repo, pr_number):
+        url = self._url(f"repos/{owner}/{repo}/pulls/{pr_number}/reviews")
+        return await self.collect_paginated(url, f"pulls/{pr_number}/reviews")
+
+    async def get_commit_statuses(self, owner, repo, sha):
+        url = self._url(f"repos/{owner}/{repo}/commits/{sha}/statuses")
+        return await self.collect_paginated(url, f"commits/{sha}/statuses")
+
+    async def get_pull_request_commits(self, owner, repo, pr_number, head_sha):
+        url = self._url(f"repos/{owner}/{repo}/pulls/{pr_number}/commits")
+        commits = await self.collect_paginated(url, f"pulls/{pr_number}/commits")
+        # git fetch and signature probes are subprocess-bound; keep them off the loop.
+        return await asyncio.to_thread(_enrich_commits, pr_number, commits, head_sha)
+
+    async def get_pull_request_inputs(self, owner, repo, pr_number, head_sha):
+        commits, files, reviews, statuses = await asyncio.gather(
+            self.get_pull_request_commits(owner, repo, pr_number, head_sha),
+            self.get_pull_request_files(owner, repo, pr_number),
+            self.get_pull_request_reviews(owner, repo, pr_number),
+            self.get_commit_statuses(owner, repo, head_sha),
+        )
+        return {"commits": commits, "files": files, "reviews": reviews, "statuses": statuses}
+
+    # Status publishing
+
+    async def publish_governance_status(
+        self,
+        owner,
+        repo,
+        sha,
+        state,
+        description,
+        context="supervisor/governance",
+    ):
+        if state not in VALID_STATES:
+            raise StatusPublishError(f"Invalid state: {state}")
+        if "Authorization" not in self.headers:
+            raise StatusPublishError("Status publish failed: missing Authorization token header")
+
+        url = self._url(f"repos/{owner}/{repo}/statuses/{sha}")
+        payload = {"state": state, "context": context, "description": description[:140]}
+        try:
+            status, _, raw, _ = await self.json_request("POST", url, payload=payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            log_event("status_publish", f"context={context} state={state} sha={sha} http=ERR")
+            raise StatusPublishError(f"Status publish failed: url={url} error={exc}") from exc
+
+        log_event("status_publish", f"context={context} state={state} sha={sha} http={status}")
+        if status >= 400:
+            raise StatusPublishError(f"Status publish failed: HTTP {status} url={url} body={raw}")
+        if status not in (200, 201):
+            raise StatusPublishError(f"Status publish failed: HTTP {status} url={url}")
+
+    # Issue and label helpers
+
+    async def get_open_issues(self, owner, repo):
+        url = self._url(f"repos/{owner}/{repo}/issues?state=open")
+        try:
+            return await self.collect_paginated(url, "issues")
+        except GiteaClientError:
+            return []
+
+    async def get_all_issues(self, owner, repo):
+        url = self._url(f"repos/{owner}/{repo}/issues?state=all")
+        try:
+            return await self.collect_paginated(url, "issues")
+        except GiteaClientError:
+            return []
+
+    async def _run_issue_op(self, operation):
+        async def request(method, path, payload):
+            status, body, raw, _ = await self.json_request(method, self._url(path), payload=payload)
+            return status, body, raw
+        return await issue_ops.run_operation_async(operation, request)
+
+    async def get_milestones(self, owner, repo):
+        return await self._run_issue_op(issue_ops.get_milestones(owner, repo))
+
+    async def get_issue_timeline(self, owner, repo, issue_number):
+        return await self._run_issue_op(issue_ops.get_issue_timeline(owner, repo, issue_number))
+
+    async def ensure_repo_label(self, owner, repo, label_name):
+        return await self._run_issue_op(issue_ops.ensure_repo_label(owner, repo, label_name))
+
+    async def ensure_in_progress_label(self, owner, repo):
+        return await self._run_issue_op(issue_ops.ensure_in_progress_label(owner, repo))
+
+    async def attach_label_id_to_issue(self, owner, repo, issue_number, label_id):
+        return await self._run_issue_op(
+            issue_ops.attach_label_id_to_issue(owner, repo, issue_number, label_id)
+        )
+
+    async def verify_issue_has_in_progress(self, owner, repo, issue_number):
+        return await self._run_issue_op(issue_ops.verify_issue_has_in_progress(owner, repo, issue_number))
+
+    async def remove_in_progress_label(self, owner, repo, issue_number):
+        return await self._run_issue_op(issue_ops.remove_in_progress_label(owner, repo, issue_number))
+
+    async def post_issue_comment(self, owner, repo, issue_number, body):
+        return await self._run_issue_op(issue_ops.post_issue_comment(owner, repo, issue_number, body))
+
+    async def close_issue(self, owner, repo, issue_number):
+        return await self._run_issue_op(issue_ops.close_issue(owner, repo, issue_number))
+
+    # Cycle-level overlap
+
+    async def fetch_cycle_snapshot(self, owner, repo, target_branches=None):
+        """Fetches the open PRs, open issues and milestones of one cycle concurrently."""
+        open_prs, open_issues, milestones = await asyncio.gather(
+            self.get_open_pull_requests(owner, repo, target_branches=target_branches),
+            self.get_open_issues(owner, repo),
+            self.get_milestones(owner, repo),
+        )
+        return {"open_prs": open_prs, "open_issues": open_issues, "milestones": milestones}
+
+
+async def run_with_deadline(coro, deadline_seconds):
+    """Awaits coro, cancelling it (and every request it started) past the deadline."""
+    return await asyncio.wait_for(coro, deadline_seconds)
@@ -1,8 +1,17 @@
-import json
 import re
 import subprocess
-import urllib.error
-import urllib.request
+import threading
+import time
+import urllib.parse
+
+from supervisor.pr_gate.http_client import json_request
+from supervisor.pr_gate.logger import log_event
+from supervisor.pr_gate.signature_verifier import get_signature_verifier
+
+
+DEFAULT_PAGE_LIMIT = 50
+PR_HEADS_REFSPEC = "+refs/pull/*/head:refs/pull/*/head"
+_GIT_FETCH_LOCK = threading.Lock()
 
 
 class GiteaClientError(Exception):
@@ -20,32 +29,6 @@ def _normalize_api_base(api_base):
     return base + "/api/v1"
 
 
-def _api_json_request(method, url, payload=None, headers=None):
-    req_headers = {"Accept": "application/json"}
-    if headers:
-        req_headers.update(headers)
-    data = None
-    if payload is not None:
-        req_headers["Content-Type"] = "application/json"
-        data = json.dumps(payload).encode("utf-8")
-
-    req = urllib.request.Request(url, data=data, headers=req_headers, method=method)
-    try:
-        with urllib.request.urlopen(req, timeout=5) as response:
-            raw = response.read().decode()
-            parsed = json.loads(raw) if raw else None
-            return response.status, parsed, raw
-    except urllib.error.HTTPError as e:
-        raw = e.read().decode() if e.fp else ""
-        parsed = None
-        if raw:
-            try:
-                parsed = json.loads(raw)
-            except Exception:
-                parsed = None
-        return e.code, parsed, raw
-
-
 def _require_list_response(status, data, endpoint_label, raw):
     if status != 200 or not isinstance(data, list):
         raise GiteaClientError(
@@ -54,48 +37,112 @@ def _require_list_response(status, data, endpoint_label, raw):
     return data
 
 
-def get_open_pull_requests(api_base, owner, repo, headers=None, target_branches=None):
+def _with_page(url, page, limit):
+    parts = urllib.parse.urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key not in ("page", "limit")
+    ]
+    query.extend([("page", str(page)), ("limit", str(limit))])
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+def _link_next(link_header):
+    for part in (link_header or "").split(","):
+        match = re.match(r'\s*<([^>]+)>\s*;(.*)$', part)
+        if match and re.search(r'\brel="?next"?', match.group(2)):
+            return match.group(1)
+    return None
+
+
+def _next_page_url(url, current_url, page, limit, items, seen, response_headers):
+    if not items:
+        return None, page
+    link_header = response_headers.get("Link") if response_headers is not None else None
+    if link_header:
+        next_link = _link_next(link_header)
+        return (urllib.parse.urljoin(current_url, next_link) if next_link else None), page + 1
+
+    total = response_headers.get("X-Total-Count") if response_headers is not None else None
+    if total is not None and str(total).strip().isdigit():
+        if seen >= int(total):
+            return None, page
+    elif len(items) < limit:
+        return None, page
+    return _with_page(url, page + 1, limit), page + 1
+
+
+def iter_paginated(url, endpoint_label, headers=None, limit=DEFAULT_PAGE_LIMIT):
+    """
+    Yields list items across Gitea pages, fetching the next page only when the
+    caller consumes past the current one. Follows the Link rel="next" header,
+    falling back to X-Total-Count or a short page when no Link header is sent.
+    """
+    page = 1
+    seen = 0
+    next_url = _with_page(url, page, limit)
+    while next_url:
+        status, data, raw, response_headers = json_request("GET", next_url, headers=headers)
+        items = _require_list_response(status, data, endpoint_label, raw)
+        seen += len(items)
+        yield from items
+        next_url, page = _next_page_url(url, next_url, page, limit, items, seen, response_headers)
+
+
+def collect_paginated(url, endpoint_label, headers=None, limit=DEFAULT_PAGE_LIMIT):
+    return list(iter_paginated(url, endpoint_label, headers=headers, limit=limit))
+
+
+def iter_open_pull_requests(api_base, owner, repo, headers=None, target_branches=None):
     if target_branches is None:
         target_branches = {"main", "develop"}
     base = _normalize_api_base(api_base)
-    url = f"{base}/repos/{owner}/{repo}/pulls?state=open&limit=300"
-    status, data, raw = _api_json_request("GET", url, headers=headers)
-    pulls = _require_list_response(status, data, "pulls", raw)
-
-    selected = []
-    for pr in pulls:
+    url = f"{base}/repos/{owner}/{repo}/pulls?state=open"
+    for pr in iter_paginated(url, "pulls", headers=headers):
         base_ref = ((pr.get("base") or {}).get("ref") or "").strip()
         if base_ref in target_branches:
-            selected.append(pr)
+            yield pr
+
+
+def get_open_pull_requests(api_base, owner, repo, headers=None, target_branches=None):
+    selected = iter_open_pull_requests(
+        api_base, owner, repo, headers=headers, target_branches=target_branches
+    )
     return sorted(selected, key=lambda pr: pr.get("number", 0))
 
 
-def get_pull_request_files(api_base, owner, repo, pr_number, headers=None):
+def iter_pull_request_files(api_base, owner, repo, pr_number, headers=None):
     base = _normalize_api_base(api_base)
     url = f"{base}/repos/{owner}/{repo}/pulls/{pr_number}/files"
-    status, data, raw = _api_json_request("GET", url, headers=headers)
-    file_entries = _require_list_response(status, data, f"pulls/{pr_number}/files", raw)
-    return sorted(
-        [
-            (item.get("filename") or "").strip()
-            for item in file_entries
-            if (item.get("filename") or "").strip()
-        ]
-    )
+    for item in iter_paginated(url, f"pulls/{pr_number}/files", headers=headers):
+        filename = (item.get("filename") or "").strip()
+        if filename:
+            yield filename
 
 
-def get_pull_request_reviews(api_base, owner, repo, pr_number, headers=None):
+def get_pull_request_files(api_base, owner, repo, pr_number, headers=None):
+    return sorted(iter_pull_request_files(api_base, owner, repo, pr_number, headers=headers))
+
+
+def iter_pull_request_reviews(api_base, owner, repo, pr_number, headers=None):
     base = _normalize_api_base(api_base)
     url = f"{base}/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
-    status, data, raw = _api_json_request("GET", url, headers=headers)
-    return _require_list_response(status, data, f"pulls/{pr_number}/reviews", raw)
+    return iter_paginated(url, f"pulls/{pr_number}/reviews", headers=headers)
 
 
-def get_commit_statuses(api_base, owner, repo, sha, headers=None):
+def get_pull_request_reviews(api_base, owner, repo, pr_number, headers=None):
+    return list(iter_pull_request_reviews(api_base, owner, repo, pr_number, headers=headers))
+
+
+def iter_commit_statuses(api_base, owner, repo, sha, headers=None):
     base = _normalize_api_base(api_base)
     url = f"{base}/repos/{owner}/{repo}/commits/{sha}/statuses"
-    status, data, raw = _api_json_request("GET", url, headers=headers)
-    return _require_list_response(status, data, f"commits/{sha}/statuses", raw)
+    return iter_paginated(url, f"commits/{sha}/statuses", headers=headers)
+
+
+def get_commit_statuses(api_base, owner, repo, sha, headers=None):
+    return list(iter_commit_statuses(api_base, owner, repo, sha, headers=headers))
 
 
 def _detect_gitea_signature(commit):
@@ -110,87 +157,93 @@ def _detect_gitea_signature(commit):
     }
 
 
-def _fetch_pr_ref(pr_number):
+def _commits_present(shas):
+    resolved = get_signature_verifier().resolve_commits(shas)
+    return {sha for sha, commit_id in resolved.items() if commit_id is not None}
+
+
+def _log_fetch_metric(scope, started, ok, **fields):
+    extra = "".join(f" {key}={value}" for key, value in fields.items())
+    log_event(
+        "pr_gate_metrics",
+        f"git_fetch scope={scope} ok={str(ok).lower()} duration_ms={(time.monotonic() - started) * 1000:.1f}{extra}",
+    )
+
+
+def prefetch_pull_request_heads(head_shas):
+    """
+    Fetches every open PR head with one wildcard refspec into refs/pull/*/head,
+    unless all of head_shas are already local. Returns True when nothing is missing.
+    """
+    missing = set(head_shas) - _commits_present(list(head_shas))
+    if not missing:
+        return True
+    started = time.monotonic()
+    with _GIT_FETCH_LOCK:
+        result = subprocess.run(
+            ["git", "fetch", "--quiet", "origin", PR_HEADS_REFSPEC],
+            capture_output=True,
+            text=True,
+        )
+    _log_fetch_metric("bulk", started, result.returncode == 0, missing=len(missing))
+    return result.returncode == 0
+
+
+def _fetch_pr_ref(pr_number, head_sha=None):
+    if head_sha and _commits_present([head_sha]):
+        return True
     candidates = [
         ["git", "fetch", "--quiet", "origin", f"refs/pull/{pr_number}/head"],
         ["git", "fetch", "--quiet", "origin", f"pull/{pr_number}/head"],
     ]
-    for cmd in candidates:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            return True
+    started = time.monotonic()
+    # Concurrent PR fetches share one repository; serialize writes to FETCH_HEAD.
+    with _GIT_FETCH_LOCK:
+        for cmd in candidates:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode == 0:
+                _log_fetch_metric("pr", started, True, pr=pr_number)
+                return True
+    _log_fetch_metric("pr", started, False, pr=pr_number)
     return False
 
 
-def _local_signature_probe(sha):
-    exists = subprocess.run(
-        ["git", "cat-file", "-e", f"{sha}^{{commit}}"],
-        capture_output=True,
-        text=True,
-    )
-    if exists.returncode != 0:
-        return {
-            "signature_verifiable": False,
-            "signature_verified": False,
-            "signature_source": "local_git",
-            "signature_reason": "commit_not_found",
-        }
-
-    probe = subprocess.run(
-        ["git", "log", "--show-signature", "-n", "1", "--format=%H", sha],
-        capture_output=True,
-        text=True,
-    )
-    text = f"{probe.stdout}\n{probe.stderr}"
-    if re.search(r"Good .* signature", text):
-        sig_type = "ssh" if "Good \"git\" signature" in text else "gpg"
-        return {
-            "signature_verifiable": True,
-            "signature_verified": True,
-            "signature_source": "local_git",
-            "signature_type": sig_type,
-            "signature_reason": "good_signature",
-        }
-    if "No signature" in text or "BAD signature" in text or "bad signature" in text:
-        return {
-            "signature_verifiable": True,
-            "signature_verified": False,
-            "signature_source": "local_git",
-            "signature_reason": "missing_or_bad_signature",
-        }
-    if "Can't check signature" in text or "No public key" in text:
-        return {
-            "signature_verifiable": False,
-            "signature_verified": False,
-            "signature_source": "local_git",
-            "signature_reason": "unverifiable_key",
-        }
-    return {
-        "signature_verifiable": False,
-        "signature_verified": False,
-        "signature_source": "local_git",
-        "signature_reason": "unknown_signature_output",
-    }
-
-
-def get_pull_request_commits(api_base, owner, repo, pr_number, head_sha, headers=None):
-    base = _normalize_api_base(api_base)
-    url = f"{base}/repos/{owner}/{repo}/pulls/{pr_number}/commits"
-    status, data, raw = _api_json_request("GET", url, headers=headers)
-    commits = _require_list_response(status, data, f"pulls/{pr_number}/commits", raw)
-
-    _fetch_pr_ref(pr_number)
+def _enrich_commits(pr_number, commits, head_sha=None):
+    _fetch_pr_ref(pr_number, head_sha)
 
     enriched = []
+    unverified = []
     for commit in commits:
         enriched_commit = dict(commit)
         sig = _detect_gitea_signature(enriched_commit)
         if sig is None:
-            sha = enriched_commit.get("sha") or ""
-            sig = _local_signature_probe(sha)
-        enriched_commit.update(sig)
+            unverified.append(enriched_commit)
+        else:
+            enriched_commit.update(sig)
         enriched.append(enriched_commit)
 
+    if unverified:
+        local = get_signature_verifier().verify([c.get("sha") or "" for c in unverified])
+        for enriched_commit in unverified:
+            enriched_commit.update(local[enriched_commit.get("sha") or ""])
+
     if not enriched:
         raise GiteaClientError(f"PR gate API failure endpoint=pulls/{pr_number}/commits status=200 body=empty")
     return enriched
+
+
+def get_pull_request_commit_list(api_base, owner, repo, pr_number, headers=None):
+    """The PR's commits as Gitea returns them, without local signature checks."""
+    base = _normalize_api_base(api_base)
+    url = f"{base}/repos/{owner}/{repo}/pulls/{pr_number}/commits"
+    return collect_paginated(url, f"pulls/{pr_number}/commits", headers=headers)
+
+
+def enrich_pull_request_commits(pr_number, commits, head_sha=None):
+    """Adds signature fields to a commit list (verified locally when Gitea has none)."""
+    return _enrich_commits(pr_number, commits, head_sha)
+
+
+def get_pull_request_commits(api_base, owner, repo, pr_number, head_sha, headers=None):
+    commits = get_pull_request_commit_list(api_base, owner, repo, pr_number, headers=headers)
+    return _enrich_commits(pr_number, commits, head_sha)
@@ -0,0 +1,236 @@
+import http.client
+import json
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+from collections import namedtuple
+
+from supervisor.pr_gate.response_cache import ConditionalResponseCache
+from supervisor.pr_gate.retry_policy import IDEMPOTENT_METHODS, retry_policy_from_env
+
+
+DEFAULT_TIMEOUT_SECONDS = 5
+DEFAULT_MAX_IDLE_PER_HOST = 8
+DEFAULT_IDLE_TIMEOUT_SECONDS = 30
+MAX_REDIRECTS = 5
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+HttpResponse = namedtuple("HttpResponse", ["status", "reason", "headers", "body", "url"])
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections, reused per (scheme, host, port)."""
+
+    def __init__(
+        self,
+        max_idle_per_host=DEFAULT_MAX_IDLE_PER_HOST,
+        idle_timeout_seconds=DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ):
+        self.max_idle_per_host = max(0, int(max_idle_per_host))
+        self.idle_timeout_seconds = float(idle_timeout_seconds)
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = None
+        self.connections_opened = 0
+        self.connections_reused = 0
+
+    def _new_connection(self, key, timeout):
+        scheme, host, port = key
+        with self._lock:
+            self.connections_opened += 1
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _checkout(self, key, timeout):
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key) or []
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used > self.idle_timeout_seconds:
+                    conn.close()
+                    continue
+                self.connections_reused += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._new_connection(key, timeout), False
+
+    def _checkin(self, key, conn):
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            fresh = []
+            for entry in idle:
+                if now - entry[1] > self.idle_timeout_seconds:
+                    entry[0].close()
+                else:
+                    fresh.append(entry)
+            if len(fresh) >= self.max_idle_per_host:
+                conn.close()
+            else:
+                fresh.append((conn, now))
+            self._idle[key] = fresh
+
+    def idle_count(self, key=None):
+        with self._lock:
+            if key is not None:
+                return len(self._idle.get(key) or [])
+            return sum(len(v) for v in self._idle.values())
+
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+            self._idle = {}
+
+    def _send_once(self, method, url, body, headers, timeout):
+        parts = urllib.parse.urlsplit(url)
+        scheme = (parts.scheme or "http").lower()
+        if scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported scheme: {scheme}")
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        send_headers = {"Connection": "keep-alive"}
+        send_headers.update(headers or {})
+
+        attempts = 0
+        while True:
+            attempts += 1
+            conn, reused = self._checkout(key, timeout)
+            try:
+                conn.request(method, target, body=body, headers=send_headers)
+                response = conn.getresponse()
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                # A pooled connection may have been closed by the server while idle.
+                # Only idempotent requests are re-sent: the server may already
+                # have applied a POST/PATCH before dropping the connection.
+                if reused and attempts == 1 and method in IDEMPOTENT_METHODS:
+                    continue
+                raise urllib.error.URLError(exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                if isinstance(exc, TimeoutError):
+                    raise
+                raise urllib.error.URLError(exc) from exc
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return HttpResponse(response.status, response.reason, response.headers, payload, url)
+
+    def request(self, method, url, body=None, headers=None, timeout=DEFAULT_TIMEOUT_SECONDS):
+        method = method.upper()
+        current_url = url
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send_once(method, current_url, body, headers, timeout)
+            location = response.headers.get("Location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response
+            # Mirror urllib's redirect handling: GET/HEAD follow every redirect,
+            # POST follows 301/302/303 as a bodyless GET, everything else stops.
+            if method in ("GET", "HEAD"):
+                pass
+            elif method == "POST" and response.status in (301, 302, 303):
+                method = "GET"
+                body = None
+                headers = {
+                    k: v for k, v in (headers or {}).items() if k.lower() not in ("content-type", "content-length")
+                }
+            else:
+                return response
+            current_url = urllib.parse.urljoin(current_url, location)
+        return response
+
+
+_DEFAULT_POOL = ConnectionPool()
+_DEFAULT_RESPONSE_CACHE = ConditionalResponseCache()
+_DEFAULT_RETRY_POLICY = retry_policy_from_env()
+
+
+def get_pool():
+    return _DEFAULT_POOL
+
+
+def get_response_cache():
+    return _DEFAULT_RESPONSE_CACHE
+
+
+def get_retry_policy():
+    return _DEFAULT_RETRY_POLICY
+
+
+def request(
+    method,
+    url,
+    body=None,
+    headers=None,
+    timeout=DEFAULT_TIMEOUT_SECONDS,
+    pool=None,
+    retry_policy=None,
+):
+    pool = pool or _DEFAULT_POOL
+    retry_policy = retry_policy or _DEFAULT_RETRY_POLICY
+    return retry_policy.call(
+        method,
+        url,
+        lambda: pool.request(method, url, body=body, headers=headers, timeout=timeout),
+    )
+
+
+def _decode_json(raw):
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except Exception:
+        return None
+
+
+def json_request(method, url, payload=None, headers=None, timeout=DEFAULT_TIMEOUT_SECONDS, cache=None):
+    """
+    Returns (status, parsed_json, raw_text, response_headers) for a Gitea API call.
+    GETs are sent as conditional requests when a cached ETag/Last-Modified exists;
+    a 304 answer returns the cached payload as a 200 without re-parsing it.
+    """
+    req_headers = {"Accept": "application/json"}
+    if headers:
+        req_headers.update(headers)
+    data = None
+    if payload is not None:
+        req_headers["Content-Type"] = "application/json"
+        data = json.dumps(payload).encode("utf-8")
+
+    method = method.upper()
+    cache = _DEFAULT_RESPONSE_CACHE if cache is None else cache
+    cache_key = cache.key(url, req_headers) if method == "GET" else None
+    validators = cache.validators(cache_key) if cache_key is not None else {}
+
+    response = request(method, url, body=data, headers={**req_headers, **validators}, timeout=timeout)
+    if response.status == 304 and validators:
+        entry = cache.not_modified(cache_key)
+        if entry is not None:
+            return 200, entry.parsed, entry.raw, entry.headers
+        response = request(method, url, body=data, headers=req_headers, timeout=timeout)
+
+    raw = response.body.decode()
+    if not 200 <= response.status < 300:
+        return response.status, _decode_json(raw), raw, response.headers
+    parsed = json.loads(raw) if raw else None
+    if cache_key is not None and response.status == 200:
+        cache.store(cache_key, response.headers, parsed, raw)
+    return response.status, parsed, raw, response.headers
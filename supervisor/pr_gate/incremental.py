@@ -0,0 +1,94 @@
+import os
+
+from supervisor.pr_gate.compiled_policy import compile_policy
+from supervisor.pr_gate.evaluator import GateInputs, evaluate_pr, run_gate_stages
+from supervisor.pr_gate.logger import log_event
+from supervisor.pr_gate.timing import strip_timing
+
+
+DEFAULT_SELF_CHECK_EVERY = 50
+
+
+class IncrementalEvaluator:
+    """
+    Per-PR memory of each gate stage's input fingerprint and output. A PR
+    re-evaluated after, say, a new review re-runs only the approval stages and
+    merges the rest. Every `self_check_every` incremental evaluations the full
+    evaluate_pr runs as well; on a mismatch the full result wins and the PR's
+    records are dropped.
+    """
+
+    def __init__(self, self_check_every=DEFAULT_SELF_CHECK_EVERY):
+        self.self_check_every = self_check_every
+        self._records = {}
+        self._unchecked = 0
+        self.evaluations = 0
+        self.stages_run = 0
+        self.stages_reused = 0
+        self.self_checks = 0
+        self.self_check_mismatches = 0
+
+    def evaluate(self, policy, pr_data, commits, files, reviews, statuses, lock_index=None, timed=False):
+        compiled = compile_policy(policy)
+        if compiled.policy_hash is None:
+            # Without a policy hash there is nothing to key reuse on.
+            return evaluate_pr(
+                compiled, pr_data, commits, files, reviews, statuses, lock_index=lock_index, timed=timed
+            )
+
+        pr_number = pr_data.get("number")
+        entry = self._records.get(pr_number)
+        previous = entry[1] if entry is not None and entry[0] == compiled.policy_hash else {}
+        source = GateInputs(pr_data, commits, files, reviews, statuses, lock_index=lock_index)
+        result, records, reused = run_gate_stages(compiled, source, previous=previous, timed=timed)
+        self._records[pr_number] = (compiled.policy_hash, records)
+        self.evaluations += 1
+        self.stages_reused += len(reused)
+        self.stages_run += len(records) - len(reused)
+
+        if reused:
+            self._unchecked += 1
+        if reused and self.self_check_every and self._unchecked >= self.self_check_every:
+            self._unchecked = 0
+            self.self_checks += 1
+            full = evaluate_pr(compiled, pr_data, commits, files, reviews, statuses, lock_index=source.lock_index)
+            if full != (strip_timing(result) if timed else result):
+                self.self_check_mismatches += 1
+                self._records.pop(pr_number, None)
+                log_event(
+                    "evaluate_pr",
+                    f"INCREMENTAL_MISMATCH pr={pr_number} reused={','.join(reused)}",
+                )
+                return full
+        return result
+
+    def retain(self, pr_numbers):
+        """Forgets every PR not in pr_numbers (e.g. closed since the last cycle)."""
+        keep = set(pr_numbers)
+        for pr_number in [n for n in self._records if n not in keep]:
+            del self._records[pr_number]
+
+    def forget(self, pr_number):
+        self._records.pop(pr_number, None)
+
+    def stats(self):
+        return {
+            "prs": len(self._records),
+            "evaluations": self.evaluations,
+            "stages_run": self.stages_run,
+            "stages_reused": self.stages_reused,
+            "self_checks": self.self_checks,
+            "self_check_mismatches": self.self_check_mismatches,
+        }
+
+
+def incremental_evaluator_from_env():
+    """PR_GATE_INCREMENTAL=0 disables reuse; PR_GATE_INCREMENTAL_SELF_CHECK_EVERY sets the cadence."""
+    if os.environ.get("PR_GATE_INCREMENTAL", "1").strip() == "0":
+        return None
+    raw = os.environ.get("PR_GATE_INCREMENTAL_SELF_CHECK_EVERY", "")
+    try:
+        every = int(raw) if raw else DEFAULT_SELF_CHECK_EVERY
+    except ValueError:
+        every = DEFAULT_SELF_CHECK_EVERY
+    return IncrementalEvaluator(self_check_every=max(0, every))
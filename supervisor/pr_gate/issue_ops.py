@@ -0,0 +1,182 @@
+IN_PROGRESS_LABEL = "in-progress"
+IN_PROGRESS_COLOR = "f29513"
+IN_PROGRESS_DESCRIPTION = "Task currently claimed by supervisor"
+
+
+# Each operation is a generator that yields (method, path, payload) requests,
+# with path relative to the API base, and is sent back (status, body, raw).
+# run_operation() drives one with blocking requests (the supervisor helpers),
+# run_operation_async() with awaitable ones (AsyncGiteaClient), so the URLs,
+# payloads and failure handling live here only.
+
+
+def run_operation(operation, request):
+    """Runs operation to completion; request(method, path, payload) returns (status, body, raw)."""
+    try:
+        call = next(operation)
+        while True:
+            call = operation.send(request(*call))
+    except StopIteration as done:
+        return done.value
+
+
+async def run_operation_async(operation, request):
+    """run_operation() for an async request(method, path, payload)."""
+    try:
+        call = next(operation)
+        while True:
+            call = operation.send(await request(*call))
+    except StopIteration as done:
+        return done.value
+
+
+def _find_label_id(labels, name):
+    for label in labels:
+        if label.get("name") == name:
+            return label.get("id")
+    return None
+
+
+def get_milestones(owner, repo):
+    status, body, raw = yield "GET", f"repos/{owner}/{repo}/milestones?state=all", None
+    if status != 200 or not isinstance(body, list):
+        print(f"Failed to list milestones. Status={status}. Body={raw}")
+        return []
+    return body
+
+
+def get_issue_timeline(owner, repo, issue_number):
+    """Timeline events of an issue, or None when they cannot be listed."""
+    status, body, _ = yield "GET", f"repos/{owner}/{repo}/issues/{issue_number}/timeline", None
+    if status != 200 or not isinstance(body, list):
+        return None
+    return body
+
+
+def ensure_repo_label(owner, repo, label_name):
+    labels_path = f"repos/{owner}/{repo}/labels"
+    status, labels, raw = yield "GET", labels_path, None
+    if status != 200 or not isinstance(labels, list):
+        print(f"Failed to list labels. Status={status}. Body={raw}")
+        return None
+    label_id = _find_label_id(labels, label_name)
+    if label_id is not None:
+        return label_id
+
+    create_payload = {
+        "name": label_name,
+        "color": "0e8a16",
+        "description": f"{label_name} label",
+    }
+    create_status, created, create_raw = yield "POST", labels_path, create_payload
+    if create_status in (200, 201) and isinstance(created, dict):
+        return created.get("id")
+    print(
+        f"Failed to create '{label_name}' label. "
+        f"Status={create_status}. Body={create_raw}"
+    )
+    return None
+
+
+def ensure_in_progress_label(owner, repo):
+    labels_path = f"repos/{owner}/{repo}/labels"
+    status, labels, raw = yield "GET", labels_path, None
+    if status != 200 or not isinstance(labels, list):
+        print(f"Failed to list labels. Status={status}. Body={raw}")
+        return None
+    label_id = _find_label_id(labels, IN_PROGRESS_LABEL)
+    if label_id is not None:
+        return label_id
+
+    create_payload = {
+        "name": IN_PROGRESS_LABEL,
+        "color": IN_PROGRESS_COLOR,
+        "description": IN_PROGRESS_DESCRIPTION,
+    }
+    create_status, created, create_raw = yield "POST", labels_path, create_payload
+    if create_status in (200, 201) and isinstance(created, dict):
+        return created.get("id")
+
+    print(
+        "Failed to create 'in-progress' label. "
+        f"Status={create_status}. Body={create_raw}"
+    )
+
+    # Label may already exist due to race; re-fetch once.
+    status, labels, raw = yield "GET", labels_path, None
+    if status != 200 or not isinstance(labels, list):
+        print(f"Failed to re-list labels. Status={status}. Body={raw}")
+        return None
+    return _find_label_id(labels, IN_PROGRESS_LABEL)
+
+
+def attach_label_id_to_issue(owner, repo, issue_number, label_id):
+    path = f"repos/{owner}/{repo}/issues/{issue_number}/labels"
+    status, _, raw = yield "POST", path, {"labels": [label_id]}
+    if status in (200, 201):
+        return True
+    print(
+        f"Failed to attach label id {label_id} to issue #{issue_number}. "
+        f"Status={status}. Body={raw}"
+    )
+    return False
+
+
+def verify_issue_has_in_progress(owner, repo, issue_number):
+    status, labels, raw = yield "GET", f"repos/{owner}/{repo}/issues/{issue_number}/labels", None
+    if status != 200 or not isinstance(labels, list):
+        print(
+            f"Failed to verify labels for issue #{issue_number}. "
+            f"Status={status}. Body={raw}"
+        )
+        print("CLAIM_VERIFIED in-progress present=false")
+        return False
+
+    present = any(lbl.get("name") == IN_PROGRESS_LABEL for lbl in labels)
+    print(f"CLAIM_VERIFIED in-progress present={str(present).lower()}")
+    return present
+
+
+def remove_in_progress_label(owner, repo, issue_number):
+    labels_path = f"repos/{owner}/{repo}/issues/{issue_number}/labels"
+    status, labels, raw = yield "GET", labels_path, None
+    if status != 200 or not isinstance(labels, list):
+        print(
+            f"Failed to list issue labels for #{issue_number}. "
+            f"Status={status}. Body={raw}"
+        )
+        return False
+
+    target = next((lbl for lbl in labels if lbl.get("name") == IN_PROGRESS_LABEL), None)
+    if target is None:
+        return True
+
+    label_id = target.get("id")
+    if label_id is None:
+        return False
+
+    del_status, _, del_raw = yield "DELETE", f"{labels_path}/{label_id}", None
+    if del_status not in (200, 204):
+        print(
+            f"Failed to remove in-progress label from #{issue_number}. "
+            f"Status={del_status}. Body={del_raw}"
+        )
+        return False
+    return True
+
+
+def post_issue_comment(owner, repo, issue_number, body):
+    path = f"repos/{owner}/{repo}/issues/{issue_number}/comments"
+    status, _, raw = yield "POST", path, {"body": body}
+    if status not in (200, 201):
+        print(f"Failed to post issue comment for #{issue_number}. Status={status}. Body={raw}")
+        return False
+    return True
+
+
+def close_issue(owner, repo, issue_number):
+    status, _, raw = yield "PATCH", f"repos/{owner}/{repo}/issues/{issue_number}", {"state": "closed"}
+    if status not in (200, 201):
+        print(f"Failed to close issue #{issue_number}. Status={status}. Body={raw}")
+        return False
+    return True
@@ -1,9 +1,156 @@
+import os
+import sqlite3
+import threading
+import time
+
+from supervisor.pr_gate.body_scanner import LOCK_TOKEN_RE, scan_pr_text
+
+
+def extract_lock_tokens(text):
+    return LOCK_TOKEN_RE.findall(text or "")
+
+
+DEFAULT_EVAL_CACHE_PATH = "artifacts/governance/eval-cache.sqlite3"
+
+
 class EvaluationCache:
-    def __init__(self):
-        self._seen = set()
+    """
+    (pr_number, head_sha, policy_hash) verdicts already published. With a
+    `path`, entries persist in SQLite and are loaded on first use, so a
+    restarted supervisor does not re-evaluate and re-publish every open PR.
+    retain() drops entries for closed PRs and moved heads.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._seen = None
+        self._conn = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _entries(self):
+        if self._seen is None:
+            self._seen = set()
+            if self.path:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS evaluation_cache ("
+                    "pr_number NOT NULL, head_sha TEXT NOT NULL, policy_hash TEXT NOT NULL, "
+                    "evaluated_at REAL NOT NULL, PRIMARY KEY (pr_number, head_sha, policy_hash))"
+                )
+                conn.commit()
+                self._seen.update(
+                    tuple(row)
+                    for row in conn.execute("SELECT pr_number, head_sha, policy_hash FROM evaluation_cache")
+                )
+                self._conn = conn
+        return self._seen
+
+    def _delete(self, keys):
+        if self._conn is not None and keys:
+            self._conn.executemany(
+                "DELETE FROM evaluation_cache WHERE pr_number = ? AND head_sha = ? AND policy_hash = ?",
+                list(keys),
+            )
+            self._conn.commit()
 
     def seen(self, pr_number, head_sha, policy_hash):
-        return (pr_number, head_sha, policy_hash) in self._seen
+        with self._lock:
+            found = (pr_number, head_sha, policy_hash) in self._entries()
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return found
 
     def mark(self, pr_number, head_sha, policy_hash):
-        self._seen.add((pr_number, head_sha, policy_hash))
+        key = (pr_number, head_sha, policy_hash)
+        with self._lock:
+            entries = self._entries()
+            if key in entries:
+                return
+            entries.add(key)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO evaluation_cache (pr_number, head_sha, policy_hash, evaluated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (*key, time.time()),
+                )
+                self._conn.commit()
+
+    def invalidate(self, pr_number=None, head_sha=None):
+        with self._lock:
+            entries = self._entries()
+            dropped = {
+                key
+                for key in entries
+                if (pr_number is not None and key[0] == pr_number)
+                or (head_sha is not None and key[1] == head_sha)
+            }
+            entries.difference_update(dropped)
+            self._delete(dropped)
+
+    def retain(self, open_heads, policy_hash=None):
+        """Keeps only entries for open PRs at their current head (and policy_hash, if given)."""
+        with self._lock:
+            entries = self._entries()
+            dropped = {
+                key
+                for key in entries
+                if open_heads.get(key[0]) != key[1] or (policy_hash is not None and key[2] != policy_hash)
+            }
+            entries.difference_update(dropped)
+            self._delete(dropped)
+            return len(dropped)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._seen or ()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._seen = None
+
+
+def evaluation_cache_from_env():
+    path = os.environ.get("PR_GATE_EVAL_CACHE_PATH", DEFAULT_EVAL_CACHE_PATH).strip()
+    return EvaluationCache(path=path or None)
+
+
+class LockIndex:
+    """
+    LOCK: token -> numbers of the open PRs whose title or body carries it,
+    built once per cycle so exclusive-lock checks are lookups, not rescans.
+    """
+
+    def __init__(self, open_prs=()):
+        self._holders = {}
+        for pr in open_prs:
+            for token in dict.fromkeys(scan_pr_text(pr.get("title"), pr.get("body")).lock_tokens):
+                self._holders.setdefault(token, []).append(pr.get("number"))
+
+    def holders(self, token):
+        return list(self._holders.get(token, ()))
+
+    def conflicts(self, token, pr_number):
+        return [number for number in self._holders.get(token, ()) if number != pr_number]
+
+    def as_dict(self):
+        return {
+            token: sorted(numbers, key=lambda n: (n is None, n))
+            for token, numbers in sorted(self._holders.items())
+        }
@@ -1,9 +1,22 @@
+import atexit
 import os
+import queue
 import re
+import threading
+import time
 from datetime import datetime, timezone
 
+from supervisor.log_store import append_record, flush_logs, get_log
+
 
 DEFAULT_LOG_PATH = "governance/logs/pr-gate.log"
+DEFAULT_FLUSH_INTERVAL = 0.2
+DEFAULT_FLUSH_BYTES = 64 * 1024
+FSYNC_POLICIES = ("never", "flush", "always")
+
+_AUTHORIZATION_RE = re.compile(r"(?i)authorization\s*[:=]\s*[^\s,;]+")
+_TOKEN_RE = re.compile(r"(?i)\b(token|bearer)\s+[A-Za-z0-9._\-]+")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _log_path():
@@ -12,26 +25,194 @@ def _log_path():
 
 def _sanitize(text):
     value = str(text)
-    value = re.sub(r"(?i)authorization\s*[:=]\s*[^\s,;]+", "Authorization=[REDACTED]", value)
-    value = re.sub(r"(?i)\b(token|bearer)\s+[A-Za-z0-9._\-]+", r"\1 [REDACTED]", value)
-    value = re.sub(r"\s+", " ", value).strip()
+    value = _AUTHORIZATION_RE.sub("Authorization=[REDACTED]", value)
+    value = _TOKEN_RE.sub(r"\1 [REDACTED]", value)
+    value = _WHITESPACE_RE.sub(" ", value).strip()
     return value
 
 
-def log_event(component: str, message: str) -> None:
-    path = _log_path()
-    line = (
-        f"{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')} "
-        f"[{_sanitize(component)}] {_sanitize(message)}"
-    )
+def _record(stamp, component, message):
+    return {"ts": stamp, "component": _sanitize(component), "message": _sanitize(message)}
+
+
+def _write_now(path, record):
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(line + "\n")
+        append_record(path, record)
     except Exception:
         return
 
 
+class LogWriter:
+    """
+    Background writer for log_event: callers only enqueue, one daemon thread
+    redacts the lines and appends them, in call order, as JSONL records to
+    the log_store log for their path. Logs are flushed once `flush_bytes`
+    are buffered, `flush_interval` seconds have passed, on flush() and on
+    close(). fsync is "never", after every "flush", or after every line
+    ("always").
+    """
+
+    def __init__(self, flush_interval=DEFAULT_FLUSH_INTERVAL, flush_bytes=DEFAULT_FLUSH_BYTES, fsync="never"):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self.fsync = fsync
+        self._queue = queue.SimpleQueue()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="pr-gate-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, path, stamp, component, message):
+        if self._closed:
+            _write_now(path, _record(stamp, component, message))
+            return
+        self._queue.put(("line", path, stamp, component, message))
+
+    def flush(self, timeout=None):
+        """Blocks until every line enqueued before this call is written and flushed."""
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self, timeout=None):
+        if self._closed:
+            return True
+        self._closed = True
+        done = threading.Event()
+        self._queue.put(("close", done))
+        return done.wait(timeout)
+
+    def _flush_all(self):
+        try:
+            flush_logs(sync=self.fsync != "never")
+        except Exception:
+            pass
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def _write_line(self, path, stamp, component, message):
+        try:
+            log = get_log(path)
+            size = log.append(_record(stamp, component, message))
+            if self.fsync == "always":
+                log.flush(sync=True)
+                return
+        except Exception:
+            return
+        self._pending += size
+        if self._pending >= self.flush_bytes or time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_all()
+
+    def _drain_after_close(self):
+        # Lines that raced with close(): append them directly, still in order.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item[0] == "line":
+                _write_now(item[1], _record(*item[2:]))
+            else:
+                item[1].set()
+
+    def _run(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if self._pending else None)
+            except queue.Empty:
+                self._flush_all()
+                continue
+            kind = item[0]
+            if kind == "line":
+                self._write_line(*item[1:])
+                continue
+            self._flush_all()
+            if kind == "close":
+                self._drain_after_close()
+            item[1].set()
+            if kind == "close":
+                return
+
+
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+
+
+def _float_env(name, default):
+    raw = os.environ.get(name, "")
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def log_writer_from_env():
+    """
+    LogWriter configured by PR_GATE_LOG_FLUSH_INTERVAL (seconds),
+    PR_GATE_LOG_FLUSH_BYTES and PR_GATE_LOG_FSYNC (never|flush|always), or
+    None when PR_GATE_LOG_SYNC=1 asks for one synchronous append per line.
+    Rotation and compression are configured in supervisor.log_store.
+    """
+    if os.environ.get("PR_GATE_LOG_SYNC", "").strip() == "1":
+        return None
+    fsync = os.environ.get("PR_GATE_LOG_FSYNC", "never").strip().lower()
+    return LogWriter(
+        flush_interval=_float_env("PR_GATE_LOG_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL),
+        flush_bytes=int(_float_env("PR_GATE_LOG_FLUSH_BYTES", DEFAULT_FLUSH_BYTES)),
+        fsync=fsync if fsync in FSYNC_POLICIES else "never",
+    )
+
+
+def _get_writer():
+    global _WRITER
+    if _WRITER is None or _WRITER._closed:
+        with _WRITER_LOCK:
+            if _WRITER is None or _WRITER._closed:
+                _WRITER = log_writer_from_env()
+    return _WRITER
+
+
+def flush_log(timeout=None):
+    """Waits until every log_event line emitted so far is on disk (in the OS page cache)."""
+    writer = _WRITER
+    return True if writer is None else writer.flush(timeout)
+
+
+def shutdown_log_writer(timeout=5.0):
+    """Flushes and closes the background writer; later log_event calls start a new one."""
+    global _WRITER
+    with _WRITER_LOCK:
+        writer, _WRITER = _WRITER, None
+    return True if writer is None else writer.close(timeout)
+
+
+def _reset_after_fork():
+    # The writer thread does not survive fork(); children start their own.
+    global _WRITER, _WRITER_LOCK
+    _WRITER = None
+    _WRITER_LOCK = threading.Lock()
+
+
+atexit.register(shutdown_log_writer)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def log_event(component: str, message: str) -> None:
+    stamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    path = _log_path()
+    writer = _get_writer()
+    if writer is None:
+        _write_now(path, _record(stamp, component, message))
+        return
+    writer.write(path, stamp, str(component), str(message))
+
+
 def dry_run_log() -> str:
     from supervisor.pr_gate.evaluator import evaluate_pr
     from supervisor.pr_gate.report import write_gate_artifact
@@ -95,4 +276,5 @@ def dry_run_log() -> str:
     )
     write_gate_artifact(999, "dryrunsha", "0" * 64, result)
     log_event("status_publish", "context=supervisor/governance state=pending sha=dryrunsha http=200")
+    flush_log()
     return _log_path()
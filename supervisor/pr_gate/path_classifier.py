@@ -0,0 +1,62 @@
+MAX_OBSERVED_PATHS = 100
+
+
+class PathPrefixClassifier:
+    """
+    Character trie over the policy's path prefixes. One walk per path finds
+    every class it belongs to and, per class, the first matching prefix in
+    policy list order (the prefix nested startswith loops would report).
+    """
+
+    def __init__(self, prefixes_by_class):
+        self.classes = tuple(prefixes_by_class)
+        self._root = {}
+        self._root_terminals = {}
+        for class_name, prefixes in prefixes_by_class.items():
+            for index, prefix in enumerate(prefixes):
+                terminals = self._root_terminals if prefix == "" else self._node_for(prefix)[None]
+                if class_name not in terminals or index < terminals[class_name][0]:
+                    terminals[class_name] = (index, prefix)
+
+    def _node_for(self, prefix):
+        node = self._root
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, {})
+        return node
+
+    def classify(self, path):
+        """Returns {class_name: first matching prefix} for one path."""
+        best = dict(self._root_terminals)
+        node = self._root
+        for ch in path:
+            node = node.get(ch)
+            if node is None:
+                break
+            terminals = node.get(None)
+            if terminals:
+                for class_name, hit in terminals.items():
+                    current = best.get(class_name)
+                    if current is None or hit[0] < current[0]:
+                        best[class_name] = hit
+        return {class_name: hit[1] for class_name, hit in best.items()}
+
+    def classify_all(self, paths):
+        """Returns {class_name: [(path, prefix), ...]} in input order, one pass over paths."""
+        hits = {class_name: [] for class_name in self.classes}
+        for path in paths:
+            for class_name, prefix in self.classify(path).items():
+                hits[class_name].append((path, prefix))
+        return hits
+
+
+def observed_path_classes(hits, limit=MAX_OBSERVED_PATHS):
+    """Compact per-class summary of classify_all() output for gate artifacts."""
+    return {
+        class_name: {
+            "count": len(class_hits),
+            "prefixes": sorted({prefix for _, prefix in class_hits}),
+            "paths": sorted(path for path, _ in class_hits)[:limit],
+        }
+        for class_name, class_hits in hits.items()
+    }
@@ -1,8 +1,12 @@
 import hashlib
+import os
+import threading
+import time
 from pathlib import Path
 
 import yaml
 
+from supervisor.pr_gate.compiled_policy import compile_policy
 from supervisor.pr_gate.logger import log_event
 
 
@@ -20,16 +24,22 @@ REQUIRED_KEYS = {
 }
 
 
-def load_policy(policy_path="governance/policy/pr-governance.v0.2.yaml"):
-    path = Path(policy_path)
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except Exception as exc:
-        log_event("policy_loader", f"load_failed path={path} error={exc}")
-        raise PolicyLoadError(f"Failed to read policy: {exc}") from exc
+DEFAULT_POLICY_PATH = "governance/policy/pr-governance.v0.2.yaml"
+DEFAULT_REHASH_SECONDS = 60.0
+# A file modified within this window of being read may change again without
+# its mtime moving (coarse filesystem timestamps), so it is re-read next time.
+RACY_WINDOW_NS = 2_000_000_000
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+def _stat_key(st):
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _parse_policy(path, raw):
     try:
-        policy = yaml.safe_load(raw)
+        policy = yaml.load(raw, Loader=_YAML_LOADER)
     except Exception as exc:
         log_event("policy_loader", f"parse_failed path={path} error={exc}")
         raise PolicyLoadError(f"Failed to parse policy YAML: {exc}") from exc
@@ -42,10 +52,158 @@ def load_policy(policy_path="governance/policy/pr-governance.v0.2.yaml"):
     if missing:
         log_event("policy_loader", f"missing_keys path={path} missing={','.join(missing)}")
         raise PolicyLoadError(f"Policy missing required keys: {', '.join(missing)}")
+    return policy
+
+
+def _policy_hash(raw):
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-    policy_hash = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _read_policy(path):
+    try:
+        return path.read_text(encoding="utf-8")
+    except Exception as exc:
+        log_event("policy_loader", f"load_failed path={path} error={exc}")
+        raise PolicyLoadError(f"Failed to read policy: {exc}") from exc
+
+
+def read_policy(policy_path=DEFAULT_POLICY_PATH):
+    """Reads, parses and hashes the policy file with no caching."""
+    path = Path(policy_path)
+    raw = _read_policy(path)
+    policy = _parse_policy(path, raw)
+    policy_hash = _policy_hash(raw)
     log_event(
         "policy_loader",
         f"loaded path={path} top_keys={','.join(sorted(policy.keys()))} policy_hash={policy_hash}",
     )
     return policy, policy_hash
+
+
+class PolicyStore:
+    """
+    (policy, policy_hash) for one file, re-read only when its (mtime_ns,
+    size, inode) changes, when it was modified too recently to trust the
+    mtime, or every `rehash_seconds` regardless. Read errors are never
+    cached: a missing or broken file raises PolicyLoadError on every load.
+    The returned policy mapping is shared and must be treated as read-only.
+    Given a FileWatcher, change detection and hashing are left to it, and
+    the cached policy is dropped as soon as the watcher pushes a change.
+    """
+
+    def __init__(
+        self,
+        policy_path=DEFAULT_POLICY_PATH,
+        rehash_seconds=DEFAULT_REHASH_SECONDS,
+        clock=None,
+        watcher=None,
+    ):
+        self.path = Path(policy_path)
+        self.rehash_seconds = rehash_seconds
+        self.watcher = watcher
+        self._clock = clock or time.monotonic
+        # Re-entrant: the watcher may push a change from inside load().
+        self._lock = threading.RLock()
+        self._stat = None
+        self._racy = False
+        self._hashed_at = None
+        self._policy = None
+        self._policy_hash = None
+        self.reads = 0
+        if watcher is not None:
+            watcher.subscribe(self._on_change, path=str(self.path))
+
+    def _on_change(self, old, new):
+        with self._lock:
+            self._policy = None
+            self._policy_hash = None
+
+    def _stat_file(self):
+        try:
+            return os.stat(self.path)
+        except OSError as exc:
+            log_event("policy_loader", f"load_failed path={self.path} error={exc}")
+            raise PolicyLoadError(f"Failed to read policy: {exc}") from exc
+
+    def _rehash_due(self, now):
+        return self.rehash_seconds is not None and now - self._hashed_at >= self.rehash_seconds
+
+    def _accept(self, raw, policy_hash):
+        if policy_hash != self._policy_hash:
+            policy = _parse_policy(self.path, raw)
+            log_event(
+                "policy_loader",
+                f"loaded path={self.path} top_keys={','.join(sorted(policy.keys()))} policy_hash={policy_hash}",
+            )
+            self._policy, self._policy_hash = policy, policy_hash
+
+    def _load_watched(self):
+        now = self._clock()
+        reread = self._hashed_at is not None and self._rehash_due(now)
+        snap = self.watcher.snapshot(self.path, reread=reread)
+        if snap.error is not None:
+            log_event("policy_loader", f"load_failed path={self.path} error={snap.error}")
+            raise PolicyLoadError(f"Failed to read policy: {snap.error}") from snap.error
+        self._accept(snap.text, snap.sha256)
+        if reread or self._hashed_at is None:
+            self._hashed_at = now
+        return self._policy, self._policy_hash
+
+    def load(self):
+        with self._lock:
+            if self.watcher is not None:
+                return self._load_watched()
+            st = self._stat_file()
+            now = self._clock()
+            if (
+                self._policy is not None
+                and _stat_key(st) == self._stat
+                and not self._racy
+                and not self._rehash_due(now)
+            ):
+                return self._policy, self._policy_hash
+
+            read_started_ns = time.time_ns()
+            raw = _read_policy(self.path)
+            self.reads += 1
+            self._accept(raw, _policy_hash(raw))
+            self._stat = _stat_key(st)
+            self._racy = st.st_mtime_ns >= read_started_ns - RACY_WINDOW_NS
+            self._hashed_at = now
+            return self._policy, self._policy_hash
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def _rehash_seconds_from_env():
+    raw = os.environ.get("PR_GATE_POLICY_REHASH_SECONDS", "")
+    try:
+        return float(raw) if raw else DEFAULT_REHASH_SECONDS
+    except ValueError:
+        return DEFAULT_REHASH_SECONDS
+
+
+def get_policy_store(policy_path=DEFAULT_POLICY_PATH):
+    # Imported here: supervisor.file_watcher logs through this package.
+    from supervisor.file_watcher import get_file_watcher
+
+    key = os.path.abspath(policy_path)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = PolicyStore(key, rehash_seconds=_rehash_seconds_from_env(), watcher=get_file_watcher())
+            _STORES[key] = store
+        return store
+
+
+def load_policy(policy_path=DEFAULT_POLICY_PATH):
+    """(policy, policy_hash) from the file's PolicyStore; re-read only when the file changes."""
+    return get_policy_store(policy_path).load()
+
+
+def load_compiled_policy(policy_path=DEFAULT_POLICY_PATH):
+    """load_policy(), plus the CompiledPolicy built once per policy hash."""
+    policy, policy_hash = load_policy(policy_path)
+    return compile_policy(policy, policy_hash), policy_hash
@@ -25,6 +25,14 @@ def write_gate_artifact(pr_number, head_sha, policy_hash, result, root="artifact
         "failed_gates": result.get("failed_gates", []),
         "observed": result.get("observed", {}),
     }
+    if "timing" in result:
+        payload["timing"] = dict(
+            result["timing"],
+            gates=[
+                {key: event[key] for key in ("gate", "stage", "duration_ns", "input_sizes", "reused") if key in event}
+                for event in result.get("gate_events", [])
+            ],
+        )
     path = os.path.join(root, f"pr-{pr_number}-{head_sha}.json")
     with open(path, "w", encoding="utf-8") as f:
         json.dump(payload, f, sort_keys=True, indent=2)
@@ -32,3 +40,17 @@ def write_gate_artifact(pr_number, head_sha, policy_hash, result, root="artifact
     status = "PASS" if result.get("passed", False) else "FAIL"
     log_event("artifact", f"wrote pr-{pr_number}-{head_sha}.json status={status}")
     return path
+
+
+def write_lock_index_artifact(lock_index, policy_hash, root="artifacts/governance"):
+    os.makedirs(root, exist_ok=True)
+    payload = {
+        "policy_hash": policy_hash,
+        "locks": lock_index.as_dict(),
+    }
+    path = os.path.join(root, "lock-index.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, sort_keys=True, indent=2)
+        f.write("\n")
+    log_event("artifact", f"wrote lock-index.json locks={len(payload['locks'])}")
+    return path
@@ -0,0 +1,86 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+
+DEFAULT_MAX_ENTRIES = 1024
+
+CachedResponse = namedtuple("CachedResponse", ["etag", "last_modified", "parsed", "raw", "headers"])
+
+
+class ConditionalResponseCache:
+    """
+    LRU store of GET responses keyed by URL and credentials. Entries are only
+    served after the server confirms them with 304 Not Modified, so the cache
+    never returns stale data. Parsed payloads are shared between callers and
+    must be treated as read-only.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max(0, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(url, headers=None):
+        auth = None
+        for name, value in (headers or {}).items():
+            if name.lower() == "authorization":
+                auth = value
+        return url, auth
+
+    def validators(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        validators = {}
+        if entry.etag:
+            validators["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            validators["If-Modified-Since"] = entry.last_modified
+        return validators
+
+    def not_modified(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def store(self, key, headers, parsed, raw):
+        etag = headers.get("ETag") if headers is not None else None
+        last_modified = headers.get("Last-Modified") if headers is not None else None
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            if self.max_entries == 0:
+                return
+            self._entries[key] = CachedResponse(etag, last_modified, parsed, raw, headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
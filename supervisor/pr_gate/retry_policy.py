@@ -0,0 +1,293 @@
+import asyncio
+import os
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+
+from supervisor.pr_gate.logger import log_event
+
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 8.0
+DEFAULT_MAX_RETRY_AFTER_SECONDS = 30.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30.0
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+
+_SHA_SEGMENT = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+
+class CircuitOpenError(urllib.error.URLError):
+    """Raised without sending when an endpoint's breaker is open."""
+
+
+def endpoint_key(method, url):
+    """Groups URLs by route: numbers and commit SHAs in the path are collapsed."""
+    parts = urllib.parse.urlsplit(url)
+    segments = []
+    for segment in parts.path.split("/"):
+        if segment.isdigit():
+            segment = "{n}"
+        elif _SHA_SEGMENT.match(segment):
+            segment = "{sha}"
+        segments.append(segment)
+    return f"{method.upper()} {parts.netloc}{'/'.join(segments)}"
+
+
+def retry_after_seconds(headers, now=None):
+    """
+    Seconds the server asked us to wait, from Retry-After (delta or HTTP date)
+    or an exhausted X-RateLimit-Remaining/X-RateLimit-Reset pair; None if absent.
+    """
+    if headers is None:
+        return None
+    now = time.time() if now is None else now
+    value = (headers.get("Retry-After") or "").strip()
+    if value:
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            when = None
+        if when is not None:
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            return max(0.0, when.timestamp() - now)
+    remaining = (headers.get("X-RateLimit-Remaining") or "").strip()
+    reset = (headers.get("X-RateLimit-Reset") or "").strip()
+    if remaining == "0" and reset:
+        try:
+            reset_value = float(reset)
+        except ValueError:
+            return None
+        # Large values are epoch timestamps, small ones a relative delay.
+        if reset_value > 1_000_000_000:
+            return max(0.0, reset_value - now)
+        return max(0.0, reset_value)
+    return None
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures; after
+    reset_seconds one half-open probe is let through and decides the state.
+    A probe that never reports back (cancelled, interrupted) is released by
+    the caller, or expires after another reset_seconds.
+    """
+
+    def __init__(
+        self,
+        name,
+        failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds=DEFAULT_RESET_SECONDS,
+        clock=None,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_seconds = float(reset_seconds)
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+        self._probe_in_flight = False
+        self._probe_started = None
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if self._clock() - self.opened_at < self.reset_seconds:
+                    return False
+                self.state = "half_open"
+                self._probe_in_flight = False
+            now = self._clock()
+            if self._probe_in_flight and now - self._probe_started < self.reset_seconds:
+                return False
+            self._probe_in_flight = True
+            self._probe_started = now
+        log_event("circuit_breaker", f"endpoint={self.name} state=half_open")
+        return True
+
+    def release(self):
+        """Gives up an admitted call without an outcome; a half-open breaker lets the next probe through."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            recovered = self.state != "closed"
+            self.state = "closed"
+            self.failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+        if recovered:
+            log_event("circuit_breaker", f"endpoint={self.name} state=closed")
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            tripped = self.state == "half_open" or (
+                self.state == "closed" and self.failures >= self.failure_threshold
+            )
+            if tripped:
+                self.state = "open"
+                self.opened_at = self._clock()
+                self.trips += 1
+            self._probe_in_flight = False
+            failures = self.failures
+        if tripped:
+            log_event(
+                "circuit_breaker",
+                f"endpoint={self.name} state=open failures={failures} reset_seconds={self.reset_seconds}",
+            )
+
+
+class RetryPolicy:
+    """
+    Shared retry/breaker policy for Gitea calls. Only idempotent methods are
+    retried, with full-jitter exponential backoff or the server's Retry-After;
+    every method goes through the per-endpoint breaker. When attempts run out
+    the last response is returned (or the last error raised) unchanged, so
+    callers keep failing closed exactly as before.
+    """
+
+    def __init__(
+        self,
+        max_attempts=DEFAULT_MAX_ATTEMPTS,
+        base_delay_seconds=DEFAULT_BASE_DELAY_SECONDS,
+        max_delay_seconds=DEFAULT_MAX_DELAY_SECONDS,
+        max_retry_after_seconds=DEFAULT_MAX_RETRY_AFTER_SECONDS,
+        failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+        reset_seconds=DEFAULT_RESET_SECONDS,
+        rng=None,
+        sleep=None,
+        clock=None,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay_seconds = float(base_delay_seconds)
+        self.max_delay_seconds = float(max_delay_seconds)
+        self.max_retry_after_seconds = float(max_retry_after_seconds)
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._rng = rng or random.Random()
+        self._sleep = sleep or time.sleep
+        self._clock = clock
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self.retries = 0
+
+    def breaker(self, key):
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(key, self.failure_threshold, self.reset_seconds, clock=self._clock)
+                self._breakers[key] = breaker
+            return breaker
+
+    def backoff(self, attempt):
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** (attempt - 1)))
+        return self._rng.uniform(0, ceiling)
+
+    def _admit(self, key):
+        breaker = self.breaker(key)
+        if not breaker.allow():
+            raise CircuitOpenError(f"circuit open for {key}")
+        return breaker
+
+    def _settle(self, key, breaker, method, attempt, response=None, error=None):
+        """Records the outcome and returns the delay before a retry, or None to stop."""
+        failed = error is not None or response.status in RETRYABLE_STATUSES
+        if not failed:
+            breaker.record_success()
+            return None
+        breaker.record_failure()
+        if method not in IDEMPOTENT_METHODS or attempt >= self.max_attempts:
+            return None
+        delay = None if response is None else retry_after_seconds(response.headers)
+        if delay is not None and delay > self.max_retry_after_seconds:
+            log_event("http_retry", f"endpoint={key} attempt={attempt} giving_up retry_after={delay:.1f}")
+            return None
+        if delay is None:
+            delay = self.backoff(attempt)
+        reason = f"status={response.status}" if response is not None else f"error={type(error).__name__}"
+        with self._lock:
+            self.retries += 1
+        log_event(
+            "http_retry",
+            f"endpoint={key} attempt={attempt}/{self.max_attempts} {reason} delay={delay:.2f}",
+        )
+        return delay
+
+    def call(self, method, url, send):
+        method = method.upper()
+        key = endpoint_key(method, url)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker = self._admit(key)
+            try:
+                response = send()
+            except (urllib.error.URLError, OSError) as exc:
+                delay = self._settle(key, breaker, method, attempt, error=exc)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                delay = self._settle(key, breaker, method, attempt, response=response)
+                if delay is None:
+                    return response
+            self._sleep(delay)
+
+    async def call_async(self, method, url, send):
+        method = method.upper()
+        key = endpoint_key(method, url)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker = self._admit(key)
+            try:
+                response = await send()
+            except (urllib.error.URLError, OSError, asyncio.TimeoutError) as exc:
+                delay = self._settle(key, breaker, method, attempt, error=exc)
+                if delay is None:
+                    raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                delay = self._settle(key, breaker, method, attempt, response=response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+
+    def stats(self):
+        with self._lock:
+            breakers = list(self._breakers.values())
+            retries = self.retries
+        return {
+            "retries": retries,
+            "trips": sum(b.trips for b in breakers),
+            "open": sorted(b.name for b in breakers if b.state != "closed"),
+        }
+
+
+def retry_policy_from_env():
+    raw = os.environ.get("PR_GATE_HTTP_MAX_ATTEMPTS", "").strip()
+    try:
+        max_attempts = int(raw) if raw else DEFAULT_MAX_ATTEMPTS
+    except ValueError:
+        max_attempts = DEFAULT_MAX_ATTEMPTS
+    return RetryPolicy(max_attempts=max_attempts)
@@ -0,0 +1,288 @@
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+
+
+DEFAULT_SIGNATURE_CACHE_PATH = "artifacts/cache/signature-cache.sqlite3"
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 100_000
+GPG_KEYRING_FILES = ("pubring.kbx", "pubring.gpg", "trustdb.gpg")
+# Outcomes that can change without the keyring changing are never persisted.
+UNCACHEABLE_REASONS = {"commit_not_found"}
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+DEFAULT_CONFIG_RECHECK_SECONDS = 60.0
+SIGNING_CONFIG_REGEXP = r"^(gpg|user\.signingkey)"
+# Environment that changes which config git reads, or where gpg keeps keys.
+CONFIG_ENV_PREFIXES = ("GIT_CONFIG", "GNUPGHOME", "HOME", "XDG_CONFIG_HOME")
+
+
+def _git_dir(start=None):
+    current = os.path.abspath(start or os.getcwd())
+    while True:
+        candidate = os.path.join(current, ".git")
+        if os.path.isdir(candidate):
+            return candidate
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def _git_config_files(start=None):
+    """Config files git may read even when none of them exist yet."""
+    paths = [
+        "/etc/gitconfig",
+        os.path.expanduser("~/.gitconfig"),
+        os.path.join(os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"), "git", "config"),
+    ]
+    for name in ("GIT_CONFIG_SYSTEM", "GIT_CONFIG_GLOBAL"):
+        if os.environ.get(name):
+            paths.append(os.environ[name])
+    git_dir = _git_dir(start)
+    if git_dir is not None:
+        # HEAD is included for includeIf "onbranch:" sections.
+        paths.extend(os.path.join(git_dir, name) for name in ("config", "config.worktree", "HEAD"))
+    return paths
+
+
+def _config_env():
+    return tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith(CONFIG_ENV_PREFIXES)))
+
+
+def _origin_files(output, cwd=None):
+    """Files named by `git config --show-origin` lines ("file:<path>\t<key> <value>")."""
+    files = []
+    for line in output.splitlines():
+        origin = line.split("\t", 1)[0]
+        if origin.startswith("file:"):
+            path = origin[len("file:"):]
+            files.append(path if os.path.isabs(path) else os.path.join(cwd or os.getcwd(), path))
+    return files
+
+
+class KeyringFingerprint:
+    """
+    Content digest of the trusted signing material: the signing-related git
+    config as git resolves it (`--show-origin`, so system config, include
+    and includeIf files and GIT_CONFIG_* overrides all count), the ssh
+    allowed-signers file it names and the gpg public keyring. git is only
+    re-queried when the stat() of a config file it read (or could read)
+    changes, the relevant environment changes, or every
+    `config_recheck_seconds`; keyring files are re-hashed on stat changes.
+    """
+
+    def __init__(self, cwd=None, gnupg_home=None, config_recheck_seconds=DEFAULT_CONFIG_RECHECK_SECONDS, clock=None):
+        self.cwd = cwd
+        self.gnupg_home = gnupg_home
+        self.config_recheck_seconds = config_recheck_seconds
+        self._clock = clock or time.monotonic
+        self._lock = threading.Lock()
+        self._config_output = ""
+        self._config_files = []
+        self._config_stats = None
+        self._config_checked_at = None
+        self._signers_path = None
+        self._digests = {}
+
+    def _config_state(self):
+        paths = dict.fromkeys(_git_config_files(self.cwd) + self._config_files)
+        return (_config_env(), tuple((path, _stat_key(path)) for path in paths))
+
+    def _signing_config(self):
+        now = self._clock()
+        state = self._config_state()
+        if (
+            state == self._config_stats
+            and self.config_recheck_seconds is not None
+            and now - self._config_checked_at < self.config_recheck_seconds
+        ):
+            return self._config_output
+        result = subprocess.run(
+            ["git", "config", "--show-origin", "--get-regexp", SIGNING_CONFIG_REGEXP],
+            capture_output=True,
+            text=True,
+            cwd=self.cwd,
+        )
+        # Exit status 1 just means no signing keys are configured.
+        output = result.stdout if result.returncode in (0, 1) else f"error={result.returncode}"
+        signers = ""
+        for line in output.splitlines():
+            key, _, value = line.partition("\t")[2].partition(" ")
+            if key.lower() == "gpg.ssh.allowedsignersfile":
+                signers = value.strip()
+        if signers and not os.path.isabs(signers):
+            signers = os.path.join(self.cwd or os.getcwd(), os.path.expanduser(signers))
+        self._signers_path = signers or None
+        self._config_output = output
+        self._config_files = _origin_files(output, self.cwd)
+        self._config_stats = self._config_state()
+        self._config_checked_at = now
+        return output
+
+    def _file_digest(self, path):
+        stat = _stat_key(path)
+        if stat is None:
+            return "absent"
+        cached = self._digests.get(path)
+        if cached is not None and cached[0] == stat:
+            return cached[1]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(65536), b""):
+                digest.update(block)
+        value = digest.hexdigest()
+        self._digests[path] = (stat, value)
+        return value
+
+    def current(self):
+        gnupg_home = self.gnupg_home or os.environ.get("GNUPGHOME") or os.path.expanduser("~/.gnupg")
+        with self._lock:
+            config = self._signing_config()
+            parts = [
+                f"config={hashlib.sha256(config.encode('utf-8')).hexdigest()}",
+                f"allowed_signers={self._file_digest(self._signers_path or '')}",
+            ]
+            for name in GPG_KEYRING_FILES:
+                parts.append(f"{name}={self._file_digest(os.path.join(gnupg_home, name))}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class SignatureCache:
+    """
+    SQLite store of (sha, keyring fingerprint) -> signature fields. Rows for
+    any other fingerprint are dropped as soon as the keyring changes; the rest
+    is bounded by age and entry count. Opened lazily on first use.
+    """
+
+    def __init__(
+        self,
+        path=DEFAULT_SIGNATURE_CACHE_PATH,
+        fingerprint=None,
+        max_age_seconds=DEFAULT_MAX_AGE_SECONDS,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        clock=None,
+    ):
+        self.path = path
+        self.fingerprint = fingerprint or KeyringFingerprint()
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._clock = clock or time.time
+        self._conn = None
+        self._lock = threading.Lock()
+        self._active_keyring = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS signature_cache ("
+                "sha TEXT NOT NULL, keyring TEXT NOT NULL, result TEXT NOT NULL, "
+                "created_at REAL NOT NULL, PRIMARY KEY (sha, keyring))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS signature_cache_age ON signature_cache (created_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _keyring(self, conn):
+        keyring = self.fingerprint.current()
+        if keyring != self._active_keyring:
+            conn.execute("DELETE FROM signature_cache WHERE keyring != ?", (keyring,))
+            self._prune(conn)
+            conn.commit()
+            self._active_keyring = keyring
+        return keyring
+
+    def _prune(self, conn):
+        if self.max_age_seconds is not None:
+            conn.execute(
+                "DELETE FROM signature_cache WHERE created_at < ?",
+                (self._clock() - self.max_age_seconds,),
+            )
+        if self.max_entries is not None:
+            conn.execute(
+                "DELETE FROM signature_cache WHERE rowid IN ("
+                "SELECT rowid FROM signature_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def get_many(self, shas):
+        shas = [sha for sha in dict.fromkeys(shas) if sha]
+        if not shas:
+            return {}
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            keyring = self._keyring(conn)
+            oldest = self._clock() - self.max_age_seconds if self.max_age_seconds is not None else None
+            for start in range(0, len(shas), 500):
+                chunk = shas[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT sha, result, created_at FROM signature_cache WHERE keyring = ? "
+                    f"AND sha IN ({','.join('?' * len(chunk))})",
+                    (keyring, *chunk),
+                ).fetchall()
+                for sha, result, created_at in rows:
+                    if oldest is None or created_at >= oldest:
+                        found[sha] = json.loads(result)
+            self.hits += len(found)
+            self.misses += len(shas) - len(found)
+        return found
+
+    def put_many(self, results):
+        rows = [
+            (sha, json.dumps(result, sort_keys=True))
+            for sha, result in results.items()
+            if sha and result.get("signature_reason") not in UNCACHEABLE_REASONS
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            keyring = self._keyring(conn)
+            now = self._clock()
+            conn.executemany(
+                "INSERT OR REPLACE INTO signature_cache (sha, keyring, result, created_at) VALUES (?, ?, ?, ?)",
+                [(sha, keyring, result, now) for sha, result in rows],
+            )
+            self._prune(conn)
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self):
+        with self._lock:
+            entries = 0
+            if self._conn is not None:
+                entries = self._conn.execute("SELECT COUNT(*) FROM signature_cache").fetchone()[0]
+            return {"entries": entries, "hits": self.hits, "misses": self.misses}
+
+
+def signature_cache_from_env():
+    path = os.environ.get("PR_GATE_SIGNATURE_CACHE_PATH", DEFAULT_SIGNATURE_CACHE_PATH).strip()
+    if not path:
+        return None
+    return SignatureCache(path=path)
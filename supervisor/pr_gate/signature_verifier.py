@@ -0,0 +1,196 @@
+import re
+import subprocess
+import threading
+
+from supervisor.pr_gate.signature_cache import signature_cache_from_env
+
+
+LOG_MARKER = "__PR_GATE_SIG__"
+MAX_SHAS_PER_LOG = 256
+
+
+def _result(verifiable, verified, reason, sig_type=None):
+    result = {
+        "signature_verifiable": verifiable,
+        "signature_verified": verified,
+        "signature_source": "local_git",
+    }
+    if sig_type is not None:
+        result["signature_type"] = sig_type
+    result["signature_reason"] = reason
+    return result
+
+
+def _commit_not_found():
+    return _result(False, False, "commit_not_found")
+
+
+def _classify_signature_output(text):
+    if re.search(r"Good .* signature", text):
+        sig_type = "ssh" if "Good \"git\" signature" in text else "gpg"
+        return _result(True, True, "good_signature", sig_type)
+    if "No signature" in text or "BAD signature" in text or "bad signature" in text:
+        return _result(True, False, "missing_or_bad_signature")
+    if "Can't check signature" in text or "No public key" in text:
+        return _result(False, False, "unverifiable_key")
+    return _result(False, False, "unknown_signature_output")
+
+
+def _local_signature_probe(sha, cwd=None):
+    exists = subprocess.run(
+        ["git", "cat-file", "-e", f"{sha}^{{commit}}"],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    if exists.returncode != 0:
+        return _commit_not_found()
+
+    probe = subprocess.run(
+        ["git", "log", "--show-signature", "-n", "1", "--format=%H", sha],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    return _classify_signature_output(f"{probe.stdout}\n{probe.stderr}")
+
+
+class BatchSignatureVerifier:
+    """
+    Verifies many commits with one long-lived `git cat-file --batch-check`
+    and a single `git log --no-walk --show-signature` per batch. Each result
+    is classified exactly like _local_signature_probe; if the batched output
+    cannot be attributed unambiguously, affected commits fall back to it.
+    With a SignatureCache, already-known commits cost no subprocesses.
+    """
+
+    def __init__(self, cwd=None, cache=None):
+        self.cwd = cwd
+        self.cache = cache
+        self._cat_file = None
+        self._lock = threading.Lock()
+        self.log_invocations = 0
+        self.fallback_probes = 0
+
+    def _start_cat_file(self):
+        self._cat_file = subprocess.Popen(
+            ["git", "cat-file", "--batch-check"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=self.cwd,
+        )
+
+    def _check_one(self, sha):
+        for _ in range(2):
+            if self._cat_file is None or self._cat_file.poll() is not None:
+                self._start_cat_file()
+            try:
+                self._cat_file.stdin.write(f"{sha}^{{commit}}\n")
+                self._cat_file.stdin.flush()
+                line = self._cat_file.stdout.readline()
+            except (BrokenPipeError, OSError, ValueError):
+                line = ""
+            if line:
+                fields = line.split()
+                if len(fields) == 3 and fields[1] == "commit":
+                    return fields[0]
+                return None
+            # The process died (e.g. not a repository yet); restart once.
+            self._close_cat_file()
+        return None
+
+    def resolve_commits(self, shas):
+        """Maps each sha to its full commit id, or None when it is not a local commit."""
+        resolved = {}
+        with self._lock:
+            for sha in shas:
+                if not sha or any(ch.isspace() for ch in sha):
+                    resolved[sha] = None
+                else:
+                    resolved[sha] = self._check_one(sha)
+        return resolved
+
+    def _log_signatures(self, commit_ids):
+        """Returns {commit_id: text} for one batch, or None if the output is ambiguous."""
+        self.log_invocations += 1
+        probe = subprocess.run(
+            ["git", "log", "--no-walk=unsorted", "--show-signature", f"--format={LOG_MARKER} %H", *commit_ids],
+            capture_output=True,
+            text=True,
+            cwd=self.cwd,
+        )
+        if probe.returncode != 0 or probe.stderr.strip():
+            return None
+        texts = {}
+        pending = []
+        for line in probe.stdout.splitlines():
+            if line.startswith(f"{LOG_MARKER} "):
+                commit_id = line[len(LOG_MARKER) + 1:].strip()
+                # git prints a commit's signature check before its format line.
+                texts[commit_id] = "\n".join(pending + [commit_id])
+                pending = []
+            else:
+                pending.append(line)
+        if pending or set(texts) != set(commit_ids):
+            return None
+        return texts
+
+    def verify(self, shas):
+        """Returns {sha: signature fields} for every requested sha."""
+        unique = list(dict.fromkeys(shas))
+        cached = self.cache.get_many(unique) if self.cache is not None else {}
+        unique = [sha for sha in unique if sha not in cached]
+        if not unique:
+            return cached
+        resolved = self.resolve_commits(unique)
+        results = {sha: _commit_not_found() for sha, commit_id in resolved.items() if commit_id is None}
+
+        commit_ids = list(dict.fromkeys(cid for cid in resolved.values() if cid is not None))
+        texts = {}
+        for start in range(0, len(commit_ids), MAX_SHAS_PER_LOG):
+            chunk = commit_ids[start:start + MAX_SHAS_PER_LOG]
+            chunk_texts = self._log_signatures(chunk)
+            if chunk_texts is not None:
+                texts.update(chunk_texts)
+
+        for sha, commit_id in resolved.items():
+            if commit_id is None:
+                continue
+            if commit_id in texts:
+                results[sha] = _classify_signature_output(texts[commit_id])
+            else:
+                self.fallback_probes += 1
+                results[sha] = _local_signature_probe(sha, cwd=self.cwd)
+        if self.cache is not None:
+            self.cache.put_many(results)
+        results.update(cached)
+        return results
+
+    def _close_cat_file(self):
+        proc, self._cat_file = self._cat_file, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+
+    def close(self):
+        with self._lock:
+            self._close_cat_file()
+
+
+_DEFAULT_VERIFIER = BatchSignatureVerifier(cache=signature_cache_from_env())
+
+
+def get_signature_verifier():
+    return _DEFAULT_VERIFIER
@@ -1,7 +1,6 @@
 import json
-import urllib.error
-import urllib.request
 
+from supervisor.pr_gate.http_client import request
 from supervisor.pr_gate.logger import log_event
 
 
@@ -49,33 +48,29 @@ def publish_governance_status(
         "context": context,
         "description": description[:140],
     }
-    req = urllib.request.Request(
-        url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers=req_headers,
-        method="POST",
-    )
-
     try:
-        with urllib.request.urlopen(req, timeout=5) as response:
-            log_event(
-                "status_publish",
-                f"context={context} state={state} sha={sha} http={response.status}",
-            )
-            if response.status not in (200, 201):
-                raise StatusPublishError(f"Status publish failed: HTTP {response.status} url={url}")
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode() if exc.fp else ""
-        log_event(
-            "status_publish",
-            f"context={context} state={state} sha={sha} http={exc.code}",
+        response = request(
+            "POST",
+            url,
+            body=json.dumps(payload).encode("utf-8"),
+            headers=req_headers,
+            timeout=5,
         )
-        raise StatusPublishError(
-            f"Status publish failed: HTTP {exc.code} url={url} body={body}"
-        ) from exc
     except Exception as exc:
         log_event(
             "status_publish",
             f"context={context} state={state} sha={sha} http=ERR",
         )
         raise StatusPublishError(f"Status publish failed: url={url} error={exc}") from exc
+
+    log_event(
+        "status_publish",
+        f"context={context} state={state} sha={sha} http={response.status}",
+    )
+    if response.status >= 400:
+        body = response.body.decode()
+        raise StatusPublishError(
+            f"Status publish failed: HTTP {response.status} url={url} body={body}"
+        )
+    if response.status not in (200, 201):
+        raise StatusPublishError(f"Status publish failed: HTTP {response.status} url={url}")
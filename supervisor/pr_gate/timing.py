@@ -0,0 +1,83 @@
+import os
+import time
+
+from supervisor.pr_gate.logger import log_event
+
+
+TIMING_KEYS = ("duration_ns", "input_sizes", "stage", "reused")
+
+
+def timing_enabled():
+    """PR_GATE_TIMING=1 turns on per-gate and per-fetch timing for a gate cycle."""
+    return os.environ.get("PR_GATE_TIMING", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def input_sizes(names, values):
+    """{name: len(value)} for the sized (str/list/tuple/dict) inputs."""
+    return {
+        name: len(value)
+        for name, value in zip(names, values)
+        if isinstance(value, (str, list, tuple, dict))
+    }
+
+
+def timed_call(fn, *args, **kwargs):
+    """Calls fn and returns (value, {"duration_ns", "items"}) measured on the monotonic clock."""
+    started = time.perf_counter_ns()
+    value = fn(*args, **kwargs)
+    duration = time.perf_counter_ns() - started
+    items = len(value) if isinstance(value, (list, tuple, dict)) else None
+    return value, {"duration_ns": duration, "items": items}
+
+
+def strip_timing(result):
+    """Copy of an evaluate_pr result without timing fields, for comparisons."""
+    stripped = dict(result)
+    stripped.pop("timing", None)
+    if "gate_events" in result:
+        stripped["gate_events"] = [
+            {key: value for key, value in event.items() if key not in TIMING_KEYS}
+            for event in result["gate_events"]
+        ]
+    return stripped
+
+
+class CycleTiming:
+    """Per-cycle totals of the timing blocks attached to evaluate_pr results."""
+
+    def __init__(self):
+        self.prs = 0
+        self.stages = {}
+        self.fetches = {}
+
+    @staticmethod
+    def _add(bucket, name, duration_ns, items=None):
+        entry = bucket.setdefault(name, {"count": 0, "total_ns": 0, "max_ns": 0, "items": 0})
+        entry["count"] += 1
+        entry["total_ns"] += duration_ns
+        entry["max_ns"] = max(entry["max_ns"], duration_ns)
+        entry["items"] += items or 0
+
+    def add(self, result):
+        timing = result.get("timing")
+        if not timing:
+            return
+        self.prs += 1
+        for stage, entry in timing.get("stages", {}).items():
+            self._add(self.stages, stage, entry["duration_ns"], sum(entry["input_sizes"].values()))
+        for name, entry in timing.get("fetches", {}).items():
+            self._add(self.fetches, name, entry["duration_ns"], entry.get("items"))
+
+    def summary(self):
+        return {"prs": self.prs, "stages": self.stages, "fetches": self.fetches}
+
+    def log(self):
+        def fmt(prefix, bucket):
+            return [
+                f"{prefix}.{name}=total_ms:{entry['total_ns'] / 1e6:.3f},"
+                f"max_ms:{entry['max_ns'] / 1e6:.3f},items:{entry['items']}"
+                for name, entry in sorted(bucket.items())
+            ]
+
+        parts = [f"prs={self.prs}"] + fmt("gate", self.stages) + fmt("fetch", self.fetches)
+        log_event("pr_gate_timing", " ".join(parts))
@@ -1,58 +1,93 @@
+import asyncio
 import json
 import time
-import urllib.request
-import urllib.error
 import re
 import subprocess # Added for git command
 import sys # Added for sys.exit
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
 from datetime import datetime, timezone
 try:
     from governance_enforcement import GovernanceEnforcer, GovernanceViolation
 except ImportError:
     from supervisor.governance_enforcement import GovernanceEnforcer, GovernanceViolation
+from supervisor.file_watcher import get_file_watcher
+from supervisor.log_store import append_record
+from supervisor.pr_gate import issue_ops
+from supervisor.pr_gate.http_client import get_response_cache, get_retry_policy, json_request
 from supervisor.pr_gate.logger import log_event
+from supervisor.pr_gate.timing import CycleTiming, timed_call, timing_enabled
 try:
     from pr_gate import (
-        EvaluationCache,
+        AsyncGiteaClient,
         GiteaClientError,
+        LockIndex,
         PolicyLoadError,
         StatusPublishError,
-        evaluate_pr,
+        compile_policy,
+        content_cache_from_env,
+        enrich_pull_request_commits,
+        evaluation_cache_from_env,
         gate_report,
         get_commit_statuses,
         get_open_pull_requests,
+        get_pull_request_commit_list,
         get_pull_request_commits,
         get_pull_request_files,
         get_pull_request_reviews,
+        incremental_evaluator_from_env,
+        iter_evaluate_prs,
+        iter_paginated,
         load_policy,
+        pr_content_key,
+        prefetch_pull_request_heads,
         publish_governance_status,
+        run_with_deadline,
         write_gate_artifact,
+        write_lock_index_artifact,
     )
 except ImportError:
     from supervisor.pr_gate import (
-        EvaluationCache,
+        AsyncGiteaClient,
         GiteaClientError,
+        LockIndex,
         PolicyLoadError,
         StatusPublishError,
-        evaluate_pr,
+        compile_policy,
+        content_cache_from_env,
+        enrich_pull_request_commits,
+        evaluation_cache_from_env,
         gate_report,
         get_commit_statuses,
         get_open_pull_requests,
+        get_pull_request_commit_list,
         get_pull_request_commits,
         get_pull_request_files,
         get_pull_request_reviews,
+        incremental_evaluator_from_env,
+        iter_evaluate_prs,
+        iter_paginated,
         load_policy,
+        pr_content_key,
+        prefetch_pull_request_heads,
         publish_governance_status,
+        run_with_deadline,
         write_gate_artifact,
+        write_lock_index_artifact,
     )
 from supervisor.environment_validation import validate_environment
+from supervisor.webhook_intake import DEFAULT_RECONCILE_SECONDS, WebhookIntake
 from executor.dispatch import DispatchFailure, dispatch_task_once
 from orchestrator.git import create_governed_commit
 
 TTL_SECONDS = 1800
 PR_GATE_TARGET_BRANCHES = {"main", "develop"}
 DEFAULT_POLICY_PATH = "governance/policy/pr-governance.v0.2.yaml"
+DEFAULT_PR_GATE_FETCH_CONCURRENCY = 8
+DEFAULT_CYCLE_DEADLINE_SECONDS = 120
 PHASE_MILESTONE_NAMES = [
     "Phase 1 — Governed Core Runtime",
     "Phase 2 — Environment Validation Layer",
@@ -103,20 +138,34 @@ def get_repo_identity_from_remote_url():
         
     raise ValueError(f"Unsupported git remote URL format: {url}")
 
+def iter_open_issues(api_base, owner, repo, headers=None):
+    """Lazily yields open issues page by page; stop iterating to skip later pages."""
+    api_url = f"{api_base}/repos/{owner}/{repo}/issues?state=open"
+    return iter_paginated(api_url, "issues", headers=headers)
+
 def get_open_issues(api_base, owner, repo, headers=None):
     """Fetches open issues from the Gitea API."""
-    api_url = f"{api_base}/repos/{owner}/{repo}/issues?state=open&limit=300"
-    status, data, _ = _api_json_request("GET", api_url, headers=headers)
-    if status == 200 and isinstance(data, list):
-        return data
-    return []
+    try:
+        return list(iter_open_issues(api_base, owner, repo, headers=headers))
+    except GiteaClientError:
+        return []
 
 def get_all_issues(api_base, owner, repo, headers=None):
-    api_url = f"{api_base}/repos/{owner}/{repo}/issues?state=all&limit=300"
-    status, data, _ = _api_json_request("GET", api_url, headers=headers)
-    if status == 200 and isinstance(data, list):
-        return data
-    return []
+    api_url = f"{api_base}/repos/{owner}/{repo}/issues?state=all"
+    try:
+        return list(iter_paginated(api_url, "issues", headers=headers))
+    except GiteaClientError:
+        return []
+
+def first_open_issue_matching(api_base, owner, repo, predicate, headers=None):
+    """Returns the first open issue satisfying predicate without fetching later pages."""
+    try:
+        for issue in iter_open_issues(api_base, owner, repo, headers=headers):
+            if predicate(issue):
+                return issue
+    except GiteaClientError:
+        return None
+    return None
 
 def _policy_path():
     return os.environ.get("PR_GATE_POLICY_PATH", DEFAULT_POLICY_PATH)
@@ -149,6 +198,134 @@ def enforce_policy_hash_lockdown(policy_hash_baseline, policy_path=None):
         )
     return current_hash
 
+def _pr_gate_fetch_concurrency():
+    raw = os.environ.get("PR_GATE_FETCH_CONCURRENCY", "")
+    try:
+        value = int(raw) if raw else DEFAULT_PR_GATE_FETCH_CONCURRENCY
+    except ValueError:
+        value = DEFAULT_PR_GATE_FETCH_CONCURRENCY
+    return max(1, value)
+
+def _cycle_deadline_seconds():
+    raw = os.environ.get("PR_GATE_CYCLE_DEADLINE_SECONDS", "")
+    try:
+        value = float(raw) if raw else DEFAULT_CYCLE_DEADLINE_SECONDS
+    except ValueError:
+        value = DEFAULT_CYCLE_DEADLINE_SECONDS
+    return value if value > 0 else DEFAULT_CYCLE_DEADLINE_SECONDS
+
+def fetch_cycle_snapshot(api_base, owner, repo, headers):
+    """
+    Open PRs, open issues and milestones of one cycle, fetched concurrently in
+    one event loop. Requests still running at PR_GATE_CYCLE_DEADLINE_SECONDS
+    are cancelled and the cycle fails closed with GiteaClientError.
+    """
+    deadline = _cycle_deadline_seconds()
+
+    async def fetch():
+        async with AsyncGiteaClient(
+            api_base, headers=headers, concurrency=_pr_gate_fetch_concurrency()
+        ) as client:
+            return await run_with_deadline(
+                client.fetch_cycle_snapshot(owner, repo, target_branches=PR_GATE_TARGET_BRANCHES),
+                deadline,
+            )
+
+    try:
+        return asyncio.run(fetch())
+    except asyncio.TimeoutError as exc:
+        raise GiteaClientError(f"Cycle snapshot exceeded deadline_seconds={deadline}") from exc
+    except OSError as exc:
+        raise GiteaClientError(f"Cycle snapshot failed: {exc}") from exc
+
+def _cached_pr_files(content_cache, content_key, api_base, owner, repo, pr_number, headers=None):
+    return content_cache.get_or_fetch(
+        content_key,
+        "files",
+        lambda: get_pull_request_files(api_base, owner, repo, pr_number, headers=headers),
+    )
+
+def _cached_pr_commits(content_cache, content_key, api_base, owner, repo, pr_number, head_sha, headers=None):
+    # Only Gitea's commit list is cached; signatures are re-checked against the current keyring.
+    commits = content_cache.get_or_fetch(
+        content_key,
+        "commits",
+        lambda: get_pull_request_commit_list(api_base, owner, repo, pr_number, headers=headers),
+    )
+    return enrich_pull_request_commits(pr_number, commits, head_sha)
+
+def _submit_pr_input_fetches(
+    executor, api_base, owner, repo, headers, pr_number, head_sha, timed=False, content_cache=None, content_key=None
+):
+    # With timing on, each future resolves to (value, {"duration_ns", "items"}).
+    submit = (lambda fn, *a, **k: executor.submit(timed_call, fn, *a, **k)) if timed else executor.submit
+    if content_cache is not None:
+        # Files and commits are fixed by the head; only reviews and statuses are refetched.
+        commits = submit(
+            _cached_pr_commits, content_cache, content_key, api_base, owner, repo, pr_number, head_sha,
+            headers=headers,
+        )
+        files = submit(
+            _cached_pr_files, content_cache, content_key, api_base, owner, repo, pr_number, headers=headers
+        )
+    else:
+        commits = submit(
+            get_pull_request_commits, api_base, owner, repo, pr_number, head_sha, headers=headers
+        )
+        files = submit(
+            get_pull_request_files, api_base, owner, repo, pr_number, headers=headers
+        )
+    return {
+        "commits": commits,
+        "files": files,
+        "reviews": submit(
+            get_pull_request_reviews, api_base, owner, repo, pr_number, headers=headers
+        ),
+        "statuses": submit(
+            get_commit_statuses, api_base, owner, repo, head_sha, headers=headers
+        ),
+    }
+
+def _pr_head_sha(pr):
+    return ((pr.get("head") or {}).get("sha") or "").strip()
+
+def _iter_prefetched_pr_inputs(
+    api_base, owner, repo, headers, pending_prs, concurrency, timed=False, content_cache=None
+):
+    """
+    Yields (pr, pr_number, head_sha, futures) in input order while keeping up to
+    `concurrency` PRs' commits/files/reviews/statuses fetches in flight. Fetch
+    errors surface only when the caller reaches that PR, as in sequential order.
+    """
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pr-gate-fetch")
+
+    def submit(entry):
+        pr, pr_number, head_sha = entry
+        fetches = _submit_pr_input_fetches(
+            executor,
+            api_base,
+            owner,
+            repo,
+            headers,
+            pr_number,
+            head_sha,
+            timed=timed,
+            content_cache=content_cache,
+            content_key=pr_content_key(owner, repo, pr) if content_cache is not None else None,
+        )
+        return pr, pr_number, head_sha, fetches
+
+    try:
+        queued = iter(pending_prs)
+        window = deque(submit(entry) for entry in islice(queued, concurrency))
+        while window:
+            current = window.popleft()
+            for entry in islice(queued, 1):
+                window.append(submit(entry))
+            yield current
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 def run_pr_governance_gate(
     api_base,
     owner,
@@ -157,6 +334,10 @@ def run_pr_governance_gate(
     pr_eval_cache,
     enforcer,
     policy_hash_baseline,
+    fetch_concurrency=None,
+    incremental_evaluator=None,
+    content_cache=None,
+    open_prs=None,
 ):
     policy_path = _policy_path()
     policy, policy_hash = load_policy(policy_path)
@@ -172,87 +353,130 @@ def run_pr_governance_gate(
             "POLICY_LOCKDOWN "
             f"baseline={policy_hash_baseline} current={policy_hash}"
         )
-    open_prs = get_open_pull_requests(
-        api_base,
-        owner,
-        repo,
-        headers=headers,
-        target_branches=PR_GATE_TARGET_BRANCHES,
+    policy = compile_policy(policy, policy_hash)
+    if open_prs is None:
+        open_prs = get_open_pull_requests(
+            api_base,
+            owner,
+            repo,
+            headers=headers,
+            target_branches=PR_GATE_TARGET_BRANCHES,
+        )
+
+    lock_index = LockIndex(open_prs)
+    write_lock_index_artifact(lock_index, policy_hash)
+    if incremental_evaluator is not None:
+        incremental_evaluator.retain(pr.get("number") for pr in open_prs)
+    pr_eval_cache.retain(
+        {pr.get("number"): _pr_head_sha(pr) for pr in open_prs if pr.get("number") is not None},
+        policy_hash,
     )
+    if content_cache is not None:
+        content_cache.retain(pr_content_key(owner, repo, pr) for pr in open_prs)
+
+    pending_prs = []
+    malformed_pr = False
     for pr in open_prs:
         pr_number = pr.get("number")
-        head_sha = ((pr.get("head") or {}).get("sha") or "").strip()
+        head_sha = _pr_head_sha(pr)
         if pr_number is None or not head_sha:
-            raise RuntimeError("PR gate data missing number/head sha")
-
+            malformed_pr = True
+            break
         if pr_eval_cache.seen(pr_number, head_sha, policy_hash):
             continue
+        pending_prs.append((pr, pr_number, head_sha))
 
-        publish_governance_status(
-            api_base=api_base,
-            owner=owner,
-            repo=repo,
-            sha=head_sha,
-            state="pending",
-            description="governance evaluation in progress",
-            headers=headers,
-        )
+    if pending_prs:
+        prefetch_pull_request_heads([head_sha for _, _, head_sha in pending_prs])
 
-        commits = get_pull_request_commits(
-            api_base,
-            owner,
-            repo,
-            pr_number,
-            head_sha,
-            headers=headers,
-        )
-        files = get_pull_request_files(api_base, owner, repo, pr_number, headers=headers)
-        reviews = get_pull_request_reviews(api_base, owner, repo, pr_number, headers=headers)
-        statuses = get_commit_statuses(api_base, owner, repo, head_sha, headers=headers)
-
-        eval_pr = dict(pr)
-        eval_pr["_open_prs"] = open_prs
-        result = evaluate_pr(policy, eval_pr, commits, files, reviews, statuses)
-        for gate_event in result.get("gate_events", []):
-            log_event(
-                "evaluate_pr",
-                (
-                    f"gate={gate_event.get('gate')} "
-                    f"result={gate_event.get('result')} reason={gate_event.get('reason')}"
-                ),
-            )
-        log_event(
-            "evaluate_pr",
-            (
-                f"FINAL result={'PASS' if result.get('passed', False) else 'FAIL'} "
-                f"failed_gates={result.get('failed_gates', [])}"
-            ),
-        )
-        write_gate_artifact(pr_number, head_sha, policy_hash, result)
-        if result.get("passed", False):
+    concurrency = fetch_concurrency or _pr_gate_fetch_concurrency()
+    timed = timing_enabled()
+    cycle_timing = CycleTiming() if timed else None
+    fetch_timings = {}
+    prefetched = _iter_prefetched_pr_inputs(
+        api_base, owner, repo, headers, pending_prs, concurrency, timed=timed, content_cache=content_cache
+    )
+
+    def staged_inputs():
+        for pr, pr_number, head_sha, fetches in prefetched:
             publish_governance_status(
                 api_base=api_base,
                 owner=owner,
                 repo=repo,
                 sha=head_sha,
-                state="success",
-                description="governance requirements satisfied",
+                state="pending",
+                description="governance evaluation in progress",
                 headers=headers,
             )
-        else:
-            publish_governance_status(
-                api_base=api_base,
-                owner=owner,
-                repo=repo,
-                sha=head_sha,
-                state="failure",
-                description="governance requirements failed",
-                headers=headers,
+            inputs = {}
+            for name in ("commits", "files", "reviews", "statuses"):
+                if timed:
+                    waited = time.perf_counter_ns()
+                    inputs[name], fetch_timing = fetches[name].result()
+                    fetch_timing["wait_ns"] = time.perf_counter_ns() - waited
+                    fetch_timings[pr_number, name] = fetch_timing
+                else:
+                    inputs[name] = fetches[name].result()
+            yield pr, inputs
+
+    with closing(prefetched):
+        for pr, result in iter_evaluate_prs(
+            policy, staged_inputs(), lock_index=lock_index, incremental=incremental_evaluator, timed=timed
+        ):
+            pr_number = pr.get("number")
+            head_sha = _pr_head_sha(pr)
+            if timed:
+                result["timing"]["fetches"] = {
+                    name: fetch_timings.pop((pr_number, name))
+                    for name in ("commits", "files", "reviews", "statuses")
+                }
+                cycle_timing.add(result)
+            for gate_event in result.get("gate_events", []):
+                log_event(
+                    "evaluate_pr",
+                    (
+                        f"gate={gate_event.get('gate')} "
+                        f"result={gate_event.get('result')} reason={gate_event.get('reason')}"
+                    ),
+                )
+            log_event(
+                "evaluate_pr",
+                (
+                    f"FINAL result={'PASS' if result.get('passed', False) else 'FAIL'} "
+                    f"failed_gates={result.get('failed_gates', [])}"
+                ),
             )
-            enforcer.enforce_pr_gate_result(pr_number, result)
+            write_gate_artifact(pr_number, head_sha, policy_hash, result)
+            if result.get("passed", False):
+                publish_governance_status(
+                    api_base=api_base,
+                    owner=owner,
+                    repo=repo,
+                    sha=head_sha,
+                    state="success",
+                    description="governance requirements satisfied",
+                    headers=headers,
+                )
+            else:
+                publish_governance_status(
+                    api_base=api_base,
+                    owner=owner,
+                    repo=repo,
+                    sha=head_sha,
+                    state="failure",
+                    description="governance requirements failed",
+                    headers=headers,
+                )
+                enforcer.enforce_pr_gate_result(pr_number, result)
 
-        print(gate_report(pr_number, head_sha, policy_hash, result))
-        pr_eval_cache.mark(pr_number, head_sha, policy_hash)
+            print(gate_report(pr_number, head_sha, policy_hash, result))
+            pr_eval_cache.mark(pr_number, head_sha, policy_hash)
+
+    if cycle_timing is not None:
+        cycle_timing.log()
+
+    if malformed_pr:
+        raise RuntimeError("PR gate data missing number/head sha")
 
 def _auth_headers(env):
     """Builds optional Gitea authentication headers from env json or process env."""
@@ -277,37 +501,19 @@ def _auth_headers(env):
     return headers
 
 def _api_json_request(method, url, payload=None, headers=None):
-    req_headers = {"Accept": "application/json"}
-    if headers:
-        req_headers.update(headers)
-    data = None
-    if payload is not None:
-        req_headers["Content-Type"] = "application/json"
-        data = json.dumps(payload).encode("utf-8")
-
-    req = urllib.request.Request(url, data=data, headers=req_headers, method=method)
-    try:
-        with urllib.request.urlopen(req, timeout=5) as response:
-            raw = response.read().decode()
-            parsed = json.loads(raw) if raw else None
-            return response.status, parsed, raw
-    except urllib.error.HTTPError as e:
-        raw = e.read().decode() if e.fp else ""
-        parsed = None
-        if raw:
-            try:
-                parsed = json.loads(raw)
-            except Exception:
-                parsed = None
-        return e.code, parsed, raw
+    status, parsed, raw, _ = json_request(method, url, payload=payload, headers=headers)
+    return status, parsed, raw
+
+def _run_issue_op(api_base, headers, operation):
+    def request(method, path, payload):
+        return _api_json_request(method, f"{api_base}/{path}", payload=payload, headers=headers)
+    return issue_ops.run_operation(operation, request)
 
 def _utc_iso8601():
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 def _append_execution_log(entry):
-    os.makedirs("logs", exist_ok=True)
-    with open("logs/execution_cycle.log", "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, sort_keys=True) + "\n")
+    append_record("logs/execution_cycle.log", entry)
 
 def _extract_allowed_files(instruction_text):
     return sorted(set(re.findall(r"`([A-Za-z0-9_./-]+)`", instruction_text)))
@@ -337,72 +543,17 @@ def resolve_canonical_repo(api_base, owner, repo, headers):
     return owner, repo
 
 def ensure_in_progress_label(api_base, owner, repo, headers):
-    labels_url = f"{api_base}/repos/{owner}/{repo}/labels"
-    status, labels, raw = _api_json_request("GET", labels_url, headers=headers)
-    if status != 200 or not isinstance(labels, list):
-        print(f"Failed to list labels. Status={status}. Body={raw}")
-        return None
-
-    for label in labels:
-        if label.get("name") == "in-progress":
-            return label.get("id")
-
-    create_payload = {
-        "name": "in-progress",
-        "color": "f29513",
-        "description": "Task currently claimed by supervisor",
-    }
-    create_status, created, create_raw = _api_json_request(
-        "POST", labels_url, payload=create_payload, headers=headers
-    )
-    if create_status in (200, 201) and isinstance(created, dict):
-        return created.get("id")
-
-    print(
-        "Failed to create 'in-progress' label. "
-        f"Status={create_status}. Body={create_raw}"
-    )
-
-    # Label may already exist due to race; re-fetch once.
-    status, labels, raw = _api_json_request("GET", labels_url, headers=headers)
-    if status != 200 or not isinstance(labels, list):
-        print(f"Failed to re-list labels. Status={status}. Body={raw}")
-        return None
-    for label in labels:
-        if label.get("name") == "in-progress":
-            return label.get("id")
-    return None
+    return _run_issue_op(api_base, headers, issue_ops.ensure_in_progress_label(owner, repo))
 
 def attach_label_id_to_issue(api_base, owner, repo, issue_number, label_id, headers):
-    url = f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}/labels"
-    status, _, raw = _api_json_request(
-        "POST",
-        url,
-        payload={"labels": [label_id]},
-        headers=headers,
-    )
-    if status in (200, 201):
-        return True
-    print(
-        f"Failed to attach label id {label_id} to issue #{issue_number}. "
-        f"Status={status}. Body={raw}"
+    return _run_issue_op(
+        api_base, headers, issue_ops.attach_label_id_to_issue(owner, repo, issue_number, label_id)
     )
-    return False
 
 def verify_issue_has_in_progress(api_base, owner, repo, issue_number, headers):
-    url = f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}/labels"
-    status, labels, raw = _api_json_request("GET", url, headers=headers)
-    if status != 200 or not isinstance(labels, list):
-        print(
-            f"Failed to verify labels for issue #{issue_number}. "
-            f"Status={status}. Body={raw}"
-        )
-        print("CLAIM_VERIFIED in-progress present=false")
-        return False
-
-    present = any(lbl.get("name") == "in-progress" for lbl in labels)
-    print(f"CLAIM_VERIFIED in-progress present={str(present).lower()}")
-    return present
+    return _run_issue_op(
+        api_base, headers, issue_ops.verify_issue_has_in_progress(owner, repo, issue_number)
+    )
 
 def claim_issue_with_in_progress(api_base, owner, repo, issue_number, headers):
     label_id = ensure_in_progress_label(api_base, owner, repo, headers)
@@ -418,46 +569,13 @@ def claim_issue_with_in_progress(api_base, owner, repo, issue_number, headers):
     return attached and verified
 
 def post_issue_comment(api_base, owner, repo, issue_number, body, headers):
-    url = f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    status, _, raw = _api_json_request("POST", url, payload={"body": body}, headers=headers)
-    if status not in (200, 201):
-        print(f"Failed to post issue comment for #{issue_number}. Status={status}. Body={raw}")
-        return False
-    return True
+    return _run_issue_op(api_base, headers, issue_ops.post_issue_comment(owner, repo, issue_number, body))
 
 def close_issue(api_base, owner, repo, issue_number, headers):
-    url = f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}"
-    status, _, raw = _api_json_request("PATCH", url, payload={"state": "closed"}, headers=headers)
-    if status not in (200, 201):
-        print(f"Failed to close issue #{issue_number}. Status={status}. Body={raw}")
-        return False
-    return True
+    return _run_issue_op(api_base, headers, issue_ops.close_issue(owner, repo, issue_number))
 
 def ensure_repo_label(api_base, owner, repo, label_name, headers):
-    labels_url = f"{api_base}/repos/{owner}/{repo}/labels"
-    status, labels, raw = _api_json_request("GET", labels_url, headers=headers)
-    if status != 200 or not isinstance(labels, list):
-        print(f"Failed to list labels. Status={status}. Body={raw}")
-        return None
-    for label in labels:
-        if label.get("name") == label_name:
-            return label.get("id")
-
-    create_payload = {
-        "name": label_name,
-        "color": "0e8a16",
-        "description": f"{label_name} label",
-    }
-    create_status, created, create_raw = _api_json_request(
-        "POST", labels_url, payload=create_payload, headers=headers
-    )
-    if create_status in (200, 201) and isinstance(created, dict):
-        return created.get("id")
-    print(
-        f"Failed to create '{label_name}' label. "
-        f"Status={create_status}. Body={create_raw}"
-    )
-    return None
+    return _run_issue_op(api_base, headers, issue_ops.ensure_repo_label(owner, repo, label_name))
 
 def _highest_auto_task_counter(issues):
     max_counter = 0
@@ -626,9 +744,8 @@ def _phase_milestone_lookup(milestones):
     return lookup
 
 def _issue_last_in_progress_event_at(api_base, owner, repo, issue_number, headers):
-    timeline_url = f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}/timeline"
-    status, body, _ = _api_json_request("GET", timeline_url, headers=headers)
-    if status != 200 or not isinstance(body, list):
+    body = _run_issue_op(api_base, headers, issue_ops.get_issue_timeline(owner, repo, issue_number))
+    if body is None:
         return None
     latest = None
     for event in body:
@@ -644,38 +761,7 @@ def _issue_last_in_progress_event_at(api_base, owner, repo, issue_number, header
     return latest
 
 def remove_in_progress_label(api_base, owner, repo, issue_number, headers):
-    labels_url = f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}/labels"
-    status, labels, raw = _api_json_request("GET", labels_url, headers=headers)
-    if status != 200 or not isinstance(labels, list):
-        print(
-            f"Failed to list issue labels for #{issue_number}. "
-            f"Status={status}. Body={raw}"
-        )
-        return False
-
-    target = None
-    for lbl in labels:
-        if lbl.get("name") == "in-progress":
-            target = lbl
-            break
-    if target is None:
-        return True
-
-    label_id = target.get("id")
-    if label_id is None:
-        return False
-
-    delete_url = (
-        f"{api_base}/repos/{owner}/{repo}/issues/{issue_number}/labels/{label_id}"
-    )
-    del_status, _, del_raw = _api_json_request("DELETE", delete_url, headers=headers)
-    if del_status not in (200, 204):
-        print(
-            f"Failed to remove in-progress label from #{issue_number}. "
-            f"Status={del_status}. Body={del_raw}"
-        )
-        return False
-    return True
+    return _run_issue_op(api_base, headers, issue_ops.remove_in_progress_label(owner, repo, issue_number))
 
 def release_stale_in_progress_claims(api_base, owner, repo, issues, headers, ttl_seconds):
     now = datetime.now(timezone.utc)
@@ -749,12 +835,7 @@ def verify_executor_result(result, dispatch_input, max_duration_seconds):
     }
 
 def get_milestones(api_base, owner, repo, headers):
-    url = f"{api_base}/repos/{owner}/{repo}/milestones?state=all"
-    status, body, raw = _api_json_request("GET", url, headers=headers)
-    if status != 200 or not isinstance(body, list):
-        print(f"Failed to list milestones. Status={status}. Body={raw}")
-        return []
-    return body
+    return _run_issue_op(api_base, headers, issue_ops.get_milestones(owner, repo))
 
 def _phase_sort_key(milestone):
     title = milestone.get("title", "")
@@ -838,8 +919,14 @@ def governance_phase_complete(
     if last_requires_commit and not last_commit_created:
         return False
 
-    issues = get_open_issues(api_base, owner, repo, headers=headers)
-    return not _phase_has_open_build_or_in_progress(issues, phase_id)
+    blocking = first_open_issue_matching(
+        api_base,
+        owner,
+        repo,
+        lambda issue: _phase_has_open_build_or_in_progress([issue], phase_id),
+        headers=headers,
+    )
+    return blocking is None
 
 def select_task_for_phase(issues, active_phase_id):
     available_issues = [issue for issue in issues if _is_eligible_build_issue(issue, active_phase_id)]
@@ -849,9 +936,14 @@ def count_eligible_tasks_for_phase(issues, active_phase_id):
     return len([issue for issue in issues if _is_eligible_build_issue(issue, active_phase_id)])
 
 def phase_complete_recheck(api_base, owner, repo, headers, active_phase_id):
-    issues = get_open_issues(api_base, owner, repo, headers=headers)
-    remaining = [issue for issue in issues if _is_eligible_build_issue(issue, active_phase_id)]
-    return len(remaining) == 0
+    remaining = first_open_issue_matching(
+        api_base,
+        owner,
+        repo,
+        lambda issue: _is_eligible_build_issue(issue, active_phase_id),
+        headers=headers,
+    )
+    return remaining is None
 
 def get_next_phase_name(milestones, active_phase_id):
     ordered = sorted(milestones, key=_phase_sort_key)
@@ -909,12 +1001,60 @@ def select_task(issues):
 
     return min(available_issues, key=lambda i: i['number'])
 
+def _start_webhook_intake(env):
+    """Starts the webhook listener when both a secret and a port are configured."""
+    secret = env.get("webhook_secret") or os.environ.get("GITEA_WEBHOOK_SECRET")
+    port = env.get("webhook_port") or os.environ.get("SUPERVISOR_WEBHOOK_PORT")
+    if not secret or not port:
+        return None
+    host = env.get("webhook_host") or os.environ.get("SUPERVISOR_WEBHOOK_HOST", "127.0.0.1")
+    return WebhookIntake(secret, host=host, port=int(port)).start()
+
+def _reconcile_seconds():
+    raw = os.environ.get("SUPERVISOR_RECONCILE_SECONDS", "")
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_RECONCILE_SECONDS
+    except ValueError:
+        return DEFAULT_RECONCILE_SECONDS
+
+def _wait_for_next_cycle(webhook_intake):
+    """
+    Without webhooks, sleep the fixed autonomy interval. With webhooks, wake as
+    soon as work is queued and fall back to a slow reconciliation poll.
+    """
+    if webhook_intake is None:
+        time.sleep(AUTONOMY_SLEEP_SECONDS)
+        return
+    webhook_intake.wait_for_work(_reconcile_seconds())
+
+def apply_webhook_work(items, pr_eval_cache):
+    """Drops cached gate verdicts touched by webhook events so they re-evaluate now."""
+    for kind, key in items:
+        if kind == "pr":
+            pr_eval_cache.invalidate(pr_number=key)
+        elif kind == "commit":
+            pr_eval_cache.invalidate(head_sha=key)
+    if items:
+        log_event("webhook", f"cycle_wakeup items={','.join(f'{k}:{v}' for k, v in items)}")
+
+def _read_environment(env_file, file_watcher=None):
+    """environment.json, parsed only after it changes when a file watcher is available."""
+    if file_watcher is not None:
+        return file_watcher.load_json(env_file)
+    with open(env_file, "r") as f:
+        return json.load(f)
+
 def main():
     """Main supervisor loop."""
     env_file = "agents/state/environment.json"
+    file_watcher = get_file_watcher()
+    if file_watcher is not None:
+        file_watcher.start()
+        log_event("file_watcher", f"started backend={file_watcher.backend}")
     enforcer = GovernanceEnforcer(
         governance_path="docs/governance.md",
         environment_path=env_file,
+        watcher=file_watcher,
     )
     try:
         context_info = enforcer.load_context()
@@ -940,12 +1080,16 @@ def main():
         "recursive_rollback": False,
         "commit_determinism_mismatch": False,
     }
-    pr_eval_cache = EvaluationCache()
+    pr_eval_cache = evaluation_cache_from_env()
+    incremental_evaluator = incremental_evaluator_from_env()
+    content_cache = content_cache_from_env()
     policy_hash_baseline = None
+    webhook_intake = _start_webhook_intake(_read_environment(env_file, file_watcher))
     
     while True:
-        with open(env_file, "r") as f:
-            env = json.load(f)
+        if webhook_intake is not None:
+            apply_webhook_work(webhook_intake.queue.drain(), pr_eval_cache)
+        env = _read_environment(env_file, file_watcher)
             
         api_base = env.get("api_base")
 
@@ -984,6 +1128,7 @@ def main():
 
         log_event("PR_GATE", "run_pr_governance_gate start")
         try:
+            snapshot = fetch_cycle_snapshot(api_base, owner, repo, headers)
             run_pr_governance_gate(
                 api_base=api_base,
                 owner=owner,
@@ -992,6 +1137,9 @@ def main():
                 pr_eval_cache=pr_eval_cache,
                 enforcer=enforcer,
                 policy_hash_baseline=policy_hash_baseline,
+                incremental_evaluator=incremental_evaluator,
+                content_cache=content_cache,
+                open_prs=snapshot["open_prs"],
             )
         except (
             PolicyLoadError,
@@ -1008,12 +1156,56 @@ def main():
             continue
         log_event("PR_GATE", "run_pr_governance_gate end")
 
-        issues = get_open_issues(api_base, owner, repo, headers=headers)
         release_stale_in_progress_claims(
-            api_base, owner, repo, issues, headers, TTL_SECONDS
+            api_base, owner, repo, snapshot["open_issues"], headers, TTL_SECONDS
         )
         issues = get_open_issues(api_base, owner, repo, headers=headers)
-        milestones = get_milestones(api_base, owner, repo, headers)
+        milestones = snapshot["milestones"]
+        cache_stats = get_response_cache().stats()
+        log_event(
+            "http_cache",
+            (
+                f"entries={cache_stats['entries']} hits={cache_stats['hits']} "
+                f"misses={cache_stats['misses']} evictions={cache_stats['evictions']}"
+            ),
+        )
+        retry_stats = get_retry_policy().stats()
+        log_event(
+            "http_retry",
+            (
+                f"retries={retry_stats['retries']} trips={retry_stats['trips']} "
+                f"open={','.join(retry_stats['open']) or 'none'}"
+            ),
+        )
+        eval_cache_stats = pr_eval_cache.stats()
+        log_event(
+            "pr_eval_cache",
+            (
+                f"entries={eval_cache_stats['entries']} hits={eval_cache_stats['hits']} "
+                f"misses={eval_cache_stats['misses']} hit_rate={eval_cache_stats['hit_rate']}"
+            ),
+        )
+        if content_cache is not None:
+            content_stats = content_cache.stats()
+            log_event(
+                "pr_content_cache",
+                (
+                    f"memory_entries={content_stats['memory_entries']} "
+                    f"memory_hits={content_stats['memory_hits']} "
+                    f"disk_hits={content_stats['disk_hits']} misses={content_stats['misses']}"
+                ),
+            )
+        if incremental_evaluator is not None:
+            incremental_stats = incremental_evaluator.stats()
+            log_event(
+                "pr_gate_incremental",
+                (
+                    f"stages_run={incremental_stats['stages_run']} "
+                    f"stages_reused={incremental_stats['stages_reused']} "
+                    f"self_checks={incremental_stats['self_checks']} "
+                    f"mismatches={incremental_stats['self_check_mismatches']}"
+                ),
+            )
 
         phase_lookup = _phase_milestone_lookup(milestones)
         active_phase = detect_active_phase_for_governance(milestones, issues)
@@ -1027,32 +1219,32 @@ def main():
                     if prior_cycle["governance_violation"]:
                         print("RECURSION_BLOCKED reason=prior_violation")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
                     if prior_cycle["environment_failed"]:
                         print("RECURSION_BLOCKED reason=environment_validation_failed")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
                     if prior_cycle["recursive_rollback"]:
                         print("RECURSION_BLOCKED reason=recursive_rollback")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
                     if prior_cycle["commit_determinism_mismatch"]:
                         print("RECURSION_BLOCKED reason=commit_determinism_mismatch")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
                     if not _has_successful_autonomous_cycle(all_issues):
                         print("RECURSION_BLOCKED reason=no_successful_autonomous_cycle")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
                     if not _recursive_cooldown_ok(all_issues):
                         print("RECURSION_BLOCKED reason=cooldown")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
 
                     print("RECURSIVE_AUTONOMY_ENABLED")
@@ -1069,15 +1261,15 @@ def main():
                     else:
                         print("Governance violation: autonomous task creation failed")
                         print(enforcer.compliance_report_block())
-                        time.sleep(AUTONOMY_SLEEP_SECONDS)
+                        _wait_for_next_cycle(webhook_intake)
                         continue
                     print(f"AUTONOMY_SLEEP interval_seconds={AUTONOMY_SLEEP_SECONDS}")
                     print(enforcer.compliance_report_block())
-                    time.sleep(AUTONOMY_SLEEP_SECONDS)
+                    _wait_for_next_cycle(webhook_intake)
                     continue
             print("NO_ELIGIBLE_BUILD_ISSUES active_phase=none")
             print(enforcer.compliance_report_block())
-            time.sleep(AUTONOMY_SLEEP_SECONDS)
+            _wait_for_next_cycle(webhook_intake)
             continue
 
         active_phase_id = active_phase["id"]
@@ -1348,7 +1540,7 @@ def main():
         else:
             print("NO_ELIGIBLE_BUILD_ISSUES active_phase=none")
         print(enforcer.compliance_report_block())
-        time.sleep(AUTONOMY_SLEEP_SECONDS) # Sleep even if claiming failed or all issues are in-progress
+        _wait_for_next_cycle(webhook_intake) # Sleep even if claiming failed or all issues are in-progress
 
 if __name__ == "__main__":
     main()
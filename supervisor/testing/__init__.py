@@ -0,0 +1,11 @@
+from supervisor.testing.fake_gitea import (
+    FakeGitea,
+    FakeGiteaData,
+    generate_dataset,
+)
+
+__all__ = [
+    "FakeGitea",
+    "FakeGiteaData",
+    "generate_dataset",
+]
@@ -0,0 +1,547 @@
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_MAX_PAGE_LIMIT = 50
+PHASE_TITLES = [
+    "Phase 1 — Governed Core Runtime",
+    "Phase 2 — Environment Validation Layer",
+    "Phase 3 — Task Execution Engine",
+    "Phase 4 — Result & State Management",
+    "Phase 5 — End-to-End Governed Autonomy",
+]
+_PR_BODY = (
+    "### Subsystem\n{subsystem}\n"
+    "### Risk Level\nmedium\n"
+    "### Determinism Impact\nnone expected\n"
+    "### Lock Required?\n{lock}\n"
+    "### Tests Executed\nunit-tests green\n"
+    "### Rollback Plan\nrevert the merge commit\n"
+    "### Issue\n#{issue}\n"
+)
+_STAMP = "2026-01-01T00:00:00Z"
+
+
+def _sha(*parts):
+    return hashlib.sha1("/".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+class FakeGiteaData:
+    """In-memory Gitea state: one repo's labels, milestones, issues and pulls."""
+
+    def __init__(self, owner="Don", repo="dev"):
+        self.owner = owner
+        self.repo = repo
+        self.labels = []
+        self.milestones = []
+        self.issues = {}
+        self.pulls = {}
+        self.pull_files = {}
+        self.pull_commits = {}
+        self.pull_reviews = {}
+        self.statuses = {}
+        self.timelines = {}
+        self.comments = {}
+        self._next_label_id = 1
+        self._next_number = 1
+        self._lock = threading.RLock()
+
+    def add_label(self, name, color="0e8a16", description=""):
+        with self._lock:
+            label = {"id": self._next_label_id, "name": name, "color": color, "description": description}
+            self._next_label_id += 1
+            self.labels.append(label)
+            return label
+
+    def label_by_id(self, label_id):
+        return next((label for label in self.labels if label["id"] == label_id), None)
+
+    def label_by_name(self, name):
+        return next((label for label in self.labels if label["name"] == name), None)
+
+    def add_milestone(self, title):
+        milestone = {"id": len(self.milestones) + 1, "title": title, "state": "open"}
+        self.milestones.append(milestone)
+        return milestone
+
+    def add_issue(self, title, body="", labels=(), milestone=None, state="open"):
+        with self._lock:
+            number = self._next_number
+            self._next_number += 1
+            issue = {
+                "number": number,
+                "title": title,
+                "body": body,
+                "state": state,
+                "labels": [self.label_by_name(name) or self.add_label(name) for name in labels],
+                "milestone": milestone,
+                "created_at": _STAMP,
+                "updated_at": _STAMP,
+            }
+            self.issues[number] = issue
+            self.timelines[number] = []
+            self.comments[number] = []
+            return issue
+
+    def add_pull(
+        self,
+        title,
+        body,
+        files,
+        author="author",
+        base="develop",
+        head_ref=None,
+        commits=1,
+        reviews=(),
+        statuses=(),
+        signed=True,
+    ):
+        with self._lock:
+            number = self._next_number
+            self._next_number += 1
+            head_sha = _sha("head", number)
+            pr = {
+                "number": number,
+                "title": title,
+                "body": body,
+                "state": "open",
+                "base": {"ref": base},
+                "head": {"ref": head_ref or f"agent/bot/feat/{number}-change", "sha": head_sha},
+                "user": {"login": author},
+            }
+            self.pulls[number] = pr
+            self.pull_files[number] = [{"filename": name} for name in files]
+            self.pull_commits[number] = [
+                {
+                    "sha": head_sha if idx == commits - 1 else _sha("commit", number, idx),
+                    "commit": {"message": f"change {idx}"},
+                    "verification": {"verified": bool(signed)},
+                }
+                for idx in range(commits)
+            ]
+            self.pull_reviews[number] = [
+                {"state": state, "submitted_at": _STAMP, "user": {"login": login, "type": kind}}
+                for login, state, kind in reviews
+            ]
+            self.statuses[head_sha] = [{"context": ctx, "state": state} for ctx, state in statuses]
+            return pr
+
+
+def generate_dataset(seed=0, pulls=20, issues=40, owner="Don", repo="dev", files_per_pull=5):
+    """Builds a reproducible synthetic dataset; the same seed yields the same data."""
+    rng = random.Random(seed)
+    data = FakeGiteaData(owner=owner, repo=repo)
+    for name in ["type:build", "governed", "deterministic", "auto-generated", "in-progress"]:
+        data.add_label(name)
+    milestones = [data.add_milestone(title) for title in PHASE_TITLES]
+
+    for idx in range(issues):
+        labels = ["type:build"] if rng.random() < 0.7 else ["governed"]
+        if rng.random() < 0.1:
+            labels.append("in-progress")
+        data.add_issue(
+            f"task {idx}",
+            body=f"Implement `supervisor/module_{idx}.py`",
+            labels=labels,
+            milestone=rng.choice(milestones),
+            state="open" if rng.random() < 0.8 else "closed",
+        )
+
+    subsystems = ["supervisor/", "executor/", "governance/policy/", "docs/", "tests/", "tools/", "scripts/"]
+    checks = ["lint", "unit-tests", "smoke-test", "determinism-check"]
+    for idx in range(pulls):
+        prefix = rng.choice(subsystems)
+        high_risk = subsystems.index(prefix) < 3
+        lock = f"LOCK:{prefix.split('/')[0]}/" if high_risk else "not required"
+        files = sorted({f"{prefix}file_{rng.randrange(10 * files_per_pull)}.py" for _ in range(files_per_pull)})
+        reviewers = rng.sample(["alice", "bob", "carol", "ci-bot"], k=rng.randrange(0, 4))
+        data.add_pull(
+            f"change {idx} #{idx + 1}",
+            _PR_BODY.format(subsystem=prefix, lock=lock, issue=idx + 1),
+            files,
+            author=rng.choice(["author", "agent"]),
+            base="develop" if rng.random() < 0.9 else "main",
+            commits=rng.randrange(1, 4),
+            reviews=[
+                (login, "APPROVED" if rng.random() < 0.8 else "REQUEST_CHANGES", "Bot" if "bot" in login else "User")
+                for login in reviewers
+            ],
+            statuses=[(ctx, "success" if rng.random() < 0.85 else "failure") for ctx in checks],
+            signed=rng.random() < 0.9,
+        )
+    return data
+
+
+class _FakeGiteaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients cancelled mid-request (e.g. by a cycle deadline) hang up before the reply.
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+
+class FakeGitea:
+    """
+    Threaded stand-in for the Gitea API endpoints the supervisor uses, with
+    per-endpoint latency and error injection, paging, ETags and request counts.
+    """
+
+    def __init__(
+        self,
+        data=None,
+        host="127.0.0.1",
+        port=0,
+        latency=None,
+        error_rates=None,
+        max_page_limit=DEFAULT_MAX_PAGE_LIMIT,
+        require_token=None,
+        seed=0,
+    ):
+        self.data = data or generate_dataset(seed=seed)
+        self.latency = dict(latency or {})
+        self.error_rates = dict(error_rates or {})
+        self.max_page_limit = max_page_limit
+        self.require_token = require_token
+        self.request_counts = Counter()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._server = _FakeGiteaServer((host, port), _FakeGiteaHandler)
+        self._server.fake = self
+        self._thread = None
+
+    @property
+    def api_base(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-gitea",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _inject(self, endpoint):
+        delay = self.latency.get(endpoint, self.latency.get("*", 0.0))
+        if delay:
+            time.sleep(delay)
+        rate = self.error_rates.get(endpoint, self.error_rates.get("*", 0.0))
+        if rate:
+            with self._rng_lock:
+                return self._rng.random() < rate
+        return False
+
+
+_ROUTES = [
+    ("GET", r"/user", "user"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)", "repo"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues", "issues"),
+    ("POST", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues", "issues.create"),
+    ("PATCH", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)", "issue.edit"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)/labels", "issue.labels"),
+    ("POST", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)/labels", "issue.labels.add"),
+    (
+        "DELETE",
+        r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)/labels/(?P<label_id>\d+)",
+        "issue.labels.remove",
+    ),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)/timeline", "issue.timeline"),
+    ("POST", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/issues/(?P<number>\d+)/comments", "issue.comments"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/labels", "labels"),
+    ("POST", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/labels", "labels.create"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/milestones", "milestones"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pulls", "pulls"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pulls/(?P<number>\d+)/files", "pull.files"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pulls/(?P<number>\d+)/commits", "pull.commits"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pulls/(?P<number>\d+)/reviews", "pull.reviews"),
+    ("GET", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/commits/(?P<sha>[0-9a-f]+)/statuses", "commit.statuses"),
+    ("POST", r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/statuses/(?P<sha>[0-9a-f]+)", "statuses.create"),
+]
+_COMPILED_ROUTES = [(method, re.compile(f"^/api/v1{pattern}$"), name) for method, pattern, name in _ROUTES]
+
+
+class _FakeGiteaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeGitea/0.1"
+
+    def log_message(self, *args):
+        return
+
+    def _send_json(self, status, payload, extra_headers=None):
+        body = json.dumps(payload, sort_keys=True).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and self.command == "GET" and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200 and self.command == "GET":
+            self.send_header("ETag", etag)
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _paged(self, items, query):
+        fake = self.server.fake
+        try:
+            page = max(1, int(query.get("page", "1")))
+            limit = int(query.get("limit", str(fake.max_page_limit)))
+        except ValueError:
+            page, limit = 1, fake.max_page_limit
+        limit = max(1, min(limit, fake.max_page_limit))
+        chunk = items[(page - 1) * limit:page * limit]
+        path = urllib.parse.urlsplit(self.path).path
+        base_query = {k: v for k, v in query.items() if k not in ("page", "limit")}
+        links = []
+        last_page = max(1, (len(items) + limit - 1) // limit)
+        if page < last_page:
+            links.append(
+                f'<{path}?{urllib.parse.urlencode({**base_query, "page": page + 1, "limit": limit})}>; rel="next"'
+            )
+        links.append(
+            f'<{path}?{urllib.parse.urlencode({**base_query, "page": last_page, "limit": limit})}>; rel="last"'
+        )
+        self._send_json(200, chunk, {"X-Total-Count": str(len(items)), "Link": ",".join(links)})
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def _dispatch(self):
+        fake = self.server.fake
+        parts = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        for method, pattern, name in _COMPILED_ROUTES:
+            match = pattern.match(parts.path)
+            if match and method == self.command:
+                break
+        else:
+            # Drain any request body so the keep-alive connection stays usable.
+            self._read_json() if self.command != "GET" else None
+            self._send_json(404, {"message": "not found"})
+            return
+
+        fake.request_counts[name] += 1
+        failing = fake._inject(name)
+        body = self._read_json() if self.command != "GET" else {}
+        if fake.require_token and self.headers.get("Authorization") != f"token {fake.require_token}":
+            self._send_json(401, {"message": "unauthorized"})
+            return
+        if failing:
+            self._send_json(502, {"message": "injected failure"})
+            return
+        params = match.groupdict()
+        if "owner" in params and (params["owner"], params["repo"]) != (fake.data.owner, fake.data.repo):
+            self._send_json(404, {"message": "repo not found"})
+            return
+        getattr(self, "_route_" + name.replace(".", "_"))(params, query, body)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PATCH = _dispatch
+    do_DELETE = _dispatch
+
+    def _route_user(self, params, query, body):
+        self._send_json(200, {"login": "supervisor", "id": 1})
+
+    def _route_repo(self, params, query, body):
+        data = self.server.fake.data
+        self._send_json(200, {"name": data.repo, "owner": {"login": data.owner}})
+
+    def _route_issues(self, params, query, body):
+        data = self.server.fake.data
+        state = query.get("state", "open")
+        with data._lock:
+            issues = [
+                issue
+                for _, issue in sorted(data.issues.items(), reverse=True)
+                if state == "all" or issue["state"] == state
+            ]
+        self._paged(issues, query)
+
+    def _route_issues_create(self, params, query, body):
+        data = self.server.fake.data
+        milestone = next((m for m in data.milestones if m["id"] == body.get("milestone")), None)
+        labels = [data.label_by_id(label_id) for label_id in body.get("labels", [])]
+        issue = data.add_issue(
+            body.get("title", ""),
+            body=body.get("body", ""),
+            labels=[label["name"] for label in labels if label],
+            milestone=milestone,
+        )
+        self._send_json(201, issue)
+
+    def _issue(self, params):
+        return self.server.fake.data.issues.get(int(params["number"]))
+
+    def _route_issue_edit(self, params, query, body):
+        issue = self._issue(params)
+        if issue is None:
+            self._send_json(404, {"message": "issue not found"})
+            return
+        if "state" in body:
+            issue["state"] = body["state"]
+        self._send_json(201, issue)
+
+    def _route_issue_labels(self, params, query, body):
+        issue = self._issue(params)
+        if issue is None:
+            self._send_json(404, {"message": "issue not found"})
+            return
+        self._send_json(200, issue["labels"])
+
+    def _route_issue_labels_add(self, params, query, body):
+        data = self.server.fake.data
+        issue = self._issue(params)
+        if issue is None:
+            self._send_json(404, {"message": "issue not found"})
+            return
+        with data._lock:
+            for label_id in body.get("labels", []):
+                label = data.label_by_id(label_id)
+                if label and label not in issue["labels"]:
+                    issue["labels"].append(label)
+                    data.timelines[issue["number"]].append(
+                        {"type": "label", "label": label, "created_at": _STAMP}
+                    )
+        self._send_json(200, issue["labels"])
+
+    def _route_issue_labels_remove(self, params, query, body):
+        issue = self._issue(params)
+        if issue is None:
+            self._send_json(404, {"message": "issue not found"})
+            return
+        label_id = int(params["label_id"])
+        issue["labels"] = [label for label in issue["labels"] if label["id"] != label_id]
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _route_issue_timeline(self, params, query, body):
+        issue = self._issue(params)
+        if issue is None:
+            self._send_json(404, {"message": "issue not found"})
+            return
+        self._send_json(200, self.server.fake.data.timelines[issue["number"]])
+
+    def _route_issue_comments(self, params, query, body):
+        issue = self._issue(params)
+        if issue is None:
+            self._send_json(404, {"message": "issue not found"})
+            return
+        comment = {"id": len(self.server.fake.data.comments[issue["number"]]) + 1, "body": body.get("body", "")}
+        self.server.fake.data.comments[issue["number"]].append(comment)
+        self._send_json(201, comment)
+
+    def _route_labels(self, params, query, body):
+        self._paged(list(self.server.fake.data.labels), query)
+
+    def _route_labels_create(self, params, query, body):
+        data = self.server.fake.data
+        if data.label_by_name(body.get("name")):
+            self._send_json(409, {"message": "label exists"})
+            return
+        label = data.add_label(body.get("name", ""), body.get("color", ""), body.get("description", ""))
+        self._send_json(201, label)
+
+    def _route_milestones(self, params, query, body):
+        self._send_json(200, list(self.server.fake.data.milestones))
+
+    def _route_pulls(self, params, query, body):
+        data = self.server.fake.data
+        state = query.get("state", "open")
+        pulls = [
+            pr for _, pr in sorted(data.pulls.items(), reverse=True) if state == "all" or pr["state"] == state
+        ]
+        self._paged(pulls, query)
+
+    def _pull_list(self, table, params, query):
+        number = int(params["number"])
+        if number not in self.server.fake.data.pulls:
+            self._send_json(404, {"message": "pull not found"})
+            return
+        self._paged(table.get(number, []), query)
+
+    def _route_pull_files(self, params, query, body):
+        self._pull_list(self.server.fake.data.pull_files, params, query)
+
+    def _route_pull_commits(self, params, query, body):
+        self._pull_list(self.server.fake.data.pull_commits, params, query)
+
+    def _route_pull_reviews(self, params, query, body):
+        self._pull_list(self.server.fake.data.pull_reviews, params, query)
+
+    def _route_commit_statuses(self, params, query, body):
+        self._paged(list(reversed(self.server.fake.data.statuses.get(params["sha"], []))), query)
+
+    def _route_statuses_create(self, params, query, body):
+        status = {"context": body.get("context"), "state": body.get("state"), "description": body.get("description")}
+        self.server.fake.data.statuses.setdefault(params["sha"], []).append(status)
+        self._send_json(201, status)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a seeded fake Gitea API for local benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pulls", type=int, default=1000)
+    parser.add_argument("--issues", type=int, default=2000)
+    parser.add_argument("--files-per-pull", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 502")
+    args = parser.parse_args(argv)
+
+    data = generate_dataset(
+        seed=args.seed, pulls=args.pulls, issues=args.issues, files_per_pull=args.files_per_pull
+    )
+    fake = FakeGitea(
+        data=data,
+        host=args.host,
+        port=args.port,
+        latency={"*": args.latency},
+        error_rates={"*": args.error_rate},
+        seed=args.seed,
+    ).start()
+    print(f"FAKE_GITEA api_base={fake.api_base} owner={data.owner} repo={data.repo}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
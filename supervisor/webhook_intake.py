@@ -0,0 +1,168 @@
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from supervisor.pr_gate.logger import log_event
+
+
+MAX_WEBHOOK_BODY_BYTES = 5 * 1024 * 1024
+DEFAULT_RECONCILE_SECONDS = 600
+
+
+def verify_webhook_signature(secret, body, headers):
+    """
+    Gitea signs the raw body with HMAC-SHA256 in X-Gitea-Signature (hex);
+    X-Hub-Signature-256 ("sha256=<hex>") is accepted as well. No secret means
+    nothing verifies.
+    """
+    if not secret:
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    candidates = []
+    gitea_sig = headers.get("X-Gitea-Signature")
+    if gitea_sig:
+        candidates.append(gitea_sig.strip())
+    hub_sig = headers.get("X-Hub-Signature-256")
+    if hub_sig and hub_sig.strip().startswith("sha256="):
+        candidates.append(hub_sig.strip()[len("sha256="):])
+    return any(hmac.compare_digest(expected, candidate.lower()) for candidate in candidates)
+
+
+def work_items_for_event(event, payload):
+    """Maps a webhook event to the deduplicated work items it invalidates."""
+    if not isinstance(payload, dict):
+        return []
+    event = (event or "").lower()
+    items = []
+    if event.startswith("pull_request"):
+        pr = payload.get("pull_request") or {}
+        number = pr.get("number") if isinstance(pr, dict) else None
+        if number is None:
+            number = payload.get("number")
+        if isinstance(number, int):
+            items.append(("pr", number))
+    elif event == "status":
+        sha = payload.get("sha")
+        if isinstance(sha, str) and sha.strip():
+            items.append(("commit", sha.strip()))
+    elif event.startswith("issue"):
+        issue = payload.get("issue") or {}
+        number = issue.get("number") if isinstance(issue, dict) else None
+        if isinstance(number, int):
+            items.append(("issue", number))
+    return items
+
+
+class WorkQueue:
+    """Thread-safe set of pending (kind, key) items with a blocking wait."""
+
+    def __init__(self):
+        self._items = set()
+        self._cond = threading.Condition()
+
+    def put(self, item):
+        with self._cond:
+            self._items.add(item)
+            self._cond.notify_all()
+
+    def wait(self, timeout):
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            return bool(self._items)
+
+    def drain(self):
+        with self._cond:
+            items, self._items = self._items, set()
+        return sorted(items, key=lambda item: (item[0], str(item[1])))
+
+    def __len__(self):
+        with self._cond:
+            return len(self._items)
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    server_version = "AIOSWebhook/0.1"
+
+    def log_message(self, *args):
+        return
+
+    def _reply(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        intake = self.server.intake
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_WEBHOOK_BODY_BYTES:
+            self._reply(413)
+            return
+        body = self.rfile.read(length)
+        event = self.headers.get("X-Gitea-Event") or self.headers.get("X-GitHub-Event") or ""
+        if not verify_webhook_signature(intake.secret, body, self.headers):
+            intake.rejected += 1
+            log_event("webhook", f"rejected event={event} reason=bad_signature")
+            self._reply(401)
+            return
+        try:
+            payload = json.loads(body.decode("utf-8")) if body else None
+        except Exception:
+            self._reply(400)
+            return
+
+        items = work_items_for_event(event, payload)
+        for item in items:
+            intake.queue.put(item)
+        intake.accepted += 1
+        log_event(
+            "webhook",
+            f"accepted event={event} items={','.join(f'{k}:{v}' for k, v in items) or 'none'}",
+        )
+        self._reply(202)
+
+
+class WebhookIntake:
+    """Embedded listener that turns signed Gitea webhooks into queued work."""
+
+    def __init__(self, secret, host="127.0.0.1", port=0, queue=None):
+        if not secret:
+            raise ValueError("webhook intake requires a secret")
+        self.secret = secret
+        self.queue = queue or WorkQueue()
+        self.accepted = 0
+        self.rejected = 0
+        self._server = ThreadingHTTPServer((host, port), _WebhookHandler)
+        self._server.daemon_threads = True
+        self._server.intake = self
+        self._thread = None
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.2},
+            name="webhook-intake",
+            daemon=True,
+        )
+        self._thread.start()
+        host, port = self.address[:2]
+        log_event("webhook", f"listening host={host} port={port}")
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def wait_for_work(self, timeout):
+        return self.queue.wait(timeout)
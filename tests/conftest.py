@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _log(tmp_path, monkeypatch):
+    # Keep pr_gate log events out of the repository's governance/logs.
+    monkeypatch.setenv("PR_GATE_LOG_PATH", str(tmp_path / "pr-gate.log"))
@@ -0,0 +1,75 @@
+import random
+import re
+
+from supervisor.pr_gate.body_scanner import PrTextScan, scan_pr_text
+from supervisor.pr_gate.locker import LockIndex
+
+
+HEADING_RE = re.compile(r"^###\s+(.+?)\s*$")
+LOCK_RE = re.compile(r"\bLOCK:[A-Za-z0-9_./-]+\b")
+PIECES = [
+    "###", "####", " ", "\t", "\n", "\r\n", "\r", "\x0b", "\x85", " ", "　", "​",
+    "LOCK:", "supervisor", "/", ".", "-", "_", "é", "#", "12", "Risk Level", "TBD",
+]
+
+
+def _reference_sections(body):
+    sections = {}
+    current = None
+    for line in body.splitlines():
+        heading = HEADING_RE.match(line)
+        if heading:
+            current = heading.group(1)
+            sections.setdefault(current, [])
+            continue
+        if current is not None:
+            sections[current].append(line)
+    return {key: "\n".join(val).strip() for key, val in sections.items()}
+
+
+def test_single_pass_matches_per_concern_parsing():
+    rng = random.Random(11)
+    for _ in range(5000):
+        title = "".join(rng.choice(PIECES) for _ in range(rng.randrange(0, 6)))
+        body = "".join(rng.choice(PIECES) for _ in range(rng.randrange(0, 30)))
+        scan = PrTextScan(title, body)
+        assert scan.sections == _reference_sections(body), (title, body)
+        assert list(scan.lock_tokens) == LOCK_RE.findall(f"{title}\n\n{body}"), (title, body)
+
+
+def test_scans_are_memoized_by_text():
+    body = "### Locks\nLOCK:executor/x\n"
+    first = scan_pr_text("memo title", body)
+    assert scan_pr_text("memo title", body) is first
+    assert scan_pr_text("memo title ", body) is not first
+    assert scan_pr_text(None, None).sections == {}
+
+
+def test_issue_refs_run_once_per_pattern_set():
+    calls = []
+
+    class Counting:
+        def __init__(self, pattern):
+            self.pattern = pattern
+            self._re = re.compile(pattern)
+
+        def search(self, text):
+            calls.append(self.pattern)
+            return self._re.search(text)
+
+    scan = PrTextScan("fix #12", "")
+    patterns = (Counting(r"(^|\s)#([0-9]+)(\s|$)"),)
+    assert scan.issue_ref_present(patterns, "fix #12", "")
+    assert scan.issue_ref_present(patterns, "fix #12", "")
+    assert calls == [r"(^|\s)#([0-9]+)(\s|$)"]
+    assert not scan.issue_ref_present((Counting(r"GH-\d+"),), "fix #12", "")
+
+
+def test_lock_index_reads_tokens_from_the_shared_scan():
+    prs = [
+        {"number": 1, "title": "LOCK:supervisor/a", "body": "### Locks\nLOCK:executor/b"},
+        {"number": 2, "title": "t", "body": "LOCK:executor/b"},
+    ]
+    index = LockIndex(prs)
+    assert index.holders("LOCK:executor/b") == [1, 2]
+    assert index.holders("LOCK:supervisor/a") == [1]
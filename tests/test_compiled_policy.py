@@ -0,0 +1,58 @@
+import copy
+import os
+
+from supervisor.pr_gate.compiled_policy import CompiledPolicy, compile_policy
+from supervisor.pr_gate.evaluator import evaluate_pr
+from supervisor.pr_gate.policy_loader import load_compiled_policy, load_policy
+from supervisor.testing import generate_dataset
+
+
+POLICY_PATH = os.path.abspath("governance/policy/pr-governance.v0.2.yaml")
+
+
+def _cases(seed, pulls=60):
+    data = generate_dataset(seed=seed, pulls=pulls, issues=0)
+    open_prs = list(data.pulls.values())
+    for number, pr in sorted(data.pulls.items()):
+        eval_pr = dict(pr)
+        eval_pr["_open_prs"] = open_prs
+        yield (
+            eval_pr,
+            data.pull_commits[number],
+            [f["filename"] for f in data.pull_files[number]],
+            data.pull_reviews[number],
+            list(reversed(data.statuses[pr["head"]["sha"]])),
+        )
+
+
+def _policy_variants():
+    policy, _ = load_policy(POLICY_PATH)
+    yield policy
+    relaxed = copy.deepcopy(policy)
+    relaxed["issue_link"]["required"] = False
+    relaxed["locks"]["exclusive"] = False
+    relaxed["commit_signing"]["required"] = False
+    relaxed["approvals"]["develop"] = {"min_approvals": 0}
+    del relaxed["system_evolution"]["ci"]
+    yield relaxed
+    yield {"ci": {}, "approvals": {"disallow_self_approval": True, "main": {"min_approvals": 2}}}
+
+
+def test_compiled_and_dict_policies_give_identical_results():
+    for policy in _policy_variants():
+        compiled = CompiledPolicy(policy)
+        for seed in (1, 2, 3):
+            for pr, commits, files, reviews, statuses in _cases(seed):
+                assert evaluate_pr(compiled, pr, commits, files, reviews, statuses) == evaluate_pr(
+                    policy, pr, commits, files, reviews, statuses
+                )
+
+
+def test_compiled_policy_is_built_once_per_hash():
+    compiled, policy_hash = load_compiled_policy(POLICY_PATH)
+    again, _ = load_compiled_policy(POLICY_PATH)
+    assert again is compiled
+    assert compiled.policy_hash == policy_hash
+    assert compile_policy(compiled) is compiled
+    assert compiled.approvals_for("main").min_approvals == 2
+    assert compiled.approvals_for("feature-x").min_approvals == 0
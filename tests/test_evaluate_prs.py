@@ -0,0 +1,66 @@
+import os
+
+from supervisor.pr_gate import evaluator
+from supervisor.pr_gate.evaluator import evaluate_pr, evaluate_prs, iter_evaluate_prs
+from supervisor.pr_gate.policy_loader import load_policy
+from supervisor.testing import generate_dataset
+
+
+POLICY_PATH = os.path.abspath("governance/policy/pr-governance.v0.2.yaml")
+
+
+def _cycle(seed, pulls):
+    data = generate_dataset(seed=seed, pulls=pulls, issues=0)
+    prs = list(data.pulls.values())
+    inputs = {
+        number: {
+            "commits": data.pull_commits[number],
+            "files": [f["filename"] for f in data.pull_files[number]],
+            "reviews": data.pull_reviews[number],
+            "statuses": data.statuses[pr["head"]["sha"]],
+        }
+        for number, pr in data.pulls.items()
+    }
+    return prs, inputs
+
+
+def _one_by_one(policy, prs, inputs):
+    expected = []
+    for pr in sorted(prs, key=lambda p: p["number"]):
+        args = inputs[pr["number"]]
+        eval_pr = dict(pr, _open_prs=prs)
+        expected.append(
+            (pr["number"], evaluate_pr(policy, eval_pr, args["commits"], args["files"], args["reviews"], args["statuses"]))
+        )
+    return expected
+
+
+def test_batch_matches_per_pr_evaluation_in_number_order():
+    policy, _ = load_policy(POLICY_PATH)
+    prs, inputs = _cycle(seed=4, pulls=25)
+    results = evaluate_prs(policy, list(reversed(prs)), inputs)
+    assert [number for number, _ in results] == sorted(inputs)
+    assert results == _one_by_one(policy, prs, inputs)
+
+
+def test_streaming_form_pulls_inputs_lazily():
+    policy, _ = load_policy(POLICY_PATH)
+    prs, inputs = _cycle(seed=5, pulls=3)
+    pulled = []
+
+    def entries():
+        for pr in prs:
+            pulled.append(pr["number"])
+            yield pr, inputs[pr["number"]]
+
+    stream = iter_evaluate_prs(policy, entries(), open_prs=prs)
+    first_pr, _ = next(stream)
+    assert pulled == [first_pr["number"]]
+    assert len(list(stream)) == 2
+
+
+def test_process_pool_gives_identical_results(monkeypatch):
+    monkeypatch.setattr(evaluator, "PROCESS_POOL_MIN_BATCH", 4)
+    policy, _ = load_policy(POLICY_PATH)
+    prs, inputs = _cycle(seed=6, pulls=12)
+    assert evaluate_prs(policy, prs, inputs, processes=2) == evaluate_prs(policy, prs, inputs)
@@ -0,0 +1,45 @@
+from supervisor.pr_gate.locker import EvaluationCache, evaluation_cache_from_env
+
+
+def test_in_memory_cache_tracks_hit_rate():
+    cache = EvaluationCache()
+    assert not cache.seen(1, "a", "p")
+    cache.mark(1, "a", "p")
+    assert cache.seen(1, "a", "p")
+    assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_entries_survive_a_restart(tmp_path):
+    path = str(tmp_path / "governance" / "eval-cache.sqlite3")
+    cache = EvaluationCache(path=path)
+    cache.mark(1, "a", "p")
+    cache.mark(2, "b", "p")
+    cache.invalidate(pr_number=2)
+    cache.close()
+
+    restarted = EvaluationCache(path=path)
+    assert restarted.stats()["entries"] == 0  # nothing is read until first use
+    assert restarted.seen(1, "a", "p")
+    assert not restarted.seen(2, "b", "p")
+    assert restarted.stats()["entries"] == 1
+
+
+def test_retain_drops_closed_prs_moved_heads_and_old_policies(tmp_path):
+    path = str(tmp_path / "eval-cache.sqlite3")
+    cache = EvaluationCache(path=path)
+    cache.mark(1, "a", "p")
+    cache.mark(2, "b", "p")
+    cache.mark(3, "c", "p")
+    cache.mark(4, "d", "old")
+
+    assert cache.retain({1: "a", 2: "b2", 4: "d"}, "p") == 3
+    assert cache.seen(1, "a", "p")
+    cache.close()
+    assert EvaluationCache(path=path).retain({1: "a"}) == 0
+
+
+def test_env_path_enables_persistence(monkeypatch, tmp_path):
+    monkeypatch.setenv("PR_GATE_EVAL_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    assert evaluation_cache_from_env().path == str(tmp_path / "cache.sqlite3")
+    monkeypatch.setenv("PR_GATE_EVAL_CACHE_PATH", "")
+    assert evaluation_cache_from_env().path is None
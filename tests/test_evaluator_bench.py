@@ -0,0 +1,32 @@
+import json
+
+from benchmarks.evaluator_bench import build_corpora, compare, main, run_benchmarks
+
+
+def test_corpora_are_reproducible_per_seed():
+    first = build_corpora(seed=7, quick=True)
+    second = build_corpora(seed=7, quick=True)
+    assert first["large_body"]["pr"]["body"] == second["large_body"]["pr"]["body"]
+    assert first["many_reviews"]["inputs"] == second["many_reviews"]["inputs"]
+    assert len(first["large_files"]["inputs"]["files"]) > 500
+    assert len(first["large_body"]["pr"]["body"]) >= 10_000
+
+
+def test_report_is_machine_readable_and_comparable(tmp_path):
+    report = run_benchmarks(quick=True, min_time=0.001, repeats=1, only=["_section_map", "gate.checks"])
+    names = {row["benchmark"] for row in report["results"]}
+    assert names == {"_section_map", "gate.checks"}
+    for row in report["results"]:
+        assert row["ns_per_op"]["min"] > 0
+        assert row["peak_bytes"] >= 0
+    assert report["meta"]["corpus_sizes"]["files"] == 1000
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+    assert main(
+        ["--quick", "--min-time", "0.001", "--repeats", "1", "--only", "_section_map",
+         "--output", str(tmp_path / "current.json"), "--compare", str(baseline)]
+    ) == 0
+    current = json.loads((tmp_path / "current.json").read_text())
+    rows = compare(current, report)
+    assert [row[:2] for row in rows] == [("_section_map", "large_body")]
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from supervisor.environment_validation import validate_environment
+from supervisor.pr_gate.gitea_client import get_open_pull_requests, get_pull_request_files
+from supervisor.pr_gate.locker import EvaluationCache
+from supervisor.pr_gate.policy_loader import load_policy
+from supervisor.supervisor import get_all_issues, run_pr_governance_gate
+from supervisor.testing import FakeGitea, generate_dataset
+
+
+POLICY_PATH = os.path.abspath("governance/policy/pr-governance.v0.2.yaml")
+HEADERS = {"Authorization": "token fake", "Accept": "application/json"}
+
+
+class _RecordingEnforcer:
+    def __init__(self):
+        self.failures = []
+
+    def enforce_pr_gate_result(self, pr_number, result):
+        self.failures.append(pr_number)
+
+
+@pytest.fixture
+def fake():
+    with FakeGitea(data=generate_dataset(seed=7, pulls=12, issues=30), require_token="fake") as server:
+        yield server
+
+
+def test_dataset_is_reproducible_for_a_seed():
+    first = generate_dataset(seed=3, pulls=5, issues=5)
+    second = generate_dataset(seed=3, pulls=5, issues=5)
+    assert first.pulls == second.pulls
+    assert first.pull_files == second.pull_files
+    assert first.issues == second.issues
+
+
+def test_lists_are_paginated_and_counted(fake):
+    fake.max_page_limit = 4
+    issues = get_all_issues(fake.api_base, "Don", "dev", HEADERS)
+    assert len(issues) == 30
+    assert fake.request_counts["issues"] == 8
+
+    prs = get_open_pull_requests(fake.api_base, "Don", "dev", headers=HEADERS, target_branches={"main", "develop"})
+    assert [pr["number"] for pr in prs] == sorted(fake.data.pulls)
+    number = prs[0]["number"]
+    assert get_pull_request_files(fake.api_base, "Don", "dev", number, headers=HEADERS) == sorted(
+        f["filename"] for f in fake.data.pull_files[number]
+    )
+
+
+def test_validate_environment_gitea_checks(fake):
+    result = validate_environment(api_base=fake.api_base, owner="Don", repo="dev", auth_headers=HEADERS)
+    assert "gitea_connectivity" in result["checks_passed"]
+    assert "label_availability" in result["checks_passed"]
+
+    denied = validate_environment(
+        api_base=fake.api_base, owner="Don", repo="dev", auth_headers={"Authorization": "token wrong"}
+    )
+    assert "environment.gitea.auth_failed" in denied["checks_failed"]
+
+
+def test_injected_errors_fail_closed(fake):
+    fake.error_rates = {"pulls": 1.0}
+    with pytest.raises(Exception):
+        get_open_pull_requests(fake.api_base, "Don", "dev", headers=HEADERS)
+    assert fake.request_counts["pulls"] == 3
+
+
+def test_pr_gate_runs_end_to_end(fake, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PR_GATE_POLICY_PATH", POLICY_PATH)
+    _, policy_hash = load_policy(POLICY_PATH)
+    enforcer = _RecordingEnforcer()
+
+    run_pr_governance_gate(fake.api_base, "Don", "dev", HEADERS, EvaluationCache(), enforcer, policy_hash)
+
+    published = {sha: [s["state"] for s in statuses if s["context"] == "supervisor/governance"] for sha, statuses in fake.data.statuses.items()}
+    for pr in fake.data.pulls.values():
+        states = published[pr["head"]["sha"]]
+        assert states[0] == "pending"
+        assert states[-1] in ("success", "failure")
+    assert fake.request_counts["statuses.create"] == 2 * len(fake.data.pulls)
+    assert len(list((tmp_path / "artifacts" / "governance").glob("pr-*.json"))) == len(fake.data.pulls)
+    failed = [pr["number"] for pr in fake.data.pulls.values() if published[pr["head"]["sha"]][-1] == "failure"]
+    assert sorted(enforcer.failures) == sorted(failed)
@@ -0,0 +1,193 @@
+import json
+import os
+
+import pytest
+
+from supervisor import file_watcher
+from supervisor.file_watcher import FileWatcher
+from supervisor.governance_enforcement import GovernanceEnforcer, GovernanceViolation
+from supervisor.pr_gate.policy_loader import PolicyLoadError, PolicyStore
+
+
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+@pytest.fixture(params=["poll", "inotify"])
+def watcher(request):
+    watcher = FileWatcher(use_inotify=request.param == "inotify")
+    if watcher.backend != request.param:
+        watcher.close()
+        pytest.skip("inotify is not available")
+    yield watcher
+    watcher.close()
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def test_unchanged_file_is_read_once(tmp_path, watcher):
+    path = tmp_path / "governance.md"
+    _write(path, "# Contract\r\nrule one\n")
+    first = watcher.snapshot(path)
+    for _ in range(5):
+        assert watcher.snapshot(path) is first
+    assert first.text == "# Contract\nrule one\n"
+    if watcher.backend == "inotify":
+        assert watcher.stats()["reads"] == 1
+
+
+def test_change_is_seen_and_pushed(tmp_path, watcher):
+    path = tmp_path / "environment.json"
+    _write(path, json.dumps({"api_base": "a"}))
+    seen = []
+    watcher.subscribe(lambda old, new: seen.append((old.version, new.version)))
+    assert watcher.load_json(path) == {"api_base": "a"}
+    assert watcher.load_json(path) is watcher.load_json(path)
+
+    _write(path, json.dumps({"api_base": "b"}))
+    assert watcher.load_json(path) == {"api_base": "b"}
+    assert seen == [(1, 2)]
+
+
+def test_replacing_file_by_rename_is_seen(tmp_path, watcher):
+    path = tmp_path / "policy.yaml"
+    _write(path, "one\n")
+    assert watcher.read_text(path) == "one\n"
+    replacement = tmp_path / "policy.yaml.tmp"
+    _write(replacement, "two\n")
+    os.replace(replacement, path)
+    assert watcher.read_text(path) == "two\n"
+
+
+def test_missing_file_raises_until_it_exists(tmp_path, watcher):
+    path = tmp_path / "environment.json"
+    with pytest.raises(FileNotFoundError):
+        watcher.load_json(path)
+    with pytest.raises(FileNotFoundError):
+        watcher.load_json(path)
+    _write(path, "{}")
+    assert watcher.load_json(path) == {}
+
+
+def test_enforcer_detects_governance_mutation(tmp_path, watcher):
+    governance = tmp_path / "governance.md"
+    environment = tmp_path / "environment.json"
+    _write(governance, "# Contract\n")
+    _write(environment, "{}")
+    enforcer = GovernanceEnforcer(
+        governance_path=str(governance),
+        environment_path=str(environment),
+        violation_log_path=str(tmp_path / "violations.log"),
+        watcher=watcher,
+    )
+    baseline = GovernanceEnforcer(
+        governance_path=str(governance),
+        environment_path=str(environment),
+        violation_log_path=str(tmp_path / "violations.log"),
+    )
+    assert enforcer.load_context() == baseline.load_context()
+    enforcer.enforce_immutability()
+
+    _write(governance, "# Contract (edited)\n")
+    with pytest.raises(GovernanceViolation):
+        enforcer.enforce_immutability()
+
+    governance.unlink()
+    with pytest.raises(GovernanceViolation):
+        enforcer.enforce_immutability()
+
+
+def test_policy_store_uses_watcher_hash(tmp_path, watcher):
+    policy_file = tmp_path / "policy.yaml"
+    body = 'version: "v0.2"\nbranch_rules: {}\napprovals: {}\nhigh_risk_paths: []\ncommit_signing: {}\n'
+    _write(policy_file, body + "ci: {}\n")
+    watched = PolicyStore(str(policy_file), watcher=watcher)
+    plain = PolicyStore(str(policy_file))
+    assert watched.load() == plain.load()
+
+    _write(policy_file, body + "ci: {required_checks: [build]}\n")
+    assert watched.load() == plain.load()
+    assert watched.load()[0]["ci"] == {"required_checks": ["build"]}
+
+    policy_file.unlink()
+    with pytest.raises(PolicyLoadError):
+        watched.load()
+
+
+def test_pushed_governance_change_is_latched(tmp_path, watcher):
+    governance = tmp_path / "governance.md"
+    environment = tmp_path / "environment.json"
+    _write(governance, "# Contract\n")
+    _write(environment, "{}")
+    enforcer = GovernanceEnforcer(
+        governance_path=str(governance),
+        environment_path=str(environment),
+        violation_log_path=str(tmp_path / "violations.log"),
+        watcher=watcher,
+    )
+    enforcer.load_context()
+    _write(governance, "# Contract (edited)\n")
+    watcher.refresh()  # what the background thread does
+    _write(governance, "# Contract\n")
+    with pytest.raises(GovernanceViolation):
+        enforcer.enforce_immutability()
+
+    enforcer.load_context()
+    enforcer.enforce_immutability()
+
+
+def test_pushed_policy_change_drops_cached_policy(tmp_path, watcher):
+    policy_file = tmp_path / "policy.yaml"
+    body = 'version: "v0.2"\nbranch_rules: {}\napprovals: {}\nhigh_risk_paths: []\ncommit_signing: {}\n'
+    _write(policy_file, body + "ci: {}\n")
+    store = PolicyStore(str(policy_file), watcher=watcher)
+    _, first_hash = store.load()
+
+    _write(policy_file, body + "ci: {required_checks: [build]}\n")
+    watcher.refresh()
+    assert store._policy is None
+    policy, policy_hash = store.load()
+    assert policy_hash != first_hash and policy["ci"] == {"required_checks": ["build"]}
+
+
+def test_subscribers_can_filter_by_path(tmp_path, watcher):
+    first, second = tmp_path / "a.json", tmp_path / "b.json"
+    _write(first, "{}")
+    _write(second, "{}")
+    seen = []
+    watcher.subscribe(lambda old, new: seen.append(new.path), path=str(first))
+    watcher.snapshot(first)
+    watcher.snapshot(second)
+    _write(first, '{"a": 1}')
+    _write(second, '{"b": 1}')
+    watcher.refresh()
+    assert seen == [str(first)]
+
+
+def test_stat_check_backs_up_missed_inotify_events(tmp_path, watcher, monkeypatch):
+    path = tmp_path / "governance.md"
+    _write(path, "# Contract\n")
+    original = watcher.digest(path)
+    # Simulate a change inotify never reported (overflowed queue, network filesystem).
+    monkeypatch.setattr(watcher, "_drain_events", lambda: None)
+    _write(path, "# Contract, edited\n")
+    assert watcher.digest(path) != original
+
+
+def test_queue_overflow_marks_every_file_dirty(tmp_path):
+    watcher = FileWatcher(use_inotify=False)
+    paths = [tmp_path / "a.md", tmp_path / "b.json"]
+    for path in paths:
+        _write(path, "x")
+        watcher.snapshot(path)
+
+    class _Overflowed:
+        def read_events(self):
+            yield -1, file_watcher.IN_Q_OVERFLOW, ""
+
+    watcher._inotify = _Overflowed()
+    watcher._drain_events()
+    watcher._inotify = None
+    assert watcher._dirty == {str(path) for path in paths}
@@ -0,0 +1,105 @@
+import json
+
+import supervisor.supervisor as sup
+from supervisor.pr_gate import evaluator
+from supervisor.pr_gate.compiled_policy import compile_policy
+from supervisor.pr_gate.evaluator import evaluate_pr
+from supervisor.pr_gate.incremental import IncrementalEvaluator
+from supervisor.pr_gate.locker import EvaluationCache
+from supervisor.pr_gate.logger import flush_log
+from supervisor.pr_gate.timing import strip_timing
+
+
+POLICY = {
+    "high_risk_paths": ["supervisor/"],
+    "ci": {"required_checks": ["lint"]},
+    "approvals": {"develop": {"min_approvals": 1}},
+}
+PR = {
+    "number": 7,
+    "title": "pr 7",
+    "body": "### Summary\nwork",
+    "base": {"ref": "develop"},
+    "head": {"ref": "feature/x", "sha": "sha7"},
+    "user": {"login": "author"},
+}
+INPUTS = {
+    "commits": [{"sha": "sha7"}],
+    "files": ["supervisor/a.py", "docs/b.md"],
+    "reviews": [{"user": {"login": "rev", "type": "User"}, "state": "APPROVED", "submitted_at": "t"}],
+    "statuses": [{"context": "lint", "state": "success"}],
+}
+
+
+def test_timed_events_carry_duration_and_input_sizes():
+    result = evaluate_pr(POLICY, PR, timed=True, **INPUTS)
+    assert strip_timing(result) == evaluate_pr(POLICY, PR, **INPUTS)
+    by_gate = {event["gate"]: event for event in result["gate_events"]}
+    assert by_gate["high_risk_path_detection"]["input_sizes"] == {"files": 2}
+    assert by_gate["min_approvals_met"]["input_sizes"]["reviews"] == 1
+    assert all(event["duration_ns"] >= 0 for event in result["gate_events"])
+    stages = result["timing"]["stages"]
+    assert list(stages) == [stage for stage, _, _ in evaluator.GATE_STAGES]
+    assert result["timing"]["total_ns"] == sum(entry["duration_ns"] for entry in stages.values())
+
+
+def test_untimed_evaluation_reads_no_clock(monkeypatch):
+    def forbidden():
+        raise AssertionError("clock read with timing disabled")
+
+    monkeypatch.setattr(evaluator.time, "perf_counter_ns", forbidden)
+    result = evaluate_pr(POLICY, PR, **INPUTS)
+    assert "timing" not in result
+    assert all(set(event) == {"gate", "result", "reason"} for event in result["gate_events"])
+
+
+def test_incremental_timing_marks_reused_stages():
+    incremental = IncrementalEvaluator(self_check_every=1)
+    policy = compile_policy(POLICY, "t" * 64)
+    incremental.evaluate(policy, PR, timed=True, **INPUTS)
+    result = incremental.evaluate(policy, PR, timed=True, **INPUTS)
+    assert all(entry["reused"] for entry in result["timing"]["stages"].values())
+    assert incremental.stats()["self_check_mismatches"] == 0
+
+
+def test_gate_cycle_writes_timing_to_artifacts_and_log(monkeypatch, tmp_path):
+    log_path = tmp_path / "pr-gate.log"
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PR_GATE_LOG_PATH", str(log_path))
+    monkeypatch.setenv("PR_GATE_TIMING", "1")
+    monkeypatch.setattr(sup, "load_policy", lambda path: (POLICY, "h" * 64))
+    monkeypatch.setattr(sup, "get_open_pull_requests", lambda *a, **k: [PR])
+    monkeypatch.setattr(sup, "get_pull_request_commits", lambda *a, **k: INPUTS["commits"])
+    monkeypatch.setattr(sup, "get_pull_request_files", lambda *a, **k: INPUTS["files"])
+    monkeypatch.setattr(sup, "get_pull_request_reviews", lambda *a, **k: INPUTS["reviews"])
+    monkeypatch.setattr(sup, "get_commit_statuses", lambda *a, **k: INPUTS["statuses"])
+    monkeypatch.setattr(sup, "publish_governance_status", lambda **kwargs: None)
+    monkeypatch.setattr(sup, "prefetch_pull_request_heads", lambda head_shas: True)
+
+    class Enforcer:
+        def enforce_pr_gate_result(self, pr_number, result):
+            return None
+
+    sup.run_pr_governance_gate(
+        api_base="http://gitea.invalid/api/v1",
+        owner="o",
+        repo="r",
+        headers={},
+        pr_eval_cache=EvaluationCache(),
+        enforcer=Enforcer(),
+        policy_hash_baseline="h" * 64,
+        fetch_concurrency=2,
+    )
+
+    artifact = json.loads((tmp_path / "artifacts/governance/pr-7-sha7.json").read_text())
+    timing = artifact["timing"]
+    assert set(timing["fetches"]) == {"commits", "files", "reviews", "statuses"}
+    assert timing["fetches"]["files"]["items"] == 2
+    assert all("wait_ns" in entry for entry in timing["fetches"].values())
+    assert [gate["gate"] for gate in timing["gates"]][0] == "branch_name_regex"
+
+    flush_log()
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    summary = [record["message"] for record in records if record["component"] == "pr_gate_timing"]
+    assert len(summary) == 1
+    assert "prs=1" in summary[0] and "gate.approvals=" in summary[0] and "fetch.files=" in summary[0]
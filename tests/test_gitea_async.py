@@ -0,0 +1,224 @@
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import supervisor.supervisor as sup
+from supervisor.pr_gate import http_client
+from supervisor.pr_gate.gitea_async import AsyncConnectionPool, AsyncGiteaClient, run_with_deadline
+from supervisor.pr_gate.gitea_client import GiteaClientError, get_open_pull_requests
+from supervisor.pr_gate.response_cache import ConditionalResponseCache
+from supervisor.pr_gate.retry_policy import RetryPolicy
+from supervisor.testing import FakeGitea, generate_dataset
+
+
+HEADERS = {"Authorization": "token fake", "Accept": "application/json"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+    active = 0
+    peak = 0
+    posted = []
+    broken = []
+    milestone_reads = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        return
+
+    def _send(self, status, payload, extra=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        with _Handler.lock:
+            _Handler.active += 1
+            _Handler.peak = max(_Handler.peak, _Handler.active)
+        time.sleep(_Handler.delay)
+        with _Handler.lock:
+            _Handler.active -= 1
+        parts = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        if parts.path.endswith("/pulls"):
+            page = int(query.get("page", "1"))
+            prs = [{"number": n, "base": {"ref": "develop"}} for n in (5, 4, 3, 2, 1)]
+            chunk = prs[(page - 1) * 2:page * 2]
+            extra = {"X-Total-Count": str(len(prs))}
+            self._send(200, chunk, extra)
+        elif parts.path.endswith("/files"):
+            self._send(200, [{"filename": "b.py"}, {"filename": "a.py"}])
+        elif parts.path.endswith("/milestones"):
+            _Handler.milestone_reads += 1
+            mode = _Handler.broken.pop(0) if _Handler.broken else None
+            if mode == "garbage":
+                self.wfile.write(b"HTTP/1.1 ok?\r\n\r\n")
+            if mode is not None:
+                self.close_connection = True
+                return
+            self._send(200, [{"id": 1, "title": "Phase 1"}])
+        else:
+            self._send(200, [])
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        _Handler.posted.append(json.loads(self.rfile.read(length)))
+        if _Handler.broken:
+            # Applied, then the connection is lost before the reply.
+            _Handler.broken.pop(0)
+            self.close_connection = True
+            return
+        self._send(201, {"id": 1})
+
+
+@pytest.fixture
+def api():
+    _Handler.delay = 0.0
+    _Handler.peak = 0
+    _Handler.posted = []
+    _Handler.broken = []
+    _Handler.milestone_reads = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_paginated_reads_reuse_one_connection(api):
+    async def scenario():
+        async with AsyncGiteaClient(api, cache=ConditionalResponseCache()) as client:
+            prs = await client.get_open_pull_requests("o", "r")
+            files = await client.get_pull_request_files("o", "r", 1)
+            return prs, files, client.pool.connections_opened
+
+    prs, files, opened = asyncio.run(scenario())
+    assert [pr["number"] for pr in prs] == [1, 2, 3, 4, 5]
+    assert files == ["a.py", "b.py"]
+    assert opened == 1
+
+
+def test_semaphore_bounds_in_flight_requests(api):
+    _Handler.delay = 0.05
+
+    async def scenario():
+        async with AsyncGiteaClient(api, concurrency=2, cache=ConditionalResponseCache()) as client:
+            await asyncio.gather(*(client.get_pull_request_reviews("o", "r", n) for n in range(6)))
+
+    asyncio.run(scenario())
+    assert _Handler.peak == 2
+
+
+def test_cycle_deadline_cancels_outstanding_requests(api):
+    _Handler.delay = 0.5
+
+    async def scenario():
+        async with AsyncGiteaClient(api, cache=ConditionalResponseCache()) as client:
+            await run_with_deadline(client.fetch_cycle_snapshot("o", "r"), 0.1)
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scenario())
+    assert time.monotonic() - started < 0.5
+
+
+def test_publish_governance_status_posts_truncated_description(api):
+    async def scenario():
+        async with AsyncGiteaClient(api, headers={"Authorization": "token x"}) as client:
+            await client.publish_governance_status("o", "r", "abc", "pending", "d" * 200)
+
+    asyncio.run(scenario())
+    assert _Handler.posted == [
+        {"state": "pending", "context": "supervisor/governance", "description": "d" * 140}
+    ]
+
+
+@pytest.fixture
+def fake():
+    with FakeGitea(data=generate_dataset(seed=11, pulls=6, issues=12), require_token="fake") as server:
+        yield server
+
+
+def test_issue_helpers_share_one_implementation(fake):
+    sync_issue, async_issue = (
+        fake.data.add_issue(f"claimed {n}", labels=["type:build", "in-progress"])["number"] for n in (1, 2)
+    )
+
+    assert sup.remove_in_progress_label(fake.api_base, "Don", "dev", sync_issue, HEADERS) is True
+    sync_label = sup.ensure_repo_label(fake.api_base, "Don", "dev", "auto-generated", HEADERS)
+
+    async def scenario():
+        async with AsyncGiteaClient(fake.api_base, headers=HEADERS, cache=ConditionalResponseCache()) as client:
+            removed = await client.remove_in_progress_label("Don", "dev", async_issue)
+            label = await client.ensure_repo_label("Don", "dev", "auto-generated")
+            milestones = await client.get_milestones("Don", "dev")
+            return removed, label, milestones
+
+    removed, async_label, milestones = asyncio.run(scenario())
+    assert removed is True
+    assert async_label == sync_label
+    assert milestones == sup.get_milestones(fake.api_base, "Don", "dev", HEADERS)
+    for number in (sync_issue, async_issue):
+        assert "in-progress" not in [label["name"] for label in fake.data.issues[number]["labels"]]
+
+
+def test_cycle_snapshot_matches_sync_reads(fake):
+    snapshot = sup.fetch_cycle_snapshot(fake.api_base, "Don", "dev", HEADERS)
+    assert snapshot["open_prs"] == get_open_pull_requests(
+        fake.api_base, "Don", "dev", headers=HEADERS, target_branches=sup.PR_GATE_TARGET_BRANCHES
+    )
+    assert snapshot["open_issues"] == sup.get_open_issues(fake.api_base, "Don", "dev", headers=HEADERS)
+    assert snapshot["milestones"] == sup.get_milestones(fake.api_base, "Don", "dev", HEADERS)
+
+
+def test_cycle_snapshot_past_deadline_fails_closed(fake, monkeypatch):
+    monkeypatch.setenv("PR_GATE_CYCLE_DEADLINE_SECONDS", "0.1")
+    fake.latency = {"milestones": 0.5}
+    started = time.monotonic()
+    with pytest.raises(GiteaClientError):
+        sup.fetch_cycle_snapshot(fake.api_base, "Don", "dev", HEADERS)
+    assert time.monotonic() - started < 0.5
+
+
+@pytest.mark.parametrize("mode", ["drop", "garbage"])
+def test_connection_lost_mid_cycle_fails_closed_after_retries(api, monkeypatch, mode):
+    monkeypatch.setattr(http_client, "_DEFAULT_RETRY_POLICY", RetryPolicy(base_delay_seconds=0))
+    _Handler.broken = [mode] * 10
+    with pytest.raises(GiteaClientError):
+        sup.fetch_cycle_snapshot(api, "o", "r", HEADERS)
+    assert _Handler.milestone_reads >= 3
+
+
+def test_connection_lost_once_is_retried(api, monkeypatch):
+    monkeypatch.setattr(http_client, "_DEFAULT_RETRY_POLICY", RetryPolicy(base_delay_seconds=0))
+    _Handler.broken = ["drop"]
+    snapshot = sup.fetch_cycle_snapshot(api, "o", "r", HEADERS)
+    assert snapshot["milestones"] == [{"id": 1, "title": "Phase 1"}]
+    assert [pr["number"] for pr in snapshot["open_prs"]] == [1, 2, 3, 4, 5]
+
+
+def test_dropped_post_on_reused_connection_is_not_resent(api):
+    async def scenario():
+        pool = AsyncConnectionPool()
+        try:
+            await pool.request("GET", f"{api}/warm")
+            _Handler.broken = ["drop"]
+            with pytest.raises(urllib.error.URLError):
+                await pool.request("POST", f"{api}/statuses", body=b'{"n": 1}')
+        finally:
+            await pool.close()
+
+    asyncio.run(scenario())
+    assert _Handler.posted == [{"n": 1}]
@@ -0,0 +1,107 @@
+import json
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from supervisor.pr_gate.http_client import ConnectionPool, json_request
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers = []
+    posts = []
+    drop_next = False
+
+    def log_message(self, *args):
+        return
+
+    def _send(self, status, payload, extra=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.peers.append(self.client_address)
+        if self.path == "/old":
+            self._send(301, {}, {"Location": "/new"})
+        elif self.path == "/missing":
+            self._send(404, {"message": "not found"})
+        else:
+            self._send(200, {"path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        _Handler.posts.append(json.loads(self.rfile.read(length)))
+        if _Handler.drop_next:
+            # Applied, then the connection is lost before the reply.
+            _Handler.drop_next = False
+            self.close_connection = True
+            return
+        self._send(201, {"ok": True})
+
+
+@pytest.fixture
+def server():
+    _Handler.peers = []
+    _Handler.posts = []
+    _Handler.drop_next = False
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_connection_is_reused_across_requests(server):
+    pool = ConnectionPool()
+    for idx in range(5):
+        response = pool.request("GET", f"{server}/item/{idx}")
+        assert response.status == 200
+    assert pool.connections_opened == 1
+    assert pool.connections_reused == 4
+    assert len(set(_Handler.peers)) == 1
+    pool.close()
+
+
+def test_idle_connections_are_bounded_and_evicted(server):
+    pool = ConnectionPool(max_idle_per_host=0)
+    pool.request("GET", f"{server}/a")
+    pool.request("GET", f"{server}/b")
+    assert pool.connections_opened == 2
+    assert pool.idle_count() == 0
+
+    pool = ConnectionPool(idle_timeout_seconds=-1)
+    pool.request("GET", f"{server}/a")
+    pool.request("GET", f"{server}/b")
+    assert pool.connections_opened == 2
+
+
+def test_redirect_followed_for_get(server):
+    response = ConnectionPool().request("GET", f"{server}/old")
+    assert response.status == 200
+    assert json.loads(response.body) == {"path": "/new"}
+
+
+def test_json_request_error_status_matches_urllib_shape(server):
+    status, parsed, raw, _ = json_request("GET", f"{server}/missing")
+    assert status == 404
+    assert parsed == {"message": "not found"}
+    assert "not found" in raw
+
+
+def test_dropped_post_on_reused_connection_is_not_resent(server):
+    pool = ConnectionPool()
+    pool.request("GET", f"{server}/warm")
+    _Handler.drop_next = True
+    with pytest.raises(urllib.error.URLError):
+        pool.request("POST", f"{server}/statuses", body=b'{"n": 1}', headers={"Content-Type": "application/json"})
+    assert _Handler.posts == [{"n": 1}]
+    assert pool.request("POST", f"{server}/statuses", body=b'{"n": 2}').status == 201
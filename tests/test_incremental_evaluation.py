@@ -0,0 +1,123 @@
+import copy
+import os
+
+from supervisor.pr_gate import evaluator
+from supervisor.pr_gate.compiled_policy import compile_policy
+from supervisor.pr_gate.evaluator import evaluate_pr
+from supervisor.pr_gate.incremental import IncrementalEvaluator
+from supervisor.pr_gate.policy_loader import load_policy
+from supervisor.testing import generate_dataset
+
+
+POLICY_PATH = os.path.abspath("governance/policy/pr-governance.v0.2.yaml")
+
+
+def _policy():
+    policy, policy_hash = load_policy(POLICY_PATH)
+    return compile_policy(policy, policy_hash)
+
+
+def _pr_inputs(seed=3):
+    data = generate_dataset(seed=seed, pulls=4, issues=0)
+    pr = data.pulls[1]
+    return dict(pr, _open_prs=list(data.pulls.values())), {
+        "commits": data.pull_commits[1],
+        "files": [f["filename"] for f in data.pull_files[1]],
+        "reviews": data.pull_reviews[1],
+        "statuses": data.statuses[pr["head"]["sha"]],
+    }
+
+
+def _count_stage_runs(monkeypatch):
+    runs = []
+    stages = []
+    for name, inputs_fn, gates_fn in evaluator.GATE_STAGES:
+        def counted(*args, _name=name, _gates=gates_fn):
+            runs.append(_name)
+            return _gates(*args)
+        stages.append((name, inputs_fn, counted))
+    monkeypatch.setattr(evaluator, "GATE_STAGES", tuple(stages))
+    return runs
+
+
+def test_new_review_reruns_only_approval_stages(monkeypatch):
+    policy = _policy()
+    pr, inputs = _pr_inputs()
+    incremental = IncrementalEvaluator(self_check_every=0)
+    runs = _count_stage_runs(monkeypatch)
+    incremental.evaluate(policy, pr, **inputs)
+    assert len(runs) == len(evaluator.GATE_STAGES)
+
+    runs.clear()
+    inputs["reviews"] = inputs["reviews"] + [
+        {"user": {"login": "reviewer-new", "type": "User"}, "state": "APPROVED", "submitted_at": "2026-01-01T00:00:00Z"}
+    ]
+    result = incremental.evaluate(policy, pr, **inputs)
+    assert runs[0] == "approvals" and set(runs) <= {"approvals", "escalation"}
+    assert result == evaluate_pr(policy, pr, **inputs)
+
+
+def test_status_and_body_changes_rerun_their_gates(monkeypatch):
+    policy = _policy()
+    pr, inputs = _pr_inputs()
+    incremental = IncrementalEvaluator(self_check_every=0)
+    incremental.evaluate(policy, pr, **inputs)
+    runs = _count_stage_runs(monkeypatch)
+
+    inputs["statuses"] = [{"context": "ci/lint", "state": "failure"}] + inputs["statuses"]
+    result = incremental.evaluate(policy, pr, **inputs)
+    assert set(runs) <= {"checks", "escalation"}
+    assert result == evaluate_pr(policy, pr, **inputs)
+
+    runs.clear()
+    pr = dict(pr, body=pr["body"] + "\nLOCK:executor/")
+    result = incremental.evaluate(policy, pr, **inputs)
+    assert runs[0] == "text"
+    assert "approvals" not in runs and "signing" not in runs
+    assert result == evaluate_pr(policy, pr, **inputs)
+
+
+def test_unchanged_inputs_reuse_everything_and_results_are_independent():
+    policy = _policy()
+    pr, inputs = _pr_inputs()
+    incremental = IncrementalEvaluator(self_check_every=0)
+    first = incremental.evaluate(policy, pr, **inputs)
+    expected = copy.deepcopy(first)
+    first["observed"]["approvers"].append("tampered")
+    second = incremental.evaluate(policy, pr, **inputs)
+    assert second == expected
+    assert incremental.stats()["stages_reused"] == len(evaluator.GATE_STAGES)
+
+
+def test_policy_change_drops_recorded_stages():
+    policy, _ = load_policy(POLICY_PATH)
+    pr, inputs = _pr_inputs()
+    incremental = IncrementalEvaluator(self_check_every=0)
+    incremental.evaluate(compile_policy(policy, "a" * 64), pr, **inputs)
+    incremental.evaluate(compile_policy(policy, "b" * 64), pr, **inputs)
+    assert incremental.stats()["stages_reused"] == 0
+
+
+def test_self_check_replaces_a_divergent_result(monkeypatch):
+    policy = _policy()
+    pr, inputs = _pr_inputs()
+    incremental = IncrementalEvaluator(self_check_every=1)
+    incremental.evaluate(policy, pr, **inputs)
+    # Corrupt the recorded checks stage as if a gate's inputs were under-declared.
+    fingerprint, events, facts = incremental._records[1][1]["checks"]
+    incremental._records[1][1]["checks"] = (fingerprint, [("required_status_checks", False, "stale")], facts)
+
+    result = incremental.evaluate(policy, pr, **inputs)
+    assert result == evaluate_pr(policy, pr, **inputs)
+    assert incremental.stats()["self_checks"] == 1
+    assert incremental.stats()["self_check_mismatches"] == 1
+    assert 1 not in incremental._records
+
+
+def test_retain_forgets_closed_prs():
+    policy = _policy()
+    pr, inputs = _pr_inputs()
+    incremental = IncrementalEvaluator()
+    incremental.evaluate(policy, pr, **inputs)
+    incremental.retain([2, 3])
+    assert incremental.stats()["prs"] == 0
@@ -0,0 +1,65 @@
+import json
+
+from supervisor.pr_gate.evaluator import evaluate_pr
+from supervisor.pr_gate.locker import LockIndex
+from supervisor.pr_gate.report import write_lock_index_artifact
+
+
+def _policy():
+    return {
+        "branch_rules": {"patterns": {"feature": {"regex": r"^feature/.+$"}}},
+        "approvals": {"disallow_self_approval": False, "develop": {"min_approvals": 0}},
+        "issue_link": {"required": False, "patterns": []},
+        "pr_template": {"required_sections": [], "reject_placeholders": [], "min_section_length": 0},
+        "high_risk_paths": ["supervisor/"],
+        "locks": {"required_on_high_risk": True, "exclusive": True, "allowed": ["LOCK:supervisor/x"]},
+        "ci": {"required_checks": []},
+        "system_evolution": {"detect_paths": [], "approvals": {}, "ci": {"required_checks": []}},
+        "commit_signing": {"required": False},
+    }
+
+
+def _pr(number, body, title="change"):
+    return {
+        "number": number,
+        "title": title,
+        "body": body,
+        "base": {"ref": "develop"},
+        "head": {"ref": "feature/x"},
+        "user": {"login": "author"},
+    }
+
+
+OPEN_PRS = [
+    _pr(1, "holds LOCK:supervisor/x"),
+    _pr(2, "LOCK:supervisor/x and again LOCK:supervisor/x"),
+    _pr(3, "no lock here", title="LOCK:executor/y"),
+    _pr(4, "nothing"),
+]
+
+
+def test_index_maps_tokens_to_holders():
+    index = LockIndex(OPEN_PRS)
+    assert index.as_dict() == {"LOCK:executor/y": [3], "LOCK:supervisor/x": [1, 2]}
+    assert index.conflicts("LOCK:supervisor/x", 1) == [2]
+    assert index.conflicts("LOCK:missing/", 1) == []
+
+
+def test_evaluator_uses_index_and_matches_open_pr_scan():
+    index = LockIndex(OPEN_PRS)
+    for pr in OPEN_PRS:
+        scanned = dict(pr, _open_prs=OPEN_PRS)
+        indexed = evaluate_pr(_policy(), pr, [], ["supervisor/a.py"], [], [], lock_index=index)
+        assert indexed == evaluate_pr(_policy(), scanned, [], ["supervisor/a.py"], [], [])
+    result = evaluate_pr(_policy(), OPEN_PRS[0], [], ["supervisor/a.py"], [], [], lock_index=index)
+    assert result["observed"]["lock_conflict_prs"] == [2]
+    assert "lock_exclusive" in result["failed_gates"]
+
+
+def test_lock_index_artifact(tmp_path):
+    path = write_lock_index_artifact(LockIndex(OPEN_PRS), "h" * 64, root=str(tmp_path))
+    payload = json.loads(open(path, encoding="utf-8").read())
+    assert payload == {
+        "policy_hash": "h" * 64,
+        "locks": {"LOCK:executor/y": [3], "LOCK:supervisor/x": [1, 2]},
+    }
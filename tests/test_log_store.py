@@ -0,0 +1,114 @@
+import json
+import os
+
+import pytest
+
+import supervisor.supervisor as sup
+from supervisor import log_store
+from supervisor.governance_enforcement import GovernanceEnforcer, GovernanceViolation
+from supervisor.log_store import JsonlLog
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _stamp(second):
+    return f"2026-01-01T00:{second // 60:02d}:{second % 60:02d}Z"
+
+
+def _fill(log, seconds):
+    for second in seconds:
+        log.append({"ts": _stamp(second), "component": "c", "message": f"m{second}"})
+    log.flush()
+
+
+def test_size_rotation_compresses_and_indexes_segments(tmp_path):
+    path = tmp_path / "pr-gate.log"
+    log = JsonlLog(str(path), max_bytes=200, max_age_seconds=None)
+    _fill(log, range(20))
+    log.wait_for_compression()
+
+    segments = log.segments()
+    rotated = [entry for entry in segments if not entry.get("active")]
+    assert len(rotated) >= 3
+    assert all(entry["compressed"] for entry in rotated)
+    assert all(os.path.exists(tmp_path / f"{entry['file']}.gz") for entry in rotated)
+    assert not any(os.path.exists(tmp_path / entry["file"]) for entry in rotated)
+    assert sum(entry["records"] for entry in segments) == 20
+    assert [record["message"] for record in log.read()] == [f"m{second}" for second in range(20)]
+
+    index = json.loads((tmp_path / "pr-gate.log.index.json").read_text())
+    assert [entry["file"] for entry in index["segments"]] == [entry["file"] for entry in rotated]
+    assert rotated[0]["first_ts"] == _stamp(0)
+
+
+def test_age_rotation(tmp_path):
+    clock = _Clock(1767225600)  # 2026-01-01T00:00:00Z
+    log = JsonlLog(str(tmp_path / "cycle.log"), max_bytes=None, max_age_seconds=30, compress=False, clock=clock)
+    _fill(log, [0, 10])
+    clock.now += 40
+    _fill(log, [40])
+    segments = log.segments()
+    assert [(entry["first_ts"], entry["last_ts"]) for entry in segments] == [
+        (_stamp(0), _stamp(10)),
+        (_stamp(40), _stamp(40)),
+    ]
+
+
+def test_window_lookup_opens_only_overlapping_segments(tmp_path, monkeypatch):
+    log = JsonlLog(str(tmp_path / "pr-gate.log"), max_bytes=150, max_age_seconds=None)
+    _fill(log, range(0, 60, 2))
+    log.wait_for_compression()
+    opened = []
+    real_open = log_store._open_segment
+    monkeypatch.setattr(log_store, "_open_segment", lambda path: opened.append(path) or real_open(path))
+
+    found = [record["message"] for record in log.read(start=_stamp(20), end=_stamp(24))]
+    assert found == ["m20", "m22", "m24"]
+    assert len(opened) < len(log.segments()) - 1
+
+
+def test_unindexed_segment_is_recovered_and_compressed(tmp_path):
+    path = tmp_path / "pr-gate.log"
+    (tmp_path / "pr-gate.log.000001").write_text(
+        json.dumps({"ts": _stamp(5), "message": "orphan"}) + "\n", encoding="utf-8"
+    )
+    log = JsonlLog(str(path))
+    _fill(log, [9])
+    log.wait_for_compression()
+    first = log.segments()[0]
+    assert (first["file"], first["first_ts"], first["compressed"]) == ("pr-gate.log.000001", _stamp(5), True)
+    assert [record["message"] for record in log.read()] == ["orphan", "m9"]
+
+
+def test_keep_segments_drops_oldest(tmp_path):
+    log = JsonlLog(str(tmp_path / "pr-gate.log"), max_bytes=100, max_age_seconds=None, keep_segments=2)
+    _fill(log, range(20))
+    log.wait_for_compression()
+    rotated = [entry for entry in log.segments() if not entry.get("active")]
+    assert len(rotated) == 2
+    assert len([name for name in os.listdir(tmp_path) if name.startswith("pr-gate.log.0")]) == 2
+
+
+def test_execution_and_violation_logs_are_jsonl(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sup._append_execution_log({"issue": 7, "result": "success"})
+    (tmp_path / "governance.md").write_text("# Contract\n", encoding="utf-8")
+    enforcer = GovernanceEnforcer(
+        governance_path=str(tmp_path / "governance.md"),
+        environment_path=str(tmp_path / "missing.json"),
+        violation_log_path=str(tmp_path / "logs" / "governance_violations.log"),
+    )
+    with pytest.raises(GovernanceViolation):
+        enforcer.load_context()
+
+    execution = log_store.get_log("logs/execution_cycle.log")
+    (record,) = list(execution.read())
+    assert record["issue"] == 7 and record["ts"].endswith("Z")
+    (violation,) = list(log_store.get_log("logs/governance_violations.log").read())
+    assert violation["rule"] == "context_loading" and "ts" not in violation
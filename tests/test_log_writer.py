@@ -0,0 +1,140 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from supervisor.pr_gate import logger
+from supervisor.pr_gate.logger import LogWriter, flush_log, log_event
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _reference_sanitize(text):
+    value = str(text)
+    value = re.sub(r"(?i)authorization\s*[:=]\s*[^\s,;]+", "Authorization=[REDACTED]", value)
+    value = re.sub(r"(?i)\b(token|bearer)\s+[A-Za-z0-9._\-]+", r"\1 [REDACTED]", value)
+    value = re.sub(r"\s+", " ", value).strip()
+    return value
+
+
+@pytest.fixture
+def log_path(tmp_path, monkeypatch):
+    path = tmp_path / "logs" / "pr-gate.log"
+    monkeypatch.setenv("PR_GATE_LOG_PATH", str(path))
+    return path
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Authorization: token abc123 next",
+        "authorization=Bearer xyz,rest",
+        "TOKEN deadbeef and bearer a.b-c_d",
+        "  multi\n\tline   text  ",
+        "Authorization:   secret;tail",
+        42,
+    ],
+)
+def test_sanitizer_matches_previous_behavior(text):
+    assert logger._sanitize(text) == _reference_sanitize(text)
+
+
+def test_lines_are_written_in_call_order_with_redaction(log_path):
+    for index in range(200):
+        log_event("order", f"line={index} token secret{index}")
+    flush_log()
+    records = _records(log_path)
+    assert [record["message"] for record in records] == [
+        f"line={index} token [REDACTED]" for index in range(200)
+    ]
+    assert {record["component"] for record in records} == {"order"}
+
+
+def test_each_thread_keeps_its_own_order(tmp_path):
+    path = str(tmp_path / "threads.log")
+    writer = LogWriter(flush_interval=0.01, flush_bytes=128)
+
+    def emit(name):
+        for index in range(100):
+            writer.write(path, "T", name, f"{index}")
+
+    threads = [threading.Thread(target=emit, args=(f"t{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+    records = _records(path)
+    assert len(records) == 400
+    for n in range(4):
+        mine = [int(record["message"]) for record in records if record["component"] == f"t{n}"]
+        assert mine == list(range(100))
+
+
+def test_fsync_policies(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    path = str(tmp_path / "sync.log")
+
+    writer = LogWriter(fsync="never")
+    writer.write(path, "T", "c", "m")
+    writer.close()
+    assert synced == []
+
+    writer = LogWriter(fsync="always")
+    for _ in range(3):
+        writer.write(path, "T", "c", "m")
+    writer.flush()
+    assert len(synced) >= 3
+    writer.close()
+
+    with pytest.raises(ValueError):
+        LogWriter(fsync="sometimes")
+
+
+def test_replaced_file_is_reopened(tmp_path):
+    path = tmp_path / "rotate.log"
+    writer = LogWriter()
+    writer.write(str(path), "T", "c", "before")
+    writer.flush()
+    os.replace(path, tmp_path / "rotate.log.1")
+    writer.flush()
+    writer.write(str(path), "T", "c", "after")
+    writer.close()
+    assert [record["message"] for record in _records(path)] == ["after"]
+    assert [record["message"] for record in _records(tmp_path / "rotate.log.1")] == ["before"]
+
+
+def test_sync_mode_writes_immediately(log_path, monkeypatch):
+    logger.shutdown_log_writer()
+    monkeypatch.setenv("PR_GATE_LOG_SYNC", "1")
+    try:
+        log_event("sync", "now")
+        assert _records(log_path)[-1]["message"] == "now"
+    finally:
+        monkeypatch.delenv("PR_GATE_LOG_SYNC")
+        logger.shutdown_log_writer()
+
+
+def test_pending_lines_are_flushed_at_exit(log_path):
+    code = (
+        "from supervisor.pr_gate.logger import log_event\n"
+        "for i in range(500):\n"
+        "    log_event('exit', f'line={i}')\n"
+    )
+    env = dict(os.environ, PR_GATE_LOG_FLUSH_INTERVAL="60", PYTHONPATH=REPO_ROOT)
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+    records = _records(log_path)
+    assert len(records) == 500
+    assert records[-1]["message"] == "line=499"
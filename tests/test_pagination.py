@@ -0,0 +1,95 @@
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from supervisor.pr_gate.gitea_client import (
+    GiteaClientError,
+    get_open_pull_requests,
+    get_pull_request_files,
+    iter_paginated,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    items = []
+    mode = "link"
+    requests = []
+
+    def log_message(self, *args):
+        return
+
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        _Handler.requests.append(self.path)
+        if parts.path.endswith("/broken"):
+            body = b'{"message": "boom"}'
+            self.send_response(500)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        page = int(query.get("page", "1"))
+        limit = min(int(query.get("limit", "50")), 3)
+        chunk = _Handler.items[(page - 1) * limit:page * limit]
+        body = json.dumps(chunk).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if _Handler.mode == "link":
+            links = []
+            if page * limit < len(_Handler.items):
+                links.append(f'<{parts.path}?page={page + 1}&limit={limit}>; rel="next"')
+            links.append(f'<{parts.path}?page=1&limit={limit}>; rel="first"')
+            self.send_header("Link", ",".join(links))
+        elif _Handler.mode == "total":
+            self.send_header("X-Total-Count", str(len(_Handler.items)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def api():
+    _Handler.requests = []
+    _Handler.mode = "link"
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/api/v1"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_follows_link_header_across_pages(api):
+    _Handler.items = [
+        {"number": n, "base": {"ref": "develop" if n % 2 else "feature"}} for n in range(10, 0, -1)
+    ]
+    prs = get_open_pull_requests(api, "o", "r")
+    assert [pr["number"] for pr in prs] == [1, 3, 5, 7, 9]
+    assert len(_Handler.requests) == 4
+
+
+def test_server_capped_limit_does_not_truncate_with_total_count(api):
+    _Handler.mode = "total"
+    _Handler.items = [{"filename": f"f{n}.py"} for n in range(7)]
+    files = get_pull_request_files(api, "o", "r", 1)
+    assert files == [f"f{n}.py" for n in range(7)]
+
+
+def test_early_exit_skips_remaining_pages(api):
+    _Handler.items = [{"number": n} for n in range(9)]
+    for item in iter_paginated(f"{api}/repos/o/r/issues?state=open", "issues"):
+        if item["number"] == 1:
+            break
+    assert len(_Handler.requests) == 1
+    assert "state=open" in _Handler.requests[0]
+
+
+def test_error_page_raises_client_error(api):
+    with pytest.raises(GiteaClientError):
+        list(iter_paginated(f"{api}/repos/o/r/broken", "broken"))
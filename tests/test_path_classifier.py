@@ -0,0 +1,50 @@
+import random
+
+from supervisor.pr_gate.path_classifier import PathPrefixClassifier, observed_path_classes
+
+
+def _first_prefix(path, prefixes):
+    for prefix in prefixes:
+        if path.startswith(prefix):
+            return prefix
+    return None
+
+
+def test_matches_nested_startswith_loops():
+    rng = random.Random(5)
+    alphabet = "ab/"
+    classes = {
+        "high_risk": ["a/", "a/b/", "b", "ab/a", "a/"],
+        "system_evolution": ["a/b/", "a", "bb/"],
+        "empty": [],
+    }
+    classifier = PathPrefixClassifier(classes)
+    for _ in range(2000):
+        path = "".join(rng.choice(alphabet) for _ in range(rng.randrange(0, 8)))
+        expected = {}
+        for class_name, prefixes in classes.items():
+            prefix = _first_prefix(path, prefixes)
+            if prefix is not None:
+                expected[class_name] = prefix
+        assert classifier.classify(path) == expected
+
+
+def test_empty_prefix_matches_everything():
+    classifier = PathPrefixClassifier({"all": ["x/", ""], "x": ["x/"]})
+    assert classifier.classify("x/y") == {"all": "x/", "x": "x/"}
+    assert classifier.classify("z") == {"all": ""}
+
+
+def test_per_class_hits_and_observed_summary():
+    classifier = PathPrefixClassifier({"high_risk": ["supervisor/", "governance/"], "system_evolution": ["governance/policy/"]})
+    hits = classifier.classify_all(["docs/a.md", "supervisor/b.py", "governance/policy/p.yaml"])
+    assert hits == {
+        "high_risk": [("supervisor/b.py", "supervisor/"), ("governance/policy/p.yaml", "governance/")],
+        "system_evolution": [("governance/policy/p.yaml", "governance/policy/")],
+    }
+    summary = observed_path_classes(hits, limit=1)
+    assert summary["high_risk"] == {
+        "count": 2,
+        "prefixes": ["governance/", "supervisor/"],
+        "paths": ["governance/policy/p.yaml"],
+    }
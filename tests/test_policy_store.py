@@ -0,0 +1,99 @@
+import os
+
+import pytest
+import yaml
+
+from supervisor.pr_gate import policy_loader
+from supervisor.pr_gate.policy_loader import PolicyLoadError, PolicyStore, load_policy, read_policy
+from supervisor.supervisor import enforce_policy_hash_lockdown
+
+
+BASE = [
+    'version: "v0.2"',
+    "branch_rules: {}",
+    "approvals: {}",
+    "high_risk_paths: []",
+    "commit_signing: {required: false}",
+]
+OLD_MTIME_NS = 1_600_000_000 * 10**9
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _write(path, checks="ci: {required_checks: []}", mtime_ns=OLD_MTIME_NS):
+    path.write_text("\n".join(BASE + [checks]) + "\n", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_is_read_once(tmp_path):
+    policy_file = tmp_path / "policy.yaml"
+    _write(policy_file)
+    store = PolicyStore(policy_file, rehash_seconds=60, clock=_Clock())
+    first = store.load()
+    assert store.load()[0] is first[0]
+    assert store.reads == 1
+    assert first == read_policy(policy_file)
+
+
+def test_stat_change_reloads_and_lockdown_fails_closed(tmp_path, monkeypatch):
+    policy_file = tmp_path / "policy.yaml"
+    _write(policy_file)
+    monkeypatch.setenv("PR_GATE_POLICY_PATH", str(policy_file))
+    _, baseline = load_policy(str(policy_file))
+    assert enforce_policy_hash_lockdown(baseline) == baseline
+
+    _write(policy_file, "ci: {required_checks: [lint]}", mtime_ns=OLD_MTIME_NS + 1)
+    with pytest.raises(RuntimeError, match="POLICY_LOCKDOWN"):
+        enforce_policy_hash_lockdown(baseline)
+
+
+def test_same_stat_edit_is_caught_by_periodic_rehash(tmp_path):
+    policy_file = tmp_path / "policy.yaml"
+    _write(policy_file, "ci: {required_checks: [aaaa]}")
+    clock = _Clock()
+    store = PolicyStore(policy_file, rehash_seconds=60, clock=clock)
+    _, original = store.load()
+
+    _write(policy_file, "ci: {required_checks: [bbbb]}")  # same size, inode and mtime
+    assert store.load()[1] == original
+    clock.now = 61
+    policy, changed = store.load()
+    assert changed != original
+    assert policy["ci"]["required_checks"] == ["bbbb"]
+
+
+def test_recently_modified_file_is_not_trusted(tmp_path):
+    policy_file = tmp_path / "policy.yaml"
+    policy_file.write_text("\n".join(BASE + ["ci: {}"]) + "\n", encoding="utf-8")
+    store = PolicyStore(policy_file, rehash_seconds=None, clock=_Clock())
+    store.load()
+    store.load()
+    assert store.reads == 2
+
+
+def test_errors_are_never_cached(tmp_path):
+    policy_file = tmp_path / "policy.yaml"
+    store = PolicyStore(policy_file, clock=_Clock())
+    for _ in range(2):
+        with pytest.raises(PolicyLoadError):
+            store.load()
+
+    _write(policy_file)
+    _, good = store.load()
+    policy_file.write_text("version: v0.2\n", encoding="utf-8")
+    with pytest.raises(PolicyLoadError):
+        store.load()
+    with pytest.raises(PolicyLoadError):
+        store.load()
+    _write(policy_file, mtime_ns=OLD_MTIME_NS + 5)
+    assert store.load()[1] == good
+
+
+def test_uses_c_loader_when_available():
+    assert policy_loader._YAML_LOADER is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
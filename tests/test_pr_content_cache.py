@@ -0,0 +1,114 @@
+import os
+
+from supervisor.pr_gate.content_cache import PrContentCache, content_cache_from_env, pr_content_key
+from supervisor.pr_gate.locker import EvaluationCache
+from supervisor.pr_gate.policy_loader import load_policy
+from supervisor.supervisor import run_pr_governance_gate
+from supervisor.testing import FakeGitea, generate_dataset
+
+
+POLICY_PATH = os.path.abspath("governance/policy/pr-governance.v0.2.yaml")
+HEADERS = {"Authorization": "token fake", "Accept": "application/json"}
+KEY = ("o/r", "a" * 40, "b" * 40)
+
+
+class _Enforcer:
+    def enforce_pr_gate_result(self, pr_number, result):
+        return None
+
+
+def test_key_uses_head_and_merge_base():
+    pr = {"head": {"sha": "h1"}, "merge_base": "m1"}
+    assert pr_content_key("o", "r", pr) == ("o/r", "h1", "m1")
+    assert pr_content_key("o", "r", {"head": {"sha": "h1"}}) == ("o/r", "h1", "")
+
+
+def test_memory_tier_spills_to_disk_and_survives_restart(tmp_path):
+    cache = PrContentCache(directory=str(tmp_path), memory_entries=1)
+    cache.put(KEY, "files", ["a.py", "b.py"])
+    cache.put(("o/r", "c" * 40, ""), "files", ["c.py"])
+    assert cache.stats()["memory_entries"] == 1
+
+    assert cache.get(KEY, "files") == ["a.py", "b.py"]
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.get(("o/r", "c" * 40, ""), "files") == ["c.py"]
+
+    restarted = PrContentCache(directory=str(tmp_path))
+    assert restarted.get(KEY, "files") == ["a.py", "b.py"]
+    assert restarted.get(KEY, "commits") is None
+
+
+def test_values_are_copies_and_headless_keys_are_not_cached(tmp_path):
+    cache = PrContentCache(directory=str(tmp_path))
+    cache.get_or_fetch(KEY, "files", lambda: ["a.py"]).append("tampered")
+    assert cache.get(KEY, "files") == ["a.py"]
+
+    calls = []
+    for _ in range(2):
+        cache.get_or_fetch(("o/r", "", ""), "files", lambda: calls.append(1) or [])
+    assert len(calls) == 2
+
+
+def test_empty_results_are_never_cached(tmp_path):
+    cache = PrContentCache(directory=str(tmp_path))
+    results = [[], [{"sha": "c1"}]]
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return results[len(fetches) - 1]
+
+    assert cache.get_or_fetch(KEY, "commits", fetch) == []
+    assert os.listdir(tmp_path) == []
+    assert cache.get_or_fetch(KEY, "commits", fetch) == [{"sha": "c1"}]
+    assert cache.get_or_fetch(KEY, "commits", fetch) == [{"sha": "c1"}]
+    assert len(fetches) == 2
+    assert PrContentCache(directory=str(tmp_path)).get(KEY, "commits") == [{"sha": "c1"}]
+
+
+def test_retain_evicts_moved_heads_and_closed_prs(tmp_path):
+    cache = PrContentCache(directory=str(tmp_path))
+    moved = ("o/r", "d" * 40, "")
+    cache.put(KEY, "files", ["a.py"])
+    cache.put(moved, "commits", [{"sha": "d" * 40}])
+    assert cache.retain([KEY]) == 1
+    assert cache.get(moved, "commits") is None
+    assert cache.get(KEY, "files") == ["a.py"]
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_unreadable_spill_file_is_a_miss(tmp_path):
+    cache = PrContentCache(directory=str(tmp_path))
+    cache.put(KEY, "files", ["a.py"])
+    for name in os.listdir(tmp_path):
+        (tmp_path / name).write_bytes(b"not gzip")
+    assert PrContentCache(directory=str(tmp_path)).get(KEY, "files") is None
+
+
+def test_env_configuration(monkeypatch, tmp_path):
+    monkeypatch.setenv("PR_GATE_CONTENT_CACHE_DIR", str(tmp_path))
+    assert content_cache_from_env().directory == str(tmp_path)
+    monkeypatch.setenv("PR_GATE_CONTENT_CACHE_DIR", "")
+    assert content_cache_from_env().directory is None
+    monkeypatch.setenv("PR_GATE_CONTENT_CACHE", "0")
+    assert content_cache_from_env() is None
+
+
+def test_reevaluation_fetches_only_reviews_and_statuses(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PR_GATE_POLICY_PATH", POLICY_PATH)
+    _, policy_hash = load_policy(POLICY_PATH)
+    cache = PrContentCache(directory=str(tmp_path / "content"))
+
+    with FakeGitea(data=generate_dataset(seed=5, pulls=6, issues=0), require_token="fake") as fake:
+        pulls = len(fake.data.pulls)
+        for _ in range(2):
+            # A fresh verdict cache forces every PR to be re-evaluated.
+            run_pr_governance_gate(
+                fake.api_base, "Don", "dev", HEADERS, EvaluationCache(), _Enforcer(), policy_hash,
+                content_cache=cache,
+            )
+        assert fake.request_counts["pull.files"] == pulls
+        assert fake.request_counts["pull.commits"] == pulls
+        assert fake.request_counts["pull.reviews"] == 2 * pulls
+        assert fake.request_counts["commit.statuses"] == 2 * pulls
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+import supervisor.supervisor as sup
+from supervisor.pr_gate.gitea_client import GiteaClientError
+from supervisor.pr_gate.locker import EvaluationCache
+
+
+class _Enforcer:
+    def enforce_pr_gate_result(self, pr_number, result):
+        return None
+
+
+def _pr(number):
+    return {
+        "number": number,
+        "title": f"pr {number}",
+        "body": "",
+        "base": {"ref": "develop"},
+        "head": {"ref": "feature/x", "sha": f"sha{number}"},
+        "user": {"login": "author"},
+    }
+
+
+@pytest.fixture
+def gate(monkeypatch):
+    state = {"active": 0, "peak": 0, "published": [], "fail_files_for": None}
+    lock = threading.Lock()
+
+    def slow(value):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return value
+
+    def files(api_base, owner, repo, pr_number, headers=None):
+        if pr_number == state["fail_files_for"]:
+            raise GiteaClientError(f"files failed for {pr_number}")
+        return slow([])
+
+    monkeypatch.setattr(sup, "load_policy", lambda path: ({"ci": {}}, "h" * 64))
+    monkeypatch.setattr(
+        sup, "get_open_pull_requests", lambda *a, **k: [_pr(n) for n in range(1, 7)]
+    )
+    monkeypatch.setattr(
+        sup,
+        "get_pull_request_commits",
+        lambda api_base, owner, repo, pr_number, head_sha, headers=None: slow([{"sha": head_sha}]),
+    )
+    monkeypatch.setattr(sup, "get_pull_request_files", files)
+    monkeypatch.setattr(sup, "get_pull_request_reviews", lambda *a, **k: slow([]))
+    monkeypatch.setattr(sup, "get_commit_statuses", lambda *a, **k: slow([]))
+    monkeypatch.setattr(
+        sup,
+        "publish_governance_status",
+        lambda **kwargs: state["published"].append((kwargs["sha"], kwargs["state"])),
+    )
+    monkeypatch.setattr(
+        sup,
+        "write_gate_artifact",
+        lambda pr_number, head_sha, policy_hash, result: None,
+    )
+    monkeypatch.setattr(sup, "write_lock_index_artifact", lambda lock_index, policy_hash: None)
+    monkeypatch.setattr(sup, "prefetch_pull_request_heads", lambda head_shas: True)
+
+    def run(concurrency):
+        sup.run_pr_governance_gate(
+            api_base="http://gitea.invalid/api/v1",
+            owner="o",
+            repo="r",
+            headers={},
+            pr_eval_cache=EvaluationCache(),
+            enforcer=_Enforcer(),
+            policy_hash_baseline="h" * 64,
+            fetch_concurrency=concurrency,
+        )
+
+    state["run"] = run
+    return state
+
+
+def test_fetches_overlap_within_concurrency_limit(gate, capsys):
+    started = time.monotonic()
+    gate["run"](3)
+    elapsed = time.monotonic() - started
+
+    assert gate["peak"] <= 3
+    assert gate["peak"] > 1
+    assert elapsed < 6 * 4 * 0.05
+    reports = [line for line in capsys.readouterr().out.splitlines() if line.startswith("PR_GATE_REPORT")]
+    assert [f'"pr_number": {n}' in line for n, line in zip(range(1, 7), reports)] == [True] * 6
+
+
+def test_output_order_matches_sequential_run(gate, capsys):
+    gate["run"](1)
+    sequential = capsys.readouterr().out
+    sequential_published = list(gate["published"])
+    gate["published"].clear()
+
+    gate["run"](8)
+    assert capsys.readouterr().out == sequential
+    assert gate["published"] == sequential_published
+
+
+def test_fetch_error_surfaces_at_its_pr_position(gate, capsys):
+    gate["fail_files_for"] = 3
+    with pytest.raises(GiteaClientError):
+        gate["run"](8)
+    reports = [line for line in capsys.readouterr().out.splitlines() if line.startswith("PR_GATE_REPORT")]
+    assert len(reports) == 2
+    assert gate["published"][-1] == ("sha3", "pending")
@@ -0,0 +1,75 @@
+import subprocess
+
+import pytest
+
+from supervisor.pr_gate import gitea_client
+from supervisor.pr_gate.signature_verifier import BatchSignatureVerifier
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-c", "user.email=d@e", "-c", "user.name=d", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def clone(tmp_path, monkeypatch):
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q")
+    _git(origin, "commit", "-q", "--allow-empty", "-m", "base")
+    heads = {}
+    for number in (1, 2, 3):
+        _git(origin, "commit", "-q", "--allow-empty", "-m", f"pr {number}")
+        heads[number] = _git(origin, "rev-parse", "HEAD")
+        _git(origin, "update-ref", f"refs/pull/{number}/head", heads[number])
+        _git(origin, "reset", "-q", "--hard", "HEAD~1")
+    local = tmp_path / "local"
+    _git(tmp_path, "clone", "-q", "--no-local", str(origin), str(local))
+
+    verifier = BatchSignatureVerifier(cwd=str(local))
+    monkeypatch.setattr(gitea_client, "get_signature_verifier", lambda: verifier)
+    monkeypatch.chdir(local)
+    yield local, heads
+    verifier.close()
+
+
+def _count_fetches(monkeypatch):
+    fetches = []
+    real_run = subprocess.run
+
+    def run(cmd, *args, **kwargs):
+        if cmd[:2] == ["git", "fetch"]:
+            fetches.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(gitea_client.subprocess, "run", run)
+    return fetches
+
+
+def test_one_bulk_fetch_brings_all_pr_heads(clone, monkeypatch):
+    local, heads = clone
+    fetches = _count_fetches(monkeypatch)
+
+    assert gitea_client.prefetch_pull_request_heads(list(heads.values())) is True
+    assert len(fetches) == 1
+    for number, sha in heads.items():
+        assert _git(local, "rev-parse", f"refs/pull/{number}/head") == sha
+
+    # Heads are now local: neither the bulk nor the per-PR fetch touches the remote.
+    assert gitea_client.prefetch_pull_request_heads(list(heads.values())) is True
+    for number, sha in heads.items():
+        assert gitea_client._fetch_pr_ref(number, sha) is True
+    assert len(fetches) == 1
+
+
+def test_per_pr_fetch_still_runs_for_missing_head(clone, monkeypatch):
+    local, heads = clone
+    fetches = _count_fetches(monkeypatch)
+    assert gitea_client._fetch_pr_ref(2, heads[2]) is True
+    assert len(fetches) == 1
+    assert _git(local, "cat-file", "-t", heads[2]) == "commit"
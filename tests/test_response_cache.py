@@ -0,0 +1,85 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from supervisor.pr_gate.http_client import json_request
+from supervisor.pr_gate.response_cache import ConditionalResponseCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    version = 1
+    statuses = []
+
+    def log_message(self, *args):
+        return
+
+    def do_GET(self):
+        etag = f'"v{_Handler.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            _Handler.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps([{"version": _Handler.version, "path": self.path}]).encode("utf-8")
+        _Handler.statuses.append(200)
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _Handler.version = 1
+    _Handler.statuses = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_not_modified_returns_cached_payload(server):
+    cache = ConditionalResponseCache()
+    first = json_request("GET", f"{server}/issues", cache=cache)
+    second = json_request("GET", f"{server}/issues", cache=cache)
+    assert first[0] == second[0] == 200
+    assert second[1] is first[1]
+    assert _Handler.statuses == [200, 304]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_changed_resource_is_refetched(server):
+    cache = ConditionalResponseCache()
+    json_request("GET", f"{server}/issues", cache=cache)
+    _Handler.version = 2
+    status, parsed, _, _ = json_request("GET", f"{server}/issues", cache=cache)
+    assert status == 200
+    assert parsed[0]["version"] == 2
+    assert _Handler.statuses == [200, 200]
+
+
+def test_credentials_are_part_of_the_cache_key(server):
+    cache = ConditionalResponseCache()
+    json_request("GET", f"{server}/issues", headers={"Authorization": "token a"}, cache=cache)
+    json_request("GET", f"{server}/issues", headers={"Authorization": "token b"}, cache=cache)
+    assert _Handler.statuses == [200, 200]
+
+
+def test_lru_eviction_is_bounded(server):
+    cache = ConditionalResponseCache(max_entries=2)
+    for name in ("a", "b", "a", "c"):
+        json_request("GET", f"{server}/{name}", cache=cache)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    json_request("GET", f"{server}/a", cache=cache)
+    assert _Handler.statuses[-1] == 304
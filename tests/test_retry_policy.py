@@ -0,0 +1,173 @@
+import asyncio
+import random
+import urllib.error
+from email.message import Message
+
+import pytest
+
+from supervisor.pr_gate.http_client import HttpResponse
+from supervisor.pr_gate.retry_policy import (
+    CircuitOpenError,
+    RetryPolicy,
+    endpoint_key,
+    retry_after_seconds,
+)
+
+
+URL = "http://gitea.local/api/v1/repos/Don/dev/pulls/7/files?page=1"
+
+
+def _response(status, **headers):
+    message = Message()
+    for key, value in headers.items():
+        message[key.replace("_", "-")] = value
+    return HttpResponse(status, "", message, b"{}", URL)
+
+
+def _sender(*outcomes):
+    calls = []
+
+    def send():
+        calls.append(len(calls))
+        outcome = outcomes[min(len(calls) - 1, len(outcomes) - 1)]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send, calls
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _policy(**kwargs):
+    sleeps = []
+    policy = RetryPolicy(rng=random.Random(0), sleep=sleeps.append, **kwargs)
+    return policy, sleeps
+
+
+def test_get_retried_with_bounded_jittered_backoff():
+    policy, sleeps = _policy(base_delay_seconds=1.0, max_delay_seconds=1.5)
+    send, calls = _sender(_response(502), _response(503), _response(200))
+    assert policy.call("GET", URL, send).status == 200
+    assert len(calls) == 3
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 1.5
+    assert policy.stats()["retries"] == 2
+
+
+def test_attempts_exhausted_returns_last_response_and_reraises_errors():
+    policy, _ = _policy()
+    send, calls = _sender(_response(502))
+    assert policy.call("GET", URL, send).status == 502
+    assert len(calls) == 3
+
+    send, calls = _sender(urllib.error.URLError("timed out"))
+    with pytest.raises(urllib.error.URLError):
+        policy.call("GET", URL.replace("files", "reviews"), send)
+    assert len(calls) == 3
+
+
+def test_non_idempotent_requests_are_not_retried():
+    policy, sleeps = _policy()
+    send, calls = _sender(_response(502), _response(201))
+    assert policy.call("POST", URL, send).status == 502
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_retry_after_is_honored_and_capped():
+    policy, sleeps = _policy(max_retry_after_seconds=10)
+    send, _ = _sender(_response(429, Retry_After="2"), _response(200))
+    assert policy.call("GET", URL, send).status == 200
+    assert sleeps == [2.0]
+
+    send, calls = _sender(_response(429, Retry_After="120"), _response(200))
+    assert policy.call("GET", URL, send).status == 429
+    assert len(calls) == 1
+
+
+def test_rate_limit_reset_headers():
+    headers = _response(403, X_RateLimit_Remaining="0", X_RateLimit_Reset="1700000030").headers
+    assert retry_after_seconds(headers, now=1_700_000_000) == 30
+    assert retry_after_seconds(_response(200).headers) is None
+
+
+def test_breaker_trips_fails_fast_and_recovers_through_half_open_probe():
+    clock = _Clock()
+    policy, _ = _policy(max_attempts=1, failure_threshold=2, reset_seconds=30, clock=clock)
+    failing, calls = _sender(_response(503))
+    policy.call("GET", URL, failing)
+    policy.call("GET", URL.replace("/7/", "/8/"), failing)
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        policy.call("GET", URL, failing)
+    assert len(calls) == 2
+    assert policy.stats()["open"] == [endpoint_key("GET", URL)]
+
+    # Other endpoints are unaffected by the open breaker.
+    healthy, _ = _sender(_response(200))
+    assert policy.call("GET", "http://gitea.local/api/v1/user", healthy).status == 200
+
+    clock.now = 31
+    assert policy.call("GET", URL, healthy).status == 200
+    assert policy.stats()["open"] == []
+    assert policy.stats()["trips"] == 1
+
+
+def test_endpoint_key_collapses_numbers_and_shas():
+    sha = "a" * 40
+    assert endpoint_key("get", f"http://h/api/v1/repos/o/r/commits/{sha}/statuses?page=2") == (
+        "GET h/api/v1/repos/o/r/commits/{sha}/statuses"
+    )
+
+
+def _open_breaker(clock):
+    policy, _ = _policy(max_attempts=1, failure_threshold=1, reset_seconds=30, clock=clock)
+    failing, _ = _sender(_response(503))
+    policy.call("GET", URL, failing)
+    clock.now = 31
+    return policy
+
+
+def test_cancelled_half_open_probe_releases_the_breaker():
+    clock = _Clock()
+    policy = _open_breaker(clock)
+
+    async def cancelled():
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(policy.call_async("GET", URL, cancelled))
+
+    clock.now = 100
+    healthy, calls = _sender(_response(200))
+    assert policy.call("GET", URL, healthy).status == 200
+    assert len(calls) == 1
+    assert policy.stats()["open"] == []
+
+
+def test_foreign_exception_in_probe_releases_the_breaker():
+    clock = _Clock()
+    policy = _open_breaker(clock)
+    broken, _ = _sender(ValueError("bad payload"))
+    with pytest.raises(ValueError):
+        policy.call("GET", URL, broken)
+
+    healthy, _ = _sender(_response(200))
+    assert policy.call("GET", URL, healthy).status == 200
+
+
+def test_stale_in_flight_probe_expires():
+    clock = _Clock()
+    policy = _open_breaker(clock)
+    breaker = policy.breaker(endpoint_key("GET", URL))
+    assert breaker.allow()
+    assert not breaker.allow()
+    clock.now += 30
+    assert breaker.allow()
@@ -0,0 +1,149 @@
+import subprocess
+
+from supervisor.pr_gate.signature_cache import KeyringFingerprint, SignatureCache
+from supervisor.pr_gate.signature_verifier import BatchSignatureVerifier
+
+
+class _Fingerprint:
+    def __init__(self, value="k1"):
+        self.value = value
+
+    def current(self):
+        return self.value
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+GOOD = {
+    "signature_verifiable": True,
+    "signature_verified": True,
+    "signature_source": "local_git",
+    "signature_type": "ssh",
+    "signature_reason": "good_signature",
+}
+MISSING = {
+    "signature_verifiable": False,
+    "signature_verified": False,
+    "signature_source": "local_git",
+    "signature_reason": "commit_not_found",
+}
+
+
+def test_results_persist_across_instances(tmp_path):
+    path = str(tmp_path / "sig.sqlite3")
+    cache = SignatureCache(path=path, fingerprint=_Fingerprint())
+    cache.put_many({"a" * 40: GOOD, "b" * 40: MISSING})
+    cache.close()
+
+    reopened = SignatureCache(path=path, fingerprint=_Fingerprint())
+    assert reopened.get_many(["a" * 40, "b" * 40]) == {"a" * 40: GOOD}
+    assert reopened.stats()["entries"] == 1
+
+
+def test_keyring_change_invalidates_entries(tmp_path):
+    fingerprint = _Fingerprint()
+    cache = SignatureCache(path=str(tmp_path / "sig.sqlite3"), fingerprint=fingerprint)
+    cache.put_many({"a" * 40: GOOD})
+    fingerprint.value = "k2"
+    assert cache.get_many(["a" * 40]) == {}
+    assert cache.stats()["entries"] == 0
+
+
+def test_age_and_size_bounds(tmp_path):
+    clock = _Clock()
+    cache = SignatureCache(
+        path=str(tmp_path / "sig.sqlite3"),
+        fingerprint=_Fingerprint(),
+        max_age_seconds=60,
+        max_entries=2,
+        clock=clock,
+    )
+    for idx in range(3):
+        clock.now += 1
+        cache.put_many({str(idx) * 40: GOOD})
+    assert sorted(cache.get_many([str(idx) * 40 for idx in range(3)])) == ["1" * 40, "2" * 40]
+
+    clock.now += 120
+    assert cache.get_many(["2" * 40]) == {}
+
+
+def test_keyring_fingerprint_follows_allowed_signers_content(tmp_path):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    signers = tmp_path / "allowed_signers"
+    signers.write_text("dev@example.com ssh-ed25519 AAAA1\n")
+    subprocess.run(
+        ["git", "config", "gpg.ssh.allowedSignersFile", str(signers)], cwd=tmp_path, check=True
+    )
+    fingerprint = KeyringFingerprint(cwd=str(tmp_path), gnupg_home=str(tmp_path / "gnupg"))
+    first = fingerprint.current()
+    assert fingerprint.current() == first
+
+    signers.write_text("dev@example.com ssh-ed25519 AAAA2\n")
+    assert fingerprint.current() != first
+
+
+def test_cached_commits_cost_no_subprocesses(tmp_path, monkeypatch):
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.email=d@e", "-c", "user.name=d", "commit", "-q", "--allow-empty", "-m", "x"],
+        cwd=tmp_path,
+        check=True,
+    )
+    sha = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=tmp_path, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    cache = SignatureCache(path=str(tmp_path / "sig.sqlite3"), fingerprint=_Fingerprint())
+    first = BatchSignatureVerifier(cwd=str(tmp_path), cache=cache)
+    expected = first.verify([sha])
+    first.close()
+
+    def _no_subprocess(*args, **kwargs):
+        raise AssertionError("unexpected subprocess")
+
+    monkeypatch.setattr(subprocess, "run", _no_subprocess)
+    monkeypatch.setattr(subprocess, "Popen", _no_subprocess)
+    assert BatchSignatureVerifier(cwd=str(tmp_path), cache=cache).verify([sha]) == expected
+
+
+def test_keyring_fingerprint_follows_included_system_and_env_config(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    system = tmp_path / "system-gitconfig"
+    system.write_text("")
+    monkeypatch.setenv("GIT_CONFIG_SYSTEM", str(system))
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    first_signers = tmp_path / "signers-1"
+    second_signers = tmp_path / "signers-second"
+    first_signers.write_text("dev@example.com ssh-ed25519 AAAA1\n")
+    second_signers.write_text("dev@example.com ssh-ed25519 AAAA2\n")
+    included = tmp_path / "signing.inc"
+    included.write_text(f"[gpg \"ssh\"]\n\tallowedSignersFile = {first_signers}\n")
+    subprocess.run(["git", "config", "include.path", str(included)], cwd=repo, check=True)
+
+    fingerprint = KeyringFingerprint(cwd=str(repo), gnupg_home=str(tmp_path / "gnupg"))
+    base = fingerprint.current()
+    assert fingerprint.current() == base
+
+    # A change in an included file (the repo's own config is untouched).
+    included.write_text(f"[gpg \"ssh\"]\n\tallowedSignersFile = {second_signers}\n")
+    via_include = fingerprint.current()
+    assert via_include != base
+
+    # A GIT_CONFIG_* override from the environment.
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "user.signingkey")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "ABCDEF")
+    via_env = fingerprint.current()
+    assert via_env != via_include
+
+    # The system config.
+    system.write_text("[gpg]\n\tformat = ssh\n")
+    assert fingerprint.current() != via_env
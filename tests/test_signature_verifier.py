@@ -0,0 +1,67 @@
+import shutil
+import subprocess
+
+import pytest
+
+from supervisor.pr_gate.signature_verifier import BatchSignatureVerifier, _local_signature_probe
+
+
+pytestmark = pytest.mark.skipif(shutil.which("ssh-keygen") is None, reason="ssh-keygen required")
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "dev")
+    key = tmp_path / "signing_key"
+    subprocess.run(["ssh-keygen", "-q", "-t", "ed25519", "-N", "", "-f", str(key)], check=True)
+    allowed = tmp_path / "allowed_signers"
+    allowed.write_text(f"dev@example.com {(tmp_path / 'signing_key.pub').read_text()}")
+    _git(tmp_path, "config", "gpg.format", "ssh")
+    _git(tmp_path, "config", "user.signingkey", str(key))
+    _git(tmp_path, "config", "gpg.ssh.allowedSignersFile", str(allowed))
+
+    shas = []
+    for idx, signed in enumerate([False, True, False, True]):
+        (tmp_path / "file.txt").write_text(str(idx))
+        _git(tmp_path, "add", "file.txt")
+        _git(tmp_path, "commit", "-q", "-m", f"commit {idx}", *(["-S"] if signed else []))
+        shas.append(_git(tmp_path, "rev-parse", "HEAD"))
+    return tmp_path, shas
+
+
+def test_batch_matches_per_commit_probe(repo):
+    path, shas = repo
+    requested = shas + ["0" * 40, "", shas[1]]
+    verifier = BatchSignatureVerifier(cwd=str(path))
+    try:
+        results = verifier.verify(requested)
+        again = verifier.verify(shas)
+    finally:
+        verifier.close()
+
+    for sha in requested:
+        assert results[sha] == _local_signature_probe(sha, cwd=str(path))
+    assert results[shas[1]]["signature_verified"] is True
+    assert results[shas[1]]["signature_type"] == "ssh"
+    assert results["0" * 40]["signature_reason"] == "commit_not_found"
+    assert again == {sha: results[sha] for sha in shas}
+    assert verifier.log_invocations == 2
+    assert verifier.fallback_probes == 0
+
+
+def test_ambiguous_batch_output_falls_back_to_single_probes(repo, monkeypatch):
+    path, shas = repo
+    verifier = BatchSignatureVerifier(cwd=str(path))
+    monkeypatch.setattr(verifier, "_log_signatures", lambda commit_ids: None)
+    try:
+        results = verifier.verify(shas)
+    finally:
+        verifier.close()
+    assert verifier.fallback_probes == len(shas)
+    assert results == {sha: _local_signature_probe(sha, cwd=str(path)) for sha in shas}
@@ -0,0 +1,79 @@
+import hashlib
+import hmac
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from supervisor.pr_gate.locker import EvaluationCache
+from supervisor.supervisor import apply_webhook_work
+from supervisor.webhook_intake import WebhookIntake
+
+SECRET = "s3cret"
+
+
+@pytest.fixture
+def intake():
+    listener = WebhookIntake(SECRET).start()
+    yield listener
+    listener.stop()
+
+
+def _send(intake, event, payload, secret=SECRET):
+    body = json.dumps(payload).encode("utf-8")
+    signature = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    host, port = intake.address[:2]
+    req = urllib.request.Request(
+        f"http://{host}:{port}/hooks/gitea",
+        data=body,
+        method="POST",
+        headers={
+            "Content-Type": "application/json",
+            "X-Gitea-Event": event,
+            "X-Gitea-Signature": signature,
+        },
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+
+
+def test_signed_events_feed_the_work_queue(intake):
+    assert _send(intake, "pull_request", {"number": 7, "pull_request": {"number": 7}}) == 202
+    assert _send(intake, "pull_request_review_approved", {"pull_request": {"number": 7}}) == 202
+    assert _send(intake, "status", {"sha": "abc123"}) == 202
+    assert _send(intake, "issues", {"issue": {"number": 3}}) == 202
+
+    assert intake.wait_for_work(1)
+    assert intake.queue.drain() == [("commit", "abc123"), ("issue", 3), ("pr", 7)]
+    assert len(intake.queue) == 0
+
+
+def test_bad_signature_is_rejected(intake):
+    assert _send(intake, "pull_request", {"number": 7}, secret="wrong") == 401
+    assert intake.rejected == 1
+    assert not intake.wait_for_work(0.05)
+
+
+def test_queued_work_invalidates_cached_gate_verdicts(intake):
+    cache = EvaluationCache()
+    cache.mark(7, "head7", "p")
+    cache.mark(8, "abc123", "p")
+    cache.mark(9, "head9", "p")
+    _send(intake, "pull_request_review_approved", {"pull_request": {"number": 7}})
+    _send(intake, "status", {"sha": "abc123"})
+
+    assert intake.wait_for_work(1)
+    apply_webhook_work(intake.queue.drain(), cache)
+
+    assert not cache.seen(7, "head7", "p")
+    assert not cache.seen(8, "abc123", "p")
+    assert cache.seen(9, "head9", "p")
+
+
+def test_intake_requires_secret():
+    with pytest.raises(ValueError):
+        WebhookIntake("")